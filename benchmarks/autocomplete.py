@@ -0,0 +1,63 @@
+"""
+    Measures AutocompleteIndex on a 500k-item catalogue: build time, search latency for typed prefixes without and
+    with the result cache, fuzzy search, and incremental inserts and deletes, against scanning the list of choices.
+
+    Usage: python -m benchmarks.autocomplete [items]
+"""
+import random
+import sys
+import time
+import timeit
+
+from dishookr import AutocompleteIndex, InteractionChoices, Locale
+
+SYLLABLES = [consonant + vowel for consonant in "bcdfghjklmnpqrstvwxz" for vowel in "aeiou"] + ["bar", "dun", "fel", "gor", "hal", "pin", "qua", "wes"]
+
+def catalogue(items: int) -> list:
+    rng = random.Random(0)
+    choices = []
+    for i in range(items):
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))).capitalize() + f" {i}"
+        localizations = {Locale.DE: name + " (de)"} if i % 10 == 0 else None
+        choices.append(InteractionChoices(name, i, localizations))
+    return choices
+
+def scan(choices: list, query: str) -> list:
+    """ What handlers did before: filter the whole list on every keystroke. """
+    query = query.casefold()
+    return [choice for choice in choices if choice.name.casefold().startswith(query)][:25]
+
+def per_call(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    choices = catalogue(items)
+    queries = ["k", "ka", "kalo", "Kalomi", "gorpin", "wesz", "zeze"]
+
+    start = time.perf_counter()
+    index = AutocompleteIndex(choices)
+    print(f"build {items} choices           {time.perf_counter() - start:>10.2f}s")
+    start = time.perf_counter()
+    fuzzy = AutocompleteIndex(choices, fuzzy=True)
+    print(f"build {items} choices, fuzzy    {time.perf_counter() - start:>10.2f}s")
+
+    def uncached(query, locale=None):
+        index._cache.clear()
+        return index.search(query, locale)
+
+    for query in queries:
+        print(f"search {query!r:<10} uncached {per_call(lambda: uncached(query), 2000):8.2f}us"
+              f"  cached {per_call(lambda: index.search(query), 20000):6.2f}us")
+    print(f"search 'kalo' de uncached   {per_call(lambda: uncached('kalo', Locale.DE), 2000):8.2f}us")
+
+    def fuzzy_uncached(query):
+        fuzzy._cache.clear()
+        return fuzzy.search(query)
+    print(f"fuzzy search 'xlomine'      {per_call(lambda: fuzzy_uncached('xlomine'), 20):8.2f}us")
+
+    counter = iter(range(items, items * 2))
+    print(f"add                         {per_call(lambda: index.add(InteractionChoices('Kalo new', next(counter))), 2000):8.2f}us")
+    values = iter(range(items))
+    print(f"remove                      {per_call(lambda: index.remove(next(values)), 2000):8.2f}us")
+    print(f"linear scan 'kalo'          {per_call(lambda: scan(choices, 'kalo'), 3):8.2f}us")
@@ -0,0 +1,117 @@
+"""
+    Measures the interaction endpoint: in-process ASGI requests per second for PINGs, commands and prefix-routed
+    components, the dispatch cost with 500 registered custom IDs against a chain of if statements, the overhead of
+    running handlers with a latency budget in the worker pool, and requests per second over HTTP against a local
+    WSGI server driven by a threaded load generator.
+
+    Usage: python -m benchmarks.interactions [seconds]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler, make_server
+import asyncio
+import http.client
+import sys
+import threading
+import time
+import timeit
+
+from dishookr import InteractionApp, InteractionResponse, InteractionResponseType, InteractionCallbackMessage
+from dishookr.interactions import Interaction
+from dishookr.encoding import dumps, loads
+
+ROUTES = 500
+PING = dumps({"type": 1, "id": "1", "application_id": "2", "token": "t"})
+COMMAND = dumps({"type": 2, "id": "1", "application_id": "2", "token": "t", "data": {"name": "status"}})
+COMPONENT = dumps({"type": 3, "id": "1", "application_id": "2", "token": "t", "data": {"custom_id": "vote:yes:42", "component_type": 2}})
+LAST = dumps({"type": 3, "id": "1", "application_id": "2", "token": "t", "data": {"custom_id": f"button{ROUTES - 1}", "component_type": 2}})
+
+REPLY = InteractionResponse(InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE, InteractionCallbackMessage(content="Done!"))
+
+def build_app() -> InteractionApp:
+    app = InteractionApp()
+    app.command("status")(lambda interaction: REPLY)
+    app.component("vote:", prefix=True)(lambda interaction: REPLY)
+    for i in range(ROUTES):
+        app.component(f"button{i}")(lambda interaction: REPLY)
+    return app
+
+def if_chain(body: bytes) -> bytes:
+    """ The hand-written handler the README used to suggest, grown to the same number of buttons. """
+    interaction = Interaction(loads(body))
+    for i in range(ROUTES):
+        if interaction.type == 3 and interaction.data["custom_id"] == f"button{i}":
+            return dumps(REPLY.to_dict())
+    return dumps({"error": "Invalid interaction type"})
+
+def asgi_rate(app: InteractionApp, body: bytes, seconds: float) -> float:
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": [(b"content-type", b"application/json")]}
+    request = {"type": "http.request", "body": body, "more_body": False}
+
+    async def receive():
+        return request
+
+    async def send(message):
+        pass
+
+    async def run() -> int:
+        count = 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            for _ in range(100):
+                await app(scope, receive, send)
+            count += 100
+        return count
+    return asyncio.run(run()) / seconds
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+def http_rate(app: InteractionApp, body: bytes, seconds: float, clients: int = 8) -> float:
+    server = make_server("127.0.0.1", 0, app.wsgi, server_class=ThreadingWSGIServer, handler_class=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    deadline = time.perf_counter() + seconds
+
+    def client() -> int:
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        count = 0
+        while time.perf_counter() < deadline:
+            connection.request("POST", "/", body, {"Content-Type": "application/json"})
+            connection.getresponse().read()
+            count += 1
+        connection.close()
+        return count
+
+    try:
+        with ThreadPoolExecutor(clients) as executor:
+            total = sum(executor.map(lambda _: client(), range(clients)))
+    finally:
+        server.shutdown()
+        server.server_close()
+    return total / seconds
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    app = build_app()
+
+    for name, body in (("ping", PING), ("command", COMMAND), ("prefix component", COMPONENT)):
+        print(f"asgi {name:<17} {asgi_rate(app, body, seconds):>10.0f} req/s")
+
+    number = 20000
+    routed = min(timeit.repeat(lambda: app.handle(LAST, {}), number=number, repeat=5)) / number
+    chained = min(timeit.repeat(lambda: if_chain(LAST), number=number, repeat=5)) / number
+    print(f"dispatch to the last of {ROUTES} buttons: InteractionApp {routed * 1e6:.2f}us, if chain {chained * 1e6:.2f}us")
+
+    budgeted = InteractionApp(defer_after=2.5)
+    budgeted.command("status")(lambda interaction: REPLY)
+    pooled = min(timeit.repeat(lambda: budgeted.handle(COMMAND, {}), number=number, repeat=5)) / number
+    inline = min(timeit.repeat(lambda: app.handle(COMMAND, {}), number=number, repeat=5)) / number
+    print(f"fast command: inline {inline * 1e6:.2f}us, in the worker pool with a budget {pooled * 1e6:.2f}us")
+    budgeted.close()
+
+    print(f"http (wsgiref, 8 clients) command {http_rate(app, COMMAND, seconds):>10.0f} req/s")
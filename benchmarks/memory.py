@@ -0,0 +1,54 @@
+"""
+    Reports how many bytes each kind of message object takes in memory, including the objects it holds.
+    Run it on two commits to compare.
+
+    Usage: python -m benchmarks.memory
+"""
+from typing import Any, Callable
+import gc
+import tracemalloc
+
+from dishookr import (Embed, EmbedField, EmbedFooter, EmbedAuthor, Button, ActionRow, ComponentPartialEmoji,
+                      Poll, PollMedia)
+
+NUMBER = 10000
+
+def embed_with_fields() -> Embed:
+    embed = Embed(title="Daily digest", description="Everything that happened today.", footer=EmbedFooter(text="digest"),
+                  author=EmbedAuthor(name="dishookr"))
+    for _ in range(25):
+        embed.add_field("Name", "Value", inline=True)
+    return embed
+
+def poll() -> Poll:
+    poll = Poll(question=PollMedia(text="Ship it?", emoji=None), answers=[], duration=24, allow_multiselect=False)
+    for answer in ("Yes", "No", "Later"):
+        poll.add_answer(PollMedia(text=answer, emoji=None))
+    return poll
+
+OBJECTS = {
+    "EmbedField": lambda: EmbedField(name="Name", value="Value", inline=True),
+    "EmbedFooter": lambda: EmbedFooter(text="digest"),
+    "Embed": lambda: Embed(title="Daily digest"),
+    "Embed (25 fields)": embed_with_fields,
+    "ComponentPartialEmoji": lambda: ComponentPartialEmoji(name="tada"),
+    "Button": lambda: Button(style=1, label="Open", custom_id="open"),
+    "ActionRow (5 buttons)": lambda: ActionRow(components=[Button(style=1, label="Open", custom_id="open") for _ in range(5)]),
+    "PollMedia": lambda: PollMedia(text="Yes", emoji=None),
+    "Poll (3 answers)": poll,
+}
+
+def per_object(factory: Callable[[], Any]) -> float:
+    objects = [None] * NUMBER
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(NUMBER):
+        objects[i] = factory()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / NUMBER
+
+if __name__ == "__main__":
+    for name, factory in OBJECTS.items():
+        print(f"{name:<24} {per_object(factory):>9.0f} bytes")
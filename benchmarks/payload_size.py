@@ -0,0 +1,63 @@
+"""
+    Reports the encoded size of typical messages and how long serializing and encoding them takes with each
+    installed JSON backend, next to a baseline of the payload as it was sent before unset fields were dropped:
+    every field present, None included, encoded with `json.dumps` defaults. Timings are also tracked by
+    `benchmarks.run`.
+
+    Usage: python -m benchmarks.payload_size
+"""
+from typing import Any
+import json
+import timeit
+
+from dishookr import Webhook, Embed
+from dishookr.encoding import BACKENDS, JSONBackend
+from dishookr.objects.serializer import NESTED, NESTED_LIST
+from benchmarks.suite import large_webhook
+
+def embed_heavy_webhook() -> Webhook:
+    """ Ten small alert embeds, the common shape of monitoring messages. """
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    for i in range(10):
+        embed = Embed(title=f"Alert {i}", description="CPU usage above 90% for 5 minutes.", color=0xE74C3C)
+        embed.add_field("Host", f"web-{i}", inline=True)
+        embed.add_field("Region", "eu-west-1", inline=True)
+        webhook.add_embed(embed)
+    return webhook
+
+def baseline(value: Any) -> Any:
+    """ Serializes like the hand-written methods used to: every field of every object, set or not. """
+    if isinstance(value, list):
+        return [baseline(item) for item in value]
+    fields = getattr(getattr(type(value), "to_dict", None), "fields", None)
+    if fields is None:
+        return value.to_dict() if hasattr(value, "to_dict") else value
+    payload = {}
+    for field in fields:
+        item = getattr(value, field.attr)
+        if item is not None and field.kind not in (NESTED, NESTED_LIST) and field.convert is not None:
+            item = field.convert(item)
+        payload[field.key or field.attr] = baseline(item)
+    return payload
+
+def report(name: str, webhook: Webhook, backend: JSONBackend, baseline_size: int) -> None:
+    encoded = backend.dumps(webhook.to_dict())
+    number = 2000
+    serialize = min(timeit.repeat(webhook.to_dict, number=number, repeat=5)) / number
+    encode = min(timeit.repeat(lambda: backend.dumps(webhook.to_dict()), number=number, repeat=5)) / number
+    saved = 1 - len(encoded) / baseline_size
+    print(f"{name:<14} {backend.name:<8} {len(encoded):>7} bytes ({saved:6.1%} smaller)  to_dict {serialize * 1e6:8.2f}us  to_dict + dumps {encode * 1e6:8.2f}us")
+
+if __name__ == "__main__":
+    messages = [("embed-heavy", embed_heavy_webhook()), ("large", large_webhook())]
+    baselines = {}
+    for name, webhook in messages:
+        baselines[name] = len(json.dumps(baseline(webhook)).encode())
+        print(f"{name:<14} {'baseline':<8} {baselines[name]:>7} bytes (every field, json.dumps defaults)")
+    for factory in BACKENDS.values():
+        try:
+            backend = factory()
+        except ImportError:
+            continue
+        for name, webhook in messages:
+            report(name, webhook, backend, baselines[name])
@@ -0,0 +1,44 @@
+"""
+    Compares per-send latency with and without connection pooling against a local stub.
+
+    Usage: python -m benchmarks.pooling [sends]
+"""
+import statistics
+import sys
+import time
+
+import requests
+
+from dishookr import Webhook, SessionPool
+from benchmarks.stub import start_stub
+
+class UnpooledSession(SessionPool):
+    """ Opens a fresh connection for every request, like the module-level `requests.post`. """
+    def request(self, method, url, **kwargs):
+        return requests.request(method, url, timeout=self.timeout, **kwargs)
+
+def measure(pool: SessionPool, url: str, sends: int) -> list:
+    webhook = Webhook(url, session_pool=pool)
+    webhook.set_content("Benchmark message")
+    timings = []
+    for _ in range(sends):
+        start = time.perf_counter()
+        webhook.send()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def report(name: str, timings: list) -> None:
+    timings = sorted(timings)
+    p50 = statistics.median(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{name:<10} p50={p50:.3f}ms p99={p99:.3f}ms")
+
+if __name__ == "__main__":
+    sends = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server, url = start_stub()
+    try:
+        report("unpooled", measure(UnpooledSession(), url, sends))
+        with SessionPool() as pool:
+            report("pooled", measure(pool, url, sends))
+    finally:
+        server.shutdown()
@@ -0,0 +1,103 @@
+"""
+    Runs the benchmark suite, stores the results per git commit and compares them with an earlier commit.
+
+    Usage:
+        python -m benchmarks.run                        # run everything and print the timings
+        python -m benchmarks.run --save                 # also store them in benchmarks/results/<commit>.json
+        python -m benchmarks.run --compare main         # flag benchmarks that got slower than on `main`
+        python -m benchmarks.run --filter send          # only run benchmarks whose name contains "send"
+
+    With --compare the exit status is 1 when a benchmark regressed by more than --threshold, so it can gate a release.
+    Compare results from the same machine only.
+"""
+from typing import Dict, Optional
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+from benchmarks.suite import BENCHMARKS
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+def git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def measure(setup, repeat: int, min_time: float) -> Dict[str, float]:
+    timer = timeit.Timer(setup())
+    number, elapsed = timer.autorange()
+    # Enough calls per round for each round to last about min_time.
+    number = max(1, int(number * min_time / elapsed)) if elapsed < min_time else number
+    rounds = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {"min": min(rounds), "median": statistics.median(rounds), "number": number, "repeat": repeat}
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f}{unit}"
+    return f"{seconds / 1e-9:.1f}ns"
+
+def load(ref: str) -> dict:
+    commit = git("rev-parse", ref) or ref
+    path = os.path.join(RESULTS_DIR, f"{commit}.json")
+    if not os.path.exists(path):
+        sys.exit(f"No saved results for {ref} ({commit}); check it out and run with --save first.")
+    with open(path) as fp:
+        return json.load(fp)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the dishookr benchmark suite.")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7, help="timing rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum duration of a round, in seconds")
+    parser.add_argument("--save", action="store_true", help="store the results for the current commit")
+    parser.add_argument("--compare", metavar="REF", help="compare with the saved results of a commit, branch or tag")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown counted as a regression (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    baseline = load(args.compare)["results"] if args.compare else {}
+    results = {}
+    regressions = []
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        result = results[name] = measure(setup, args.repeat, args.min_time)
+        line = f"{name:<28} min={format_time(result['min']):>10}  median={format_time(result['median']):>10}"
+        if name in baseline:
+            ratio = result["min"] / baseline[name]["min"]
+            line += f"  {ratio:6.2f}x vs {args.compare}"
+            if ratio > 1 + args.threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line, flush=True)
+
+    if args.save:
+        commit = git("rev-parse", "HEAD") or "unknown"
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{commit}.json")
+        with open(path, "w") as fp:
+            json.dump({
+                "commit": commit,
+                "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "machine": platform.platform(),
+                "results": results,
+            }, fp, indent=2)
+        print(f"Saved to {path}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+    A tiny local HTTP server that answers like a Discord webhook endpoint, used by the benchmarks.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+
+    def _reply(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_POST = _reply
+    do_PATCH = _reply
+    do_DELETE = _reply
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+def start_stub(handler=StubHandler):
+    """
+        Starts the stub server on a free local port.
+
+        Returns:
+            Tuple[ThreadingHTTPServer, str]: The server and the webhook URL pointing at it.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}/api/webhooks/1/token"
@@ -0,0 +1,134 @@
+"""
+    The benchmarks run by `benchmarks.run`. Each one is registered with `@benchmark` and returns the callable to time;
+    everything done before returning is setup and isn't measured.
+"""
+from typing import Any, Callable, Dict
+
+from dishookr import Webhook, Embed, EmbedAuthor, EmbedFooter, Poll, PollMedia, ActionRow, Button, SessionPool, RateLimiter, MessageTemplate
+from dishookr.encoding import dumps
+from dishookr.validation import get_default_validation_mode, set_default_validation_mode, check_payload
+from dishookr.testing import FakeDiscord
+from benchmarks.stub import start_stub
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+def benchmark(name: str) -> Callable:
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+def large_embed(index: int = 0) -> Embed:
+    embed = Embed(
+        title=f"Deployment report #{index}",
+        description="Summary of the services that were deployed in this release.",
+        color=0x3498DB,
+        footer=EmbedFooter(text="dishookr benchmarks"),
+        author=EmbedAuthor(name="CI"),
+    )
+    for i in range(25):
+        embed.add_field(f"s{i}", "ok", inline=True)
+    return embed
+
+def large_webhook(url: str = "https://discord.com/api/webhooks/1/token", **kwargs) -> Webhook:
+    """ A message near Discord's limits: 10 embeds of 25 fields, a poll and an action row of buttons. """
+    webhook = Webhook(url, **kwargs)
+    webhook.set_content("Release notes " * 100)
+    webhook.set_user("Release Bot", "https://example.com/avatar.png")
+    for i in range(10):
+        webhook.add_embed(large_embed(i))
+    poll = Poll(question=PollMedia(text="Ship it?", emoji=None), answers=[], duration=24, allow_multiselect=False)
+    for answer in ("Yes", "No", "Later"):
+        poll.add_answer(PollMedia(text=answer, emoji=None))
+    webhook.add_poll(poll)
+    webhook.add_component(ActionRow(components=[Button(style=1, label=f"Button {i}", custom_id=f"b{i}") for i in range(5)]))
+    return webhook
+
+@benchmark("embed.add_field_25")
+def embed_add_field():
+    def run():
+        embed = Embed(title="Fields")
+        for i in range(25):
+            embed.add_field(f"Field {i}", f"Value {i}", inline=True)
+    return run
+
+@benchmark("webhook.add_embed_10")
+def webhook_add_embed():
+    embeds = [large_embed(i) for i in range(10)]
+    def run():
+        webhook = Webhook("https://discord.com/api/webhooks/1/token")
+        for embed in embeds:
+            webhook.add_embed(embed)
+    return run
+
+@benchmark("poll.add_answer_10")
+def poll_add_answer():
+    medias = [PollMedia(text=f"Answer {i}", emoji=None) for i in range(10)]
+    def run():
+        poll = Poll(question=PollMedia(text="Question?", emoji=None), answers=[], duration=24, allow_multiselect=False)
+        for media in medias:
+            poll.add_answer(media)
+    return run
+
+def alert_webhook(service: str, region: str, value: str) -> Webhook:
+    """ A typical alert: the same embed skeleton every time, with a few values changed. """
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    webhook.set_content(f"{service} is degraded")
+    embed = Embed(title=f"Alert: {service}", description=f"Latency above threshold in {region}.", color=0xE74C3C,
+                  footer=EmbedFooter(text="dishookr monitoring"))
+    embed.add_field("Service", service, inline=True)
+    embed.add_field("Region", region, inline=True)
+    embed.add_field("p99 latency", value, inline=True)
+    embed.add_field("Runbook", "https://example.com/runbooks/latency")
+    webhook.add_embed(embed)
+    return webhook
+
+@benchmark("alert.build_and_encode")
+def alert_build_and_encode():
+    return lambda: dumps(alert_webhook("api", "eu-west-1", "850ms").to_dict())
+
+@benchmark("alert.template_render")
+def alert_template_render():
+    template = MessageTemplate(alert_webhook("{service}", "{region}", "{value}"))
+    return lambda: template.render(service="api", region="eu-west-1", value="850ms")
+
+@benchmark("build.large_message_eager")
+def build_large_message_eager():
+    # Built and serialized, as when sending, with every change checked as it is made.
+    return lambda: large_webhook().to_dict()
+
+@benchmark("build.large_message_lazy")
+def build_large_message_lazy():
+    # Built without checks, serialized, then checked in the single pass lazy validation runs at send time.
+    def run():
+        mode = get_default_validation_mode()
+        set_default_validation_mode("lazy")
+        try:
+            webhook = large_webhook()
+            check_payload(webhook.to_dict(), len(webhook.files))
+        finally:
+            set_default_validation_mode(mode)
+    return run
+
+@benchmark("serialize.large_message")
+def serialize_large_message():
+    webhook = large_webhook()
+    return webhook.to_dict
+
+@benchmark("encode.large_message")
+def encode_large_message():
+    payload = large_webhook().to_dict()
+    return lambda: dumps(payload)
+
+@benchmark("send.fake")
+def send_fake():
+    # The whole send path (serialization, rate limiter, retry policy, circuit breaker) without any network I/O.
+    fake = FakeDiscord(bucket_limit=10 ** 9, global_limit=10 ** 9, record=False)
+    webhook = large_webhook(session_pool=fake, rate_limiter=RateLimiter())
+    return webhook.send
+
+@benchmark("send.stub")
+def send_stub():
+    server, url = start_stub()
+    webhook = large_webhook(url, session_pool=SessionPool(), rate_limiter=RateLimiter())
+    return webhook.send
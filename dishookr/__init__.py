@@ -1,10 +1,29 @@
 from .app import Webhook
+from .async_app import AsyncWebhook
+from .http import SessionPool, AsyncSessionPool
+from .transport import Transport, AsyncTransport
+from .ratelimit import RateLimiter
+from .shared_ratelimit import SharedRateLimiter
+from .retry import RetryPolicy, RetryBudget
+from .circuit import CircuitBreaker, CircuitState
+from .exceptions import EmptyWebhook, HTTPException, RateLimited, DiscordServerError, NotFound, Unauthorized, CircuitOpen, ValidationError
+from .validation import ValidationMode, set_default_validation_mode
+from .dispatcher import WebhookDispatcher, AsyncWebhookDispatcher, OverflowPolicy
+from .coalesce import WebhookCoalescer
+from .outbox import Outbox
+from .log_handler import DiscordHandler
+from .broadcast import broadcast, BroadcastResult, BroadcastOutcome
+from .template import MessageTemplate
+from .interactions import InteractionApp, Interaction
+from .signature import SignatureVerifier
+from .autocomplete import AutocompleteIndex
 from .objects.embed import Embed, EmbedAuthor, EmbedField, EmbedFooter, EmbedImage, EmbedProvider, EmbedThumbnail, EmbedVideo
 from .objects.poll import Poll, PollResults, PollResultsAnswerCount, PollAnswer, PollMedia
 from .objects.emoji import Emoji, PollMediaPartialEmoji, ComponentPartialEmoji
 from .objects.allowed_mentions import AllowedMentions
+from .objects.attachment import File
 from .objects.component import Component, ActionRow, Button, StringSelect, TextInput, RoleSelect
 from .objects.interaction import InteractionChoices
 from .objects.interaction_response import InteractionResponse
-from .objects.enums import Locale, InteractionResponseType
+from .objects.enums import Locale, InteractionType, InteractionResponseType
 from .objects.interaction_callback import InteractionCallbackMessage, InteractionCallbackAutocomplete, InteractionCallbackModal
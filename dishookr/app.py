@@ -1,10 +1,31 @@
-from typing import List, Optional
+from typing import List, Optional, Union
+from concurrent.futures import Future
+import threading
+import time
 import requests
 
 from .objects.poll import Poll
-from .exceptions import EmptyWebhook
-from .objects.embed import Embed
+from .exceptions import EmptyWebhook, HTTPException, RateLimited, DiscordServerError, NotFound, Unauthorized
+from .objects.embed import Embed, MAX_EMBED_CHARACTERS
 from .objects.allowed_mentions import AllowedMentions
+from .objects.attachment import File
+from .objects.serializer import serializer, nested, nested_list, Field
+from .multipart import MultipartEncoder
+from .encoding import dumps, loads
+from .http import get_default_pool
+from .transport import Transport
+from .ratelimit import RateLimiter, get_default_limiter, route_key
+from .retry import RetryPolicy, get_default_retry_policy
+from .circuit import CircuitBreaker, get_default_circuit_breaker
+from .validation import ValidationMode, eager, lazy, check_payload
+
+MAX_CONTENT_LENGTH = 2000
+MAX_EMBEDS = 10
+EDITABLE_FIELDS = ("content", "embeds", "allowed_mentions", "components", "attachments")
+CLEARED_FIELDS = {"embeds": [], "components": [], "attachments": []}  # what an edit sends for a field that was removed
+
+def _attachments(files: List[File]) -> List[dict]:
+    return [file.to_attachment(index) for index, file in enumerate(files)]
 
 class Webhook(object):
     """
@@ -22,10 +43,18 @@ class Webhook(object):
     content: Optional[str]
     embeds: List[Embed]
     components: List[object]
-    files: Optional[object]
+    files: List[File]
+    max_upload_size: int
     poll: Optional[Poll]
+    session_pool: Optional[Transport]
+    rate_limiter: Optional[RateLimiter]
+    retry_policy: Optional[RetryPolicy]
+    circuit_breaker: Optional[CircuitBreaker]
+    validation: Optional[ValidationMode]
+    message_id: Optional[int]
+    edit_interval: float
 
-    def __init__(self, webhook_url: str, wait: Optional[bool] = False, thread_id: Optional[int] = None, tts: Optional[bool] = False) -> None:
+    def __init__(self, webhook_url: str, wait: Optional[bool] = False, thread_id: Optional[int] = None, tts: Optional[bool] = False, session_pool: Optional[Transport] = None, rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None, circuit_breaker: Optional[CircuitBreaker] = None, validation: Optional[Union[str, ValidationMode]] = None) -> None:
         """
             Initializes the webhook.
 
@@ -34,13 +63,23 @@ class Webhook(object):
                 wait (Optional[bool], optional): Whether to wait for the message to be sent before relaying a response. Defaults to False.
                 thread_id (Optional[int], optional): The thread ID to send the message to. Defaults to None.
                 tts (Optional[bool], optional): Whether the message is text-to-speech. Defaults to False.
+                session_pool (Optional[Transport], optional): The session pool, or any other transport, to send through. Defaults to the shared pool.
+                rate_limiter (Optional[RateLimiter], optional): The rate limiter to respect. Defaults to the shared limiter, so every webhook targeting the same URL shares its buckets.
+                retry_policy (Optional[RetryPolicy], optional): How failed sends are retried. Defaults to the shared policy.
+                circuit_breaker (Optional[CircuitBreaker], optional): Makes sends to dead or failing webhook URLs fail fast. Defaults to the shared circuit breaker.
+                validation (Optional[Union[str, ValidationMode]], optional): When this webhook's message is checked against Discord's limits: "eager", "lazy" or "off". Defaults to the default mode, see `dishookr.validation`.
         """
         self.webhook_url = webhook_url
         self.wait = wait
         self.thread_id = thread_id
         self.tts = tts
+        self.session_pool = session_pool
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.validation = ValidationMode(validation) if validation is not None else None
 
-        self.formed_url = f"{self.webhook_url}?wait={'true' if self.wait else 'false'}{'&thread_id=' + self.thread_id if self.thread_id else ''}"
+        self.formed_url = f"{self.webhook_url}?wait={'true' if self.wait else 'false'}{f'&thread_id={self.thread_id}' if self.thread_id else ''}"
 
         self.allowed_mentions = None
 
@@ -50,9 +89,19 @@ class Webhook(object):
         self.content = None
         self.embeds = []
         self.components = []
-        self.files = None  # should be an object
+        self.files = []
+        self.max_upload_size = 10 * 1024 * 1024  # Discord's default per-message limit, raise it for boosted servers
         self.poll = None  # should be an object
 
+        self.message_id = None  # known once sent with wait=True
+        self.edit_interval = 1.0  # edits closer together than this are collapsed into one
+        self._sent_payload = None
+        self._last_edit = 0.0
+        self._pending_edit = None
+        self._edit_timer = None
+        self._edit_lock = threading.Lock()
+        self._patch_lock = threading.Lock()
+
     def add_embed(self, embed: Embed) -> None:
         """
             Adds an [embed](https://discord.com/developers/docs/resources/channel#embed-object) to the webhook.
@@ -60,11 +109,13 @@ class Webhook(object):
             Args:
                 embed (DisHook.Embed): The embed to add.
         """
-        if len(self.embeds) < 10:
-            self.embeds.append(embed)
-            self.validate()  # Re-validate after adding an embed
-        else:
-            raise ValueError("Maximum of 10 embeds are allowed.")
+        if eager(self.validation):
+            if len(self.embeds) >= MAX_EMBEDS:
+                raise ValueError("Maximum of 10 embeds are allowed.")
+            # Each embed keeps its own running total, so this doesn't re-count any field.
+            if self.embed_characters() + embed.total_characters() > MAX_EMBED_CHARACTERS:
+                raise ValueError("Combined characters in title, description, fields, footer text, and author name across all embeds cannot exceed 6000.")
+        self.embeds.append(embed)
     
     def add_poll(self, poll: Poll) -> None:
         """
@@ -75,6 +126,21 @@ class Webhook(object):
         """
         self.poll = poll
     
+    def add_file(self, file: File) -> None:
+        """
+            Attaches a [file](https://discord.com/developers/docs/reference#uploading-files) to the webhook.
+            The file is only read, in chunks, while the webhook is being sent.
+
+            Args:
+                file (DisHook.File): The file to attach.
+        """
+        if eager(self.validation):
+            if len(self.files) >= 10:
+                raise ValueError("Maximum of 10 files are allowed.")
+            if sum(attached.size for attached in self.files) + file.size > self.max_upload_size:
+                raise ValueError(f"Combined size of files cannot exceed {self.max_upload_size} bytes.")
+        self.files.append(file)
+
     def add_component(self, component: object) -> None:
         """
             Adds a [DisHook.component](https://discord.com/developers/docs/interactions/message-components) to the webhook. This feature is only available for webhooks that are 'application owned' (i.e. created by a bot user).
@@ -82,7 +148,7 @@ class Webhook(object):
             Args:
                 component (object): The component to add.
         """
-        self.components.append(component.__dict__())
+        self.components.append(component.to_dict())
 
     def set_content(self, content: str) -> None:
         """
@@ -91,7 +157,7 @@ class Webhook(object):
             Args:
                 content (str): The content to set.
         """
-        if len(content) > 2000:
+        if eager(self.validation) and len(content) > MAX_CONTENT_LENGTH:
             raise ValueError("Content length cannot exceed 2000 characters.")
         self.content = content
 
@@ -115,56 +181,296 @@ class Webhook(object):
         """
         self.allowed_mentions = allowed_mentions
 
+    def embed_characters(self) -> int:
+        """
+            Returns the number of characters that count towards the 6000 character limit, across all embeds.
+
+            Returns:
+                int: The sum of the embeds' running totals.
+        """
+        return sum(embed.total_characters() for embed in self.embeds)
+
     def validate(self) -> None:
         """
-            Validates the webhook, as per the [Discord embed limits](https://discord.com/developers/docs/resources/channel#embed-object-embed-limits).
+            Validates the whole message in one pass, as per [Discord's limits](https://discord.com/developers/docs/resources/channel#embed-object-embed-limits),
+            whatever the validation mode. This is what lazy validation runs when the message is sent.
 
             Raises:
-                ValueError: If the webhook is invalid.
-        """
-        total_chars = sum((len(embed.title or "") + len(embed.description or "") +
-                           sum(len(field.name) for field in embed.fields) +
-                           sum(len(field.value) for field in embed.fields) +
-                           (len(embed.footer.text) if embed.footer and embed.footer.text else 0) +
-                           (len(embed.author.name) if embed.author and embed.author.name else 0))
-                          for embed in self.embeds)
-        
-        if total_chars > 6000:
-            raise ValueError("Combined characters in title, description, fields, footer text, and author name across all embeds cannot exceed 6000.")
+                ValidationError: With every violation found, if the webhook is invalid.
+        """
+        check_payload(self.to_dict(), len(self.files))
+
+    # Only the fields that are set are sent; empty lists are left out as well.
+    to_dict = serializer("content", "username", "avatar_url", "tts", nested_list("embeds"), nested("allowed_mentions"),
+                          Field("components", omit_empty=True), Field("files", "attachments", omit_empty=True, convert=_attachments),
+                          nested("poll"))
+
+    def _check_sendable(self) -> None:
+        if not self.content and not self.embeds and not self.components and not self.files and not self.poll:
+            raise EmptyWebhook("Webhook must have content, embeds, components, file, or poll.")
+
+    def _body(self, data: Optional[dict] = None) -> dict:
+        # The request arguments carrying the message: plain JSON, or a streamed multipart body when files are attached.
+        if data is None:
+            data = self.to_dict()
+        if lazy(self.validation):
+            check_payload(data, len(self.files))
+        if not self.files or "attachments" not in data:
+            return {"data": dumps(data), "headers": {"Content-Type": "application/json"}}
+
+        total_size = sum(file.size for file in self.files)
+        if total_size > self.max_upload_size:
+            raise ValueError(f"Combined size of files cannot exceed {self.max_upload_size} bytes.")
+        encoder = MultipartEncoder(data, self.files)
+        return {"data": encoder, "headers": {"Content-Type": encoder.content_type, "Content-Length": str(len(encoder))}}
+
+    @staticmethod
+    def _rate_limit_body(result) -> Optional[dict]:
+        if result.status_code != 429:
+            return None
+        try:
+            return loads(result.content)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _retry_after(result) -> Optional[float]:
+        body = Webhook._rate_limit_body(result)
+        if body and "retry_after" in body:
+            return float(body["retry_after"])
+        try:
+            return float(result.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
+
+    @staticmethod
+    def _error_code(result) -> Optional[int]:
+        if result.status_code < 400:
+            return None
+        try:
+            return loads(result.content).get("code")
+        except (ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    def _raise_for_status(result, attempts: int) -> None:
+        if 200 <= result.status_code < 300:
+            return
+        if result.status_code == 429:
+            raise RateLimited(result, attempts, Webhook._retry_after(result))
+        if result.status_code >= 500:
+            raise DiscordServerError(result, attempts, Webhook._retry_after(result))
+        if result.status_code == 404:
+            raise NotFound(result, attempts)
+        if result.status_code == 401:
+            raise Unauthorized(result, attempts)
+        raise HTTPException(result, attempts, Webhook._retry_after(result))
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        session_pool = self.session_pool or get_default_pool()
+        rate_limiter = self.rate_limiter or get_default_limiter()
+        retry_policy = self.retry_policy or get_default_retry_policy()
+        circuit_breaker = self.circuit_breaker or get_default_circuit_breaker()
+        route = route_key(method, url)
+        circuit_breaker.allow(self.webhook_url)
+
+        if retry_policy.budget is not None:
+            retry_policy.budget.deposit()
+        started = time.monotonic()
+        attempts = 0
+        rate_limited = 0
+        while True:
+            rate_limiter.acquire(route)
+            attempts += 1
+            try:
+                result = session_pool.request(method, url, **kwargs)
+            except session_pool.transient_errors:
+                rate_limiter.release(route)
+                delay = retry_policy.next_delay(attempts, started)
+                if delay is None:
+                    circuit_breaker.record_failure(self.webhook_url)
+                    raise
+                time.sleep(delay)
+                continue
+            except session_pool.timeout_errors:
+                rate_limiter.release(route)
+                circuit_breaker.record_failure(self.webhook_url)
+                raise
+            except BaseException:
+                rate_limiter.release(route)
+                raise
+
+            if rate_limiter.update(route, result.status_code, result.headers, self._rate_limit_body(result)) is not None:
+                # 429s are waited out by the rate limiter and don't count against the retry policy.
+                rate_limited += 1
+                if rate_limited <= rate_limiter.max_retries:
+                    continue
+                break
+            if 200 <= result.status_code < 300:
+                break
+            delay = retry_policy.next_delay(attempts, started, result.status_code, self._retry_after(result))
+            if delay is None:
+                break
+            time.sleep(delay)
+
+        circuit_breaker.record_response(self.webhook_url, result.status_code,
+                                        self._error_code(result) if result.status_code == 404 else None)
+        self._raise_for_status(result, attempts)
+        return result
 
     def send(self) -> requests.Response:
         """
-            Sends the webhook.
+            Sends the webhook. Server errors and connection failures are retried as per the retry policy.
+
+            Raises:
+                RateLimited: If Discord kept rate limiting the webhook.
+                DiscordServerError: If Discord kept failing with a 5xx status.
+                HTTPException: If Discord rejected the webhook.
 
             Returns:
                 requests.Response: The webhook response from Discord.
         """
-        if not self.content and not self.embeds and not self.components and not self.file and not self.poll:
-            raise EmptyWebhook("Webhook must have content, embeds, components, file, or poll.")
-        data = {
-            "content": self.content,
-            "username": self.username,
-            "avatar_url": self.avatar_url,
-            "tts": self.tts,
-
-            "embeds": [embed.__dict__() for embed in self.embeds],
-            "allowed_mentions": self.allowed_mentions.__dict__() if self.allowed_mentions else None,
-
-            "components": self.components,
-            "files": self.files if self.files else None,
-            # "payload_json": {},
-            # "attachments": [self.file],
-            #"flags": self.flags,
-            # "applied_tags": "",
-            "poll": self.poll.__dict__() if self.poll else None,
-        }
+        self._check_sendable()
         
-        headers = {"Content-Type": "application/json"}
         cookies = {}
-        result = requests.post(self.formed_url, json=data, headers=headers, cookies=cookies)
-        
-        if result.status_code == 200:
+        data = self.to_dict()
+        result = self._request("POST", self.formed_url, cookies=cookies, **self._body(data))
+        self._remember(result, data)
+        return result
+
+    def _remember(self, result, data: dict) -> None:
+        # Keeps what Discord now shows, so edits only send what changed since.
+        self._sent_payload = {key: data.get(key) for key in EDITABLE_FIELDS}
+        if self.wait and result.content:
+            self.message_id = int(loads(result.content)["id"])
+
+    def _message_url(self, message_id: Optional[Union[int, str]] = None) -> str:
+        if message_id is None:
+            message_id = self.message_id
+        if message_id is None:
+            raise ValueError("The message ID is unknown, send the webhook with wait=True first.")
+        url = f"{self.webhook_url}/messages/{message_id}"
+        return f"{url}?thread_id={self.thread_id}" if self.thread_id else url
+
+    def _edit_payload(self, data: dict) -> Optional[dict]:
+        # The editable top-level fields that differ from the message Discord has, None if nothing changed.
+        changed = {key: data.get(key, CLEARED_FIELDS.get(key)) for key in EDITABLE_FIELDS
+                   if self._sent_payload is None or data.get(key) != self._sent_payload.get(key)}
+        return changed or None
+
+    def edit(self) -> Future:
+        """
+            Edits the sent message to match the webhook's current content, embeds, allowed mentions, components and files.
+            Only the fields that changed since the last send or edit are sent, and nothing is sent if none did.
+
+            Edits are debounced: at most one request is made every `edit_interval` seconds, an edit made sooner is
+            delayed, and further edits made in the meantime are collapsed into it.
+
+            Raises:
+                ValueError: If the message ID is unknown because the webhook wasn't sent with wait=True.
+
+            Returns:
+                Future: Resolves to the response from Discord, or None if nothing changed, once the edit is made.
+        """
+        self._message_url()
+        with self._edit_lock:
+            if self._pending_edit is not None:
+                return self._pending_edit
+            future = Future()
+            delay = self._last_edit + self.edit_interval - time.monotonic()
+            if delay > 0:
+                self._pending_edit = future
+                self._edit_timer = threading.Timer(delay, self._flush_edit, args=(future,))
+                self._edit_timer.daemon = True
+                self._edit_timer.start()
+                return future
+            self._last_edit = time.monotonic()
+        self._run_edit(future)
+        return future
+
+    def _flush_edit(self, future: Future) -> None:
+        with self._edit_lock:
+            if self._pending_edit is not future:
+                return  # cancelled by delete
+            self._pending_edit = None
+            self._edit_timer = None
+            self._last_edit = time.monotonic()
+        self._run_edit(future)
+
+    def _run_edit(self, future: Future) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self._patch()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def _patch(self) -> Optional[requests.Response]:
+        with self._patch_lock:
+            data = self.to_dict()
+            payload = self._edit_payload(data)
+            if payload is None:
+                return None
+            result = self._request("PATCH", self._message_url(), **self._body(payload))
+            self._sent_payload = {key: data.get(key) for key in EDITABLE_FIELDS}
             return result
-        
-        if result.status_code == 429:
-            raise ValueError(f"Failed to send webhook: {result.text}")
+
+    def _cancel_edit(self) -> None:
+        with self._edit_lock:
+            if self._edit_timer is not None:
+                self._edit_timer.cancel()
+            if self._pending_edit is not None:
+                self._pending_edit.cancel()
+            self._pending_edit = None
+            self._edit_timer = None
+
+    def delete(self) -> requests.Response:
+        """
+            Deletes the sent message, cancelling any edit still waiting to be made.
+
+            Raises:
+                ValueError: If the message ID is unknown because the webhook wasn't sent with wait=True.
+                HTTPException: If Discord rejected the request.
+
+            Returns:
+                requests.Response: The response from Discord.
+        """
+        url = self._message_url()
+        self._cancel_edit()
+        result = self._request("DELETE", url)
+        self.message_id = None
+        self._sent_payload = None
+        return result
+
+    def execute(self, payload: Union[dict, bytes]) -> requests.Response:
+        """
+            Sends an already serialized message, such as the output of `to_dict()`, through this webhook's
+            URL, session pool, rate limiter and retry policy. The builder state of the webhook is ignored.
+
+            Args:
+                payload (Union[dict, bytes]): The JSON payload of the message, or its already encoded bytes.
+
+            Returns:
+                requests.Response: The webhook response from Discord.
+        """
+        data = payload if isinstance(payload, bytes) else dumps(payload)
+        return self._request("POST", self.formed_url, data=data, headers={"Content-Type": "application/json"})
+
+    def execute_edit(self, payload: Union[dict, bytes], message_id: Optional[Union[int, str]] = None) -> requests.Response:
+        """
+            Edits a message with an already serialized payload, like `execute`, without debouncing or diffing.
+
+            Args:
+                payload (Union[dict, bytes]): The JSON payload of the edit, or its already encoded bytes.
+                message_id (Optional[Union[int, str]], optional): The message to edit, or "@original" for an interaction's original response. Defaults to the sent message.
+
+            Raises:
+                ValueError: If no message ID is given and the webhook wasn't sent with wait=True.
+
+            Returns:
+                requests.Response: The response from Discord.
+        """
+        data = payload if isinstance(payload, bytes) else dumps(payload)
+        return self._request("PATCH", self._message_url(message_id), data=data, headers={"Content-Type": "application/json"})
@@ -0,0 +1,202 @@
+from typing import Optional, Union
+import asyncio
+import time
+
+from .app import Webhook, EDITABLE_FIELDS
+from .http import Response, get_default_async_pool
+from .transport import AsyncTransport
+from .ratelimit import RateLimiter, get_default_limiter, route_key
+from .retry import RetryPolicy, get_default_retry_policy
+from .circuit import CircuitBreaker, get_default_circuit_breaker
+from .encoding import dumps
+from .validation import ValidationMode
+
+class AsyncWebhook(Webhook):
+    """
+        Represents a Discord webhook that is sent without blocking the event loop.
+        It is built exactly like `Webhook`, only `send`, `edit` and `delete` must be awaited.
+        - https://discord.com/developers/docs/resources/webhook
+    """
+    session_pool: Optional[AsyncTransport]
+
+    def __init__(self, webhook_url: str, wait: Optional[bool] = False, thread_id: Optional[int] = None, tts: Optional[bool] = False, session_pool: Optional[AsyncTransport] = None, rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None, circuit_breaker: Optional[CircuitBreaker] = None, validation: Optional[Union[str, ValidationMode]] = None) -> None:
+        """
+            Initializes the webhook.
+
+            Args:
+                webhook_url (str): The URL of the webhook.
+                wait (Optional[bool], optional): Whether to wait for the message to be sent before relaying a response. Defaults to False.
+                thread_id (Optional[int], optional): The thread ID to send the message to. Defaults to None.
+                tts (Optional[bool], optional): Whether the message is text-to-speech. Defaults to False.
+                session_pool (Optional[AsyncTransport], optional): The session pool, or any other asynchronous transport, to send through. Defaults to the shared pool.
+                rate_limiter (Optional[RateLimiter], optional): The rate limiter to respect. Defaults to the shared limiter, so every webhook targeting the same URL shares its buckets.
+                retry_policy (Optional[RetryPolicy], optional): How failed sends are retried. Defaults to the shared policy.
+                circuit_breaker (Optional[CircuitBreaker], optional): Makes sends to dead or failing webhook URLs fail fast. Defaults to the shared circuit breaker.
+                validation (Optional[Union[str, ValidationMode]], optional): When this webhook's message is checked against Discord's limits: "eager", "lazy" or "off". Defaults to the default mode, see `dishookr.validation`.
+        """
+        super().__init__(webhook_url, wait=wait, thread_id=thread_id, tts=tts, rate_limiter=rate_limiter, retry_policy=retry_policy, circuit_breaker=circuit_breaker, validation=validation)
+        self.session_pool = session_pool
+        self._patch_lock = None  # an asyncio.Lock, created on first use
+
+    async def _request(self, method: str, url: str, **kwargs) -> Response:
+        session_pool = self.session_pool or get_default_async_pool()
+        rate_limiter = self.rate_limiter or get_default_limiter()
+        retry_policy = self.retry_policy or get_default_retry_policy()
+        circuit_breaker = self.circuit_breaker or get_default_circuit_breaker()
+        route = route_key(method, url)
+        circuit_breaker.allow(self.webhook_url)
+
+        if retry_policy.budget is not None:
+            retry_policy.budget.deposit()
+        started = time.monotonic()
+        attempts = 0
+        rate_limited = 0
+        while True:
+            await rate_limiter.acquire_async(route)
+            attempts += 1
+            try:
+                result = await session_pool.request(method, url, **kwargs)
+            except session_pool.transient_errors:
+                rate_limiter.release(route)
+                delay = retry_policy.next_delay(attempts, started)
+                if delay is None:
+                    circuit_breaker.record_failure(self.webhook_url)
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except session_pool.timeout_errors:
+                rate_limiter.release(route)
+                circuit_breaker.record_failure(self.webhook_url)
+                raise
+            except BaseException:
+                rate_limiter.release(route)
+                raise
+
+            if rate_limiter.update(route, result.status_code, result.headers, self._rate_limit_body(result)) is not None:
+                rate_limited += 1
+                if rate_limited <= rate_limiter.max_retries:
+                    continue
+                break
+            if 200 <= result.status_code < 300:
+                break
+            delay = retry_policy.next_delay(attempts, started, result.status_code, self._retry_after(result))
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        circuit_breaker.record_response(self.webhook_url, result.status_code,
+                                        self._error_code(result) if result.status_code == 404 else None)
+        self._raise_for_status(result, attempts)
+        return result
+
+    async def send(self) -> Response:
+        """
+            Sends the webhook. Cancelling the awaiting task aborts the request and releases its connection.
+
+            Raises:
+                RateLimited: If Discord kept rate limiting the webhook.
+                DiscordServerError: If Discord kept failing with a 5xx status.
+                HTTPException: If Discord rejected the webhook.
+
+            Returns:
+                Response: The webhook response from Discord.
+        """
+        self._check_sendable()
+
+        data = self.to_dict()
+        result = await self._request("POST", self.formed_url, **self._body(data))
+        self._remember(result, data)
+        return result
+
+    async def edit(self) -> Optional[Response]:
+        """
+            Edits the sent message to match the webhook's current content, embeds, allowed mentions, components and files.
+            Only the fields that changed since the last send or edit are sent, and nothing is sent if none did.
+
+            Edits are debounced: at most one request is made every `edit_interval` seconds, an edit made sooner is
+            delayed, and concurrent edits made in the meantime wait for that same request.
+
+            Raises:
+                ValueError: If the message ID is unknown because the webhook wasn't sent with wait=True.
+
+            Returns:
+                Optional[Response]: The response from Discord, or None if nothing changed.
+        """
+        self._message_url()
+        if self._pending_edit is None:
+            delay = self._last_edit + self.edit_interval - time.monotonic()
+            if delay <= 0:
+                self._last_edit = time.monotonic()
+                return await self._patch()
+            self._pending_edit = asyncio.ensure_future(self._deferred_edit(delay))
+        # Shielded, so one caller being cancelled doesn't cancel the edit the others wait for.
+        return await asyncio.shield(self._pending_edit)
+
+    async def _deferred_edit(self, delay: float) -> Optional[Response]:
+        await asyncio.sleep(delay)
+        self._pending_edit = None
+        self._last_edit = time.monotonic()
+        return await self._patch()
+
+    async def _patch(self) -> Optional[Response]:
+        if self._patch_lock is None:
+            self._patch_lock = asyncio.Lock()
+        async with self._patch_lock:
+            data = self.to_dict()
+            payload = self._edit_payload(data)
+            if payload is None:
+                return None
+            result = await self._request("PATCH", self._message_url(), **self._body(payload))
+            self._sent_payload = {key: data.get(key) for key in EDITABLE_FIELDS}
+            return result
+
+    async def delete(self) -> Response:
+        """
+            Deletes the sent message, cancelling any edit still waiting to be made.
+
+            Raises:
+                ValueError: If the message ID is unknown because the webhook wasn't sent with wait=True.
+                HTTPException: If Discord rejected the request.
+
+            Returns:
+                Response: The response from Discord.
+        """
+        url = self._message_url()
+        if self._pending_edit is not None:
+            self._pending_edit.cancel()
+            self._pending_edit = None
+        result = await self._request("DELETE", url)
+        self.message_id = None
+        self._sent_payload = None
+        return result
+
+    async def execute(self, payload: Union[dict, bytes]) -> Response:
+        """
+            Sends an already serialized message, such as the output of `to_dict()`, through this webhook's
+            URL, session pool, rate limiter and retry policy. The builder state of the webhook is ignored.
+
+            Args:
+                payload (Union[dict, bytes]): The JSON payload of the message, or its already encoded bytes.
+
+            Returns:
+                Response: The webhook response from Discord.
+        """
+        data = payload if isinstance(payload, bytes) else dumps(payload)
+        return await self._request("POST", self.formed_url, data=data, headers={"Content-Type": "application/json"})
+
+    async def execute_edit(self, payload: Union[dict, bytes], message_id: Optional[Union[int, str]] = None) -> Response:
+        """
+            Edits a message with an already serialized payload, like `execute`, without debouncing or diffing.
+
+            Args:
+                payload (Union[dict, bytes]): The JSON payload of the edit, or its already encoded bytes.
+                message_id (Optional[Union[int, str]], optional): The message to edit, or "@original" for an interaction's original response. Defaults to the sent message.
+
+            Raises:
+                ValueError: If no message ID is given and the webhook wasn't sent with wait=True.
+
+            Returns:
+                Response: The response from Discord.
+        """
+        data = payload if isinstance(payload, bytes) else dumps(payload)
+        return await self._request("PATCH", self._message_url(message_id), data=data, headers={"Content-Type": "application/json"})
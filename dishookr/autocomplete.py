@@ -0,0 +1,233 @@
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+import threading
+
+from .interactions import Interaction
+from .objects.enums import Locale, InteractionResponseType
+from .objects.interaction import InteractionChoices
+from .objects.interaction_callback import InteractionCallbackAutocomplete
+from .objects.interaction_response import InteractionResponse
+
+MAX_CHOICES = 25  # the most choices Discord shows in an autocomplete
+NGRAM = 3
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+class _SortedNames(object):
+    # The casefolded names of one locale, sorted, with the ID of the choice they belong to at the same position.
+    __slots__ = ("keys", "ids")
+
+    def __init__(self, entries: List[Tuple[str, int]]) -> None:
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.ids = [choice_id for _, choice_id in entries]
+
+    def insert(self, key: str, choice_id: int) -> None:
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.ids.insert(index, choice_id)
+
+    def delete(self, key: str, choice_id: int) -> None:
+        index = bisect_left(self.keys, key)
+        while self.ids[index] != choice_id:
+            index += 1
+        del self.keys[index]
+        del self.ids[index]
+
+    def prefixed(self, prefix: str, limit: int, skip: Set[int]) -> List[int]:
+        keys, ids = self.keys, self.ids
+        found = []
+        index = bisect_left(keys, prefix)
+        while index < len(keys) and len(found) < limit and keys[index].startswith(prefix):
+            if ids[index] not in skip:
+                found.append(ids[index])
+                skip.add(ids[index])
+            index += 1
+        return found
+
+class AutocompleteIndex(object):
+    """
+        An index of autocomplete choices, built once and searched on every keystroke:
+
+            index = AutocompleteIndex(InteractionChoices(name, value) for name, value in catalogue)
+
+            @app.autocomplete("item")
+            def item(interaction):
+                return index.respond(interaction)
+
+        Names are casefolded and kept in sorted arrays, one per locale, so a search is a binary search for the typed
+        prefix followed by a short scan, in microseconds even with hundreds of thousands of choices. With `fuzzy`,
+        choices sharing trigrams with the query fill the results when there are too few prefix matches. Recent
+        results are cached by query; the cache is cleared when choices are added or removed.
+    """
+    fuzzy: bool
+    cache_size: int
+
+    def __init__(self, choices: Iterable[InteractionChoices] = (), fuzzy: bool = False, cache_size: int = 1024) -> None:
+        """
+            Builds the index.
+
+            Args:
+                choices (Iterable[InteractionChoices], optional): The choices; a later choice replaces an earlier one with the same value. Defaults to none.
+                fuzzy (bool, optional): Whether to also match choices by trigrams, for typos and words inside names. Defaults to False.
+                cache_size (int, optional): How many query results are cached. Defaults to 1024.
+        """
+        self.fuzzy = fuzzy
+        self.cache_size = cache_size
+        self._choices: Dict[int, InteractionChoices] = {}
+        self._ids: Dict[Union[str, int, float], int] = {}
+        self._next_id = 0
+        self._ngrams: Dict[str, Set[int]] = {}
+        self._cache: "OrderedDict[Tuple[Optional[Locale], str, int], Tuple[int, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        entries: Dict[Optional[Locale], List[Tuple[str, int]]] = {None: []}
+        for choice in {choice.value: choice for choice in choices}.values():
+            for locale, key in self._register(choice):
+                entries.setdefault(locale, []).append((key, self._ids[choice.value]))
+        self._names = {locale: _SortedNames(names) for locale, names in entries.items()}
+
+    def __len__(self) -> int:
+        return len(self._choices)
+
+    def __contains__(self, value: Union[str, int, float]) -> bool:
+        return value in self._ids
+
+    @staticmethod
+    def _keys(choice: InteractionChoices) -> List[Tuple[Optional[Locale], str]]:
+        keys = [(None, choice.name.casefold())]
+        if choice.name_localizations:
+            keys.extend((locale, name.casefold()) for locale, name in choice.name_localizations.items())
+        return keys
+
+    def _register(self, choice: InteractionChoices) -> List[Tuple[Optional[Locale], str]]:
+        # Assigns the choice an ID and indexes its trigrams; returns the names to insert in the sorted arrays.
+        choice_id = self._next_id
+        self._next_id += 1
+        self._choices[choice_id] = choice
+        self._ids[choice.value] = choice_id
+        keys = self._keys(choice)
+        if self.fuzzy:
+            for _, key in keys:
+                for ngram in _ngrams(key):
+                    self._ngrams.setdefault(ngram, set()).add(choice_id)
+        return keys
+
+    def _forget(self, choice_id: int) -> List[Tuple[Optional[Locale], str]]:
+        # The reverse of _register.
+        choice = self._choices.pop(choice_id)
+        del self._ids[choice.value]
+        keys = self._keys(choice)
+        if self.fuzzy:
+            for ngram in set().union(*(_ngrams(key) for _, key in keys)):
+                posting = self._ngrams[ngram]
+                posting.discard(choice_id)
+                if not posting:
+                    del self._ngrams[ngram]
+        return keys
+
+    def add(self, choice: InteractionChoices) -> None:
+        """
+            Adds a choice, replacing the one with the same value if any.
+
+            Args:
+                choice (InteractionChoices): The choice.
+        """
+        with self._lock:
+            if choice.value in self._ids:
+                self._remove(choice.value)
+            for locale, key in self._register(choice):
+                names = self._names.get(locale)
+                if names is None:
+                    names = self._names[locale] = _SortedNames([])
+                names.insert(key, self._ids[choice.value])
+            self._cache.clear()
+
+    def remove(self, value: Union[str, int, float]) -> None:
+        """
+            Removes a choice.
+
+            Args:
+                value (Union[str, int, float]): The value of the choice.
+
+            Raises:
+                KeyError: If no choice has that value.
+        """
+        with self._lock:
+            self._remove(value)
+            self._cache.clear()
+
+    def _remove(self, value: Union[str, int, float]) -> None:
+        choice_id = self._ids[value]
+        for locale, key in self._forget(choice_id):
+            self._names[locale].delete(key, choice_id)
+
+    def search(self, query: str, locale: Optional[Union[Locale, str]] = None, limit: int = MAX_CHOICES) -> List[InteractionChoices]:
+        """
+            Finds the choices matching what the user typed.
+
+            Args:
+                query (str): The text typed so far.
+                locale (Optional[Union[Locale, str]], optional): The user's locale. Names in that locale are matched first, then default names. Defaults to None.
+                limit (int, optional): The most choices to return. Defaults to 25, Discord's limit.
+
+            Returns:
+                List[InteractionChoices]: The choices whose name starts with the query, in alphabetical order, followed by the closest trigram matches when fuzzy.
+        """
+        if isinstance(locale, str):
+            try:
+                locale = Locale(locale)
+            except ValueError:
+                locale = None
+        prefix = query.casefold()
+        cache_key = (locale, prefix, limit)
+
+        with self._lock:
+            found = self._cache.get(cache_key)
+            if found is not None:
+                self._cache.move_to_end(cache_key)
+            else:
+                found = tuple(self._search(prefix, locale, limit))
+                self._cache[cache_key] = found
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            choices = self._choices
+            return [choices[choice_id] for choice_id in found]
+
+    def _search(self, prefix: str, locale: Optional[Locale], limit: int) -> List[int]:
+        seen: Set[int] = set()
+        found = []
+        if locale is not None and locale in self._names:
+            found.extend(self._names[locale].prefixed(prefix, limit, seen))
+        found.extend(self._names[None].prefixed(prefix, limit - len(found), seen))
+
+        if self.fuzzy and len(found) < limit and len(prefix) >= NGRAM:
+            ngrams = _ngrams(prefix)
+            scores: Counter = Counter()
+            for ngram in ngrams:
+                scores.update(self._ngrams.get(ngram, ()))
+            threshold = max(1, len(ngrams) // 2)
+            for choice_id, score in scores.most_common():
+                if score < threshold or len(found) >= limit:
+                    break
+                if choice_id not in seen:
+                    found.append(choice_id)
+        return found
+
+    def respond(self, interaction: Interaction, limit: int = MAX_CHOICES) -> InteractionResponse:
+        """
+            Answers an autocomplete interaction with the choices matching its focused option, in the user's locale.
+
+            Args:
+                interaction (Interaction): The autocomplete interaction.
+                limit (int, optional): The most choices to return. Defaults to 25, Discord's limit.
+
+            Returns:
+                InteractionResponse: The APPLICATION_COMMAND_AUTOCOMPLETE_RESULT response.
+        """
+        focused = interaction.focused
+        query = str(focused.get("value", "")) if focused else ""
+        choices = self.search(query, interaction.payload.get("locale"), limit)
+        return InteractionResponse(InteractionResponseType.APPLICATION_COMMAND_AUTOCOMPLETE_RESULT, InteractionCallbackAutocomplete(choices))
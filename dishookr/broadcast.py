@@ -0,0 +1,132 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import math
+import os
+import time
+
+import requests
+
+from .app import Webhook
+from .http import SessionPool
+from .ratelimit import RateLimiter
+from .circuit import CircuitBreaker
+from .exceptions import HTTPException, CircuitOpen
+from .encoding import dumps
+
+class BroadcastOutcome(NamedTuple):
+    """
+        What happened to the message sent to one webhook URL.
+    """
+    url: str
+    status: Optional[int]  # None when no response was received
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class BroadcastResult(object):
+    """
+        The outcome of a broadcast.
+    """
+    outcomes: Dict[str, BroadcastOutcome]
+    elapsed: float
+
+    def __init__(self, outcomes: Dict[str, BroadcastOutcome], elapsed: float) -> None:
+        self.outcomes = outcomes
+        self.elapsed = elapsed
+
+    @property
+    def succeeded(self) -> List[str]:
+        return [url for url, outcome in self.outcomes.items() if outcome.ok]
+
+    @property
+    def failed(self) -> List[BroadcastOutcome]:
+        return [outcome for outcome in self.outcomes.values() if not outcome.ok]
+
+    @property
+    def throughput(self) -> float:
+        """
+            The number of webhooks handled per second, successful or not.
+        """
+        return len(self.outcomes) / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return f"<BroadcastResult sent={len(self.succeeded)} failed={len(self.failed)} elapsed={self.elapsed:.2f}s throughput={self.throughput:.0f}/s>"
+
+# The state of a worker process, set once by its initializer.
+_payload: bytes = b""
+_wait: bool = False
+_senders: Optional[ThreadPoolExecutor] = None
+_session_pool: Optional[SessionPool] = None
+_rate_limiter: Optional[RateLimiter] = None
+_circuit_breaker: Optional[CircuitBreaker] = None
+
+def _init_worker(payload: bytes, wait: bool, threads: int) -> None:
+    global _payload, _wait, _senders, _session_pool, _rate_limiter, _circuit_breaker
+    _payload = payload
+    _wait = wait
+    _senders = ThreadPoolExecutor(threads, thread_name_prefix="dishookr-broadcast")
+    _session_pool = SessionPool(pool_maxsize=threads)
+    _rate_limiter = RateLimiter()
+    _circuit_breaker = CircuitBreaker()
+
+def _send_one(url: str) -> BroadcastOutcome:
+    webhook = Webhook(url, wait=_wait, session_pool=_session_pool, rate_limiter=_rate_limiter, circuit_breaker=_circuit_breaker)
+    try:
+        result = webhook.execute(_payload)
+    except HTTPException as e:
+        return BroadcastOutcome(url, e.status, str(e))
+    except (CircuitOpen, requests.RequestException) as e:
+        return BroadcastOutcome(url, None, f"{type(e).__name__}: {e}")
+    return BroadcastOutcome(url, result.status_code, None)
+
+def _send_shard(urls: List[str]) -> List[BroadcastOutcome]:
+    return list(_senders.map(_send_one, urls))
+
+def broadcast(message: Union[Webhook, dict, bytes],
+              urls: Iterable[str],
+              processes: Optional[int] = None,
+              threads: int = 16,
+              wait: bool = False) -> BroadcastResult:
+    """
+        Sends the same message to many webhooks from a pool of processes, so serialization and sending
+        aren't held back by the GIL or by the connection limit of a single process.
+
+        The message is encoded to JSON once, and only those bytes are handed to the workers. Each worker
+        sends its share of the URLs from `threads` threads, through its own session pool, rate limiter and
+        circuit breaker.
+
+        Args:
+            message (Union[Webhook, dict, bytes]): The message: a webhook (only its message is used, not its URL), its `to_dict()`, or encoded JSON.
+            urls (Iterable[str]): The webhook URLs to send to. Duplicates are sent to once.
+            processes (Optional[int], optional): The number of worker processes. Defaults to the number of CPUs.
+            threads (int, optional): The number of sending threads in each process. Defaults to 16.
+            wait (bool, optional): Whether Discord should answer with the created messages. Defaults to False.
+
+        Raises:
+            ValueError: If the webhook has files attached, which can't be broadcast.
+
+        Returns:
+            BroadcastResult: The outcome for every URL, and the throughput of the broadcast.
+    """
+    if isinstance(message, Webhook):
+        if message.files:
+            raise ValueError("Webhooks with files can't be broadcast.")
+        message._check_sendable()
+        message = message.to_dict()
+    payload = message if isinstance(message, bytes) else dumps(message)
+
+    urls = list(dict.fromkeys(urls))
+    processes = max(1, min(processes or os.cpu_count() or 1, len(urls)))
+    # A few shards per process keeps the processes busy when some shards are slower than others.
+    shard_size = max(1, math.ceil(len(urls) / (processes * 4)))
+    shards = [urls[i:i + shard_size] for i in range(0, len(urls), shard_size)]
+
+    started = time.perf_counter()
+    outcomes: Dict[str, BroadcastOutcome] = {}
+    if urls:
+        with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(payload, wait, threads)) as pool:
+            for shard in pool.map(_send_shard, shards):
+                outcomes.update((outcome.url, outcome) for outcome in shard)
+    return BroadcastResult(outcomes, time.perf_counter() - started)
@@ -0,0 +1,209 @@
+from typing import Any, Callable, Dict, List, Optional
+from enum import Enum
+import threading
+import time
+
+from .exceptions import CircuitOpen
+
+UNKNOWN_WEBHOOK = 10015  # https://discord.com/developers/docs/topics/opcodes-and-status-codes#json-json-error-codes
+
+class CircuitState(Enum):
+    """
+        The state of the circuit of one webhook URL.
+    """
+    CLOSED = "closed"  # requests are sent
+    OPEN = "open"  # requests fail fast with CircuitOpen
+    HALF_OPEN = "half_open"  # a single probe request is sent to find out whether the webhook recovered
+
+class Circuit(object):
+    """
+        The health of one webhook URL, kept by a `CircuitBreaker` while the URL is failing.
+    """
+    state: CircuitState
+    failures: int
+    permanent: bool
+    retry_at: float
+    timeout: float
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.permanent = False
+        self.retry_at = 0.0
+        self.timeout = 0.0
+        self.probe_started = 0.0
+
+class CircuitBreaker(object):
+    """
+        Tracks which webhook URLs are failing, so requests to them fail fast instead of making a round trip.
+
+        A URL answering 401 (token revoked) or 404 (webhook deleted) is opened for good and reported to `on_dead`.
+        A URL failing `failure_threshold` sends in a row with 5xx statuses, connection errors or timeouts is opened
+        for `reset_timeout` seconds; after that a single probe request is let through, closing the circuit if it
+        succeeds and reopening it for twice as long if it fails. Only failing URLs are tracked.
+    """
+    failure_threshold: int
+    reset_timeout: float
+    max_reset_timeout: float
+    on_dead: Optional[Callable[[str, int], Any]]
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 max_reset_timeout: float = 600.0,
+                 on_dead: Optional[Callable[[str, int], Any]] = None) -> None:
+        """
+            Initializes the circuit breaker.
+
+            Args:
+                failure_threshold (int, optional): The number of failed sends in a row that opens a circuit. Defaults to 5.
+                reset_timeout (float, optional): How long a circuit stays open before a probe is let through, in seconds. Defaults to 30.0.
+                max_reset_timeout (float, optional): The longest a circuit stays open after failed probes, in seconds. Defaults to 600.0.
+                on_dead (Optional[Callable[[str, int], Any]], optional): Called with the URL and status code when a webhook is found to be gone for good. It runs in the sending thread, so it should be quick. Defaults to None.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.on_dead = on_dead
+
+        self._circuits: Dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return url.split("?", 1)[0].rstrip("/")
+
+    def state(self, url: str) -> CircuitState:
+        """
+            Returns the state of a webhook URL's circuit.
+
+            Args:
+                url (str): The webhook URL.
+
+            Returns:
+                CircuitState: The state of the circuit.
+        """
+        with self._lock:
+            circuit = self._circuits.get(self._key(url))
+            return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def allow(self, url: str) -> None:
+        """
+            Checks that a request to a webhook URL may be sent, turning an open circuit half-open once its timeout is over.
+
+            Args:
+                url (str): The webhook URL.
+
+            Raises:
+                CircuitOpen: If the circuit is open, or half-open with its probe already in flight.
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(self._key(url))
+            if circuit is None or circuit.state is CircuitState.CLOSED:
+                return
+            if circuit.permanent:
+                raise CircuitOpen(url, True)
+            # A probe that never reported back (its task was cancelled, say) doesn't keep the circuit half-open forever.
+            if now >= circuit.retry_at and (circuit.state is CircuitState.OPEN or now - circuit.probe_started >= self.reset_timeout):
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probe_started = now
+                return
+            raise CircuitOpen(url, False, circuit.retry_at)
+
+    def record_success(self, url: str) -> None:
+        """
+            Records that a webhook URL answered, closing its circuit.
+
+            Args:
+                url (str): The webhook URL.
+        """
+        with self._lock:
+            self._circuits.pop(self._key(url), None)
+
+    def record_failure(self, url: str) -> None:
+        """
+            Records a failed send to a webhook URL: a 5xx status, connection error or timeout.
+
+            Args:
+                url (str): The webhook URL.
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.setdefault(self._key(url), Circuit())
+            if circuit.permanent or circuit.state is CircuitState.OPEN:
+                return  # a request sent before the circuit opened doesn't shorten its backoff
+            if circuit.state is CircuitState.HALF_OPEN:
+                timeout = min(self.max_reset_timeout, circuit.timeout * 2)
+            else:
+                circuit.failures += 1
+                if circuit.failures < self.failure_threshold:
+                    return
+                timeout = self.reset_timeout
+            circuit.state = CircuitState.OPEN
+            circuit.timeout = timeout
+            circuit.retry_at = now + timeout
+
+    def record_dead(self, url: str, status: int) -> None:
+        """
+            Records that a webhook URL is gone for good, opening its circuit permanently and calling `on_dead`.
+
+            Args:
+                url (str): The webhook URL.
+                status (int): The status code Discord answered with.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(self._key(url), Circuit())
+            if circuit.permanent:
+                return
+            circuit.state = CircuitState.OPEN
+            circuit.permanent = True
+        if self.on_dead is not None:
+            self.on_dead(url, status)
+
+    def record_response(self, url: str, status_code: int, error_code: Optional[int] = None) -> None:
+        """
+            Records the final response of a send to a webhook URL.
+
+            Args:
+                url (str): The webhook URL.
+                status_code (int): The status code of the response.
+                error_code (Optional[int], optional): The [JSON error code](https://discord.com/developers/docs/topics/opcodes-and-status-codes#json) of an error response. Defaults to None.
+        """
+        # A 404 for an unknown message (from an edit, say) still means the webhook itself is alive.
+        if status_code == 401 or (status_code == 404 and error_code in (None, UNKNOWN_WEBHOOK)):
+            self.record_dead(url, status_code)
+        elif status_code >= 500:
+            self.record_failure(url)
+        else:
+            self.record_success(url)
+
+    def reset(self, url: str) -> None:
+        """
+            Closes a webhook URL's circuit, even a permanently open one.
+
+            Args:
+                url (str): The webhook URL.
+        """
+        self.record_success(url)
+
+    def dead(self) -> List[str]:
+        """
+            Returns the webhook URLs known to be gone for good.
+
+            Returns:
+                List[str]: The dead webhook URLs, without query strings.
+        """
+        with self._lock:
+            return [key for key, circuit in self._circuits.items() if circuit.permanent]
+
+_default_breaker = CircuitBreaker()
+
+def get_default_circuit_breaker() -> CircuitBreaker:
+    """
+        Returns the circuit breaker shared by every webhook that isn't given its own.
+
+        Returns:
+            CircuitBreaker: The default circuit breaker.
+    """
+    return _default_breaker
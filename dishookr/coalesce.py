@@ -0,0 +1,206 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import inspect
+import logging
+import threading
+
+from .app import Webhook, MAX_CONTENT_LENGTH, MAX_EMBEDS
+from .objects.embed import MAX_EMBED_CHARACTERS
+
+logger = logging.getLogger(__name__)
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
+def _send_webhook(webhook: Webhook) -> Any:
+    # The default sender: the webhook's own `send`, so an AsyncWebhook gives back its coroutine.
+    return webhook.send()
+
+class WebhookCoalescer(object):
+    """
+        Buffers webhooks for a short window and packs the ones sharing a destination into as few messages as
+        Discord's limits allow: up to 2000 content characters, 10 embeds and 6000 embed characters each.
+
+        Messages with a poll, components or files can't be merged, they are sent on their own once the messages
+        buffered before them have been flushed, so ordering is preserved.
+
+        A failed send doesn't stop the others: the error is passed to `on_error`, or logged. `AsyncWebhook`s pushed
+        from a running event loop are sent on that loop.
+    """
+    window: float
+    separator: str
+    sender: Callable[[Webhook], Any]
+    on_error: Optional[Callable[[Webhook, BaseException], Any]]
+
+    def __init__(self, window: float = 1.0, sender: Optional[Callable[[Webhook], Any]] = None, separator: str = "\n", on_error: Optional[Callable[[Webhook, BaseException], Any]] = None) -> None:
+        """
+            Initializes the coalescer.
+
+            Args:
+                window (float, optional): How long, in seconds, messages are buffered before being packed and sent. Defaults to 1.0.
+                sender (Optional[Callable[[Webhook], Any]], optional): Sends a packed webhook, for example `WebhookDispatcher.submit`. Coroutines it returns are run on the event loop the webhooks were pushed from. Defaults to the webhook's own `send`.
+                separator (str, optional): The text placed between merged contents. Defaults to a new line.
+                on_error (Optional[Callable[[Webhook, BaseException], Any]], optional): Called with the packed webhook and the error when a send fails. Defaults to logging the error.
+        """
+        self.window = window
+        self.sender = sender or _send_webhook
+        self.separator = separator
+        self.on_error = on_error
+
+        self._buffers: Dict[Tuple, List[Webhook]] = {}
+        self._loops: Dict[Tuple, Optional[asyncio.AbstractEventLoop]] = {}
+        self._timers: Dict[Tuple, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(webhook: Webhook) -> Tuple:
+        # Only messages that would look the same, apart from their content and embeds, are merged.
+        return (webhook.webhook_url, webhook.thread_id, webhook.wait, webhook.username, webhook.avatar_url,
+                webhook.tts, id(webhook.allowed_mentions), id(webhook.session_pool), id(webhook.rate_limiter), id(webhook.circuit_breaker))
+
+    @staticmethod
+    def _mergeable(webhook: Webhook) -> bool:
+        return not webhook.poll and not webhook.components and not webhook.files
+
+    def push(self, webhook: Webhook) -> None:
+        """
+            Buffers a webhook until its window closes.
+
+            Args:
+                webhook (Webhook): The webhook to send. It should not be modified after being pushed.
+        """
+        key = self._key(webhook)
+        loop = _running_loop()
+        if not self._mergeable(webhook):
+            self.flush(key)
+            self._send(webhook, loop)
+            return
+
+        with self._lock:
+            self._buffers.setdefault(key, []).append(webhook)
+            self._loops[key] = loop
+            if key not in self._timers:
+                timer = self._timers[key] = threading.Timer(self.window, self.flush, args=(key,))
+                timer.daemon = True
+                timer.start()
+
+    def flush(self, key: Optional[Tuple] = None) -> List[Any]:
+        """
+            Packs and sends buffered webhooks right away. Every batch is sent even if some fail.
+
+            Args:
+                key (Optional[Tuple], optional): Only flush the buffer of this destination. Defaults to flushing every buffer.
+
+            Returns:
+                List[Any]: What the sender returned for each packed webhook, or the error it raised.
+        """
+        with self._lock:
+            keys = [key] if key is not None else list(self._buffers)
+            batches = []
+            for key in keys:
+                timer = self._timers.pop(key, None)
+                if timer is not None:
+                    timer.cancel()
+                buffered = self._buffers.pop(key, None)
+                loop = self._loops.pop(key, None)
+                if buffered:
+                    batches.append((buffered, loop))
+
+        results = []
+        for buffered, loop in batches:
+            for packed in self.pack(buffered):
+                results.append(self._send(packed, loop))
+        return results
+
+    def _send(self, webhook: Webhook, loop: Optional[asyncio.AbstractEventLoop]) -> Any:
+        # Sends one webhook, reporting rather than raising errors so the other batches still go out.
+        try:
+            result = self.sender(webhook)
+            if inspect.isawaitable(result):
+                if loop is None or loop.is_closed():
+                    if inspect.iscoroutine(result):
+                        result.close()
+                    raise TypeError("Asynchronous sends need an event loop, push AsyncWebhooks from a running event loop.")
+                result = asyncio.run_coroutine_threadsafe(_await(result), loop)
+                result.add_done_callback(lambda future: self._sent(webhook, future))
+        except Exception as e:
+            self._report(webhook, e)
+            return e
+        return result
+
+    def _sent(self, webhook: Webhook, future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            self._report(webhook, future.exception())
+
+    def _report(self, webhook: Webhook, error: BaseException) -> None:
+        if self.on_error is not None:
+            self.on_error(webhook, error)
+        else:
+            logger.error("Failed to send a coalesced message to %s", webhook.webhook_url, exc_info=error)
+
+    def pack(self, webhooks: List[Webhook]) -> List[Webhook]:
+        """
+            Merges webhooks sharing a destination into as few webhooks as possible, keeping their order.
+
+            Args:
+                webhooks (List[Webhook]): The webhooks to merge.
+
+            Returns:
+                List[Webhook]: The merged webhooks.
+        """
+        packed: List[Webhook] = []
+        current: Optional[Webhook] = None
+        embed_chars = 0
+        for webhook in webhooks:
+            chars = webhook.embed_characters()
+            if current is not None:
+                content = self._join(current.content, webhook.content)
+                if (len(content or "") > MAX_CONTENT_LENGTH or
+                        len(current.embeds) + len(webhook.embeds) > MAX_EMBEDS or
+                        embed_chars + chars > MAX_EMBED_CHARACTERS):
+                    current = None
+                else:
+                    current.content = content
+                    current.embeds.extend(webhook.embeds)
+                    embed_chars += chars
+                    continue
+
+            current = self._copy(webhook)
+            embed_chars = chars
+            packed.append(current)
+        return packed
+
+    def _join(self, first: Optional[str], second: Optional[str]) -> Optional[str]:
+        if first and second:
+            return first + self.separator + second
+        return first or second
+
+    @staticmethod
+    def _copy(webhook: Webhook) -> Webhook:
+        copy = type(webhook)(webhook.webhook_url, wait=webhook.wait, thread_id=webhook.thread_id, tts=webhook.tts,
+                             session_pool=webhook.session_pool, rate_limiter=webhook.rate_limiter, retry_policy=webhook.retry_policy,
+                             circuit_breaker=webhook.circuit_breaker, validation=webhook.validation)
+        copy.username = webhook.username
+        copy.avatar_url = webhook.avatar_url
+        copy.allowed_mentions = webhook.allowed_mentions
+        copy.content = webhook.content
+        copy.embeds = list(webhook.embeds)
+        return copy
+
+    def close(self) -> None:
+        """
+            Sends everything still buffered.
+        """
+        self.flush()
+
+    def __enter__(self) -> "WebhookCoalescer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
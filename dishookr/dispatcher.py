@@ -0,0 +1,319 @@
+from typing import Deque, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future
+from enum import Enum
+import asyncio
+import threading
+import time
+import weakref
+
+from .app import Webhook
+from .exceptions import MessageDropped, QueueFull
+from .retry import RetryPolicy
+
+class OverflowPolicy(Enum):
+    """
+        What a dispatcher does with a new message when its queue is full.
+    """
+    BLOCK = "block"  # wait for space
+    DROP_OLDEST = "drop_oldest"  # evict the message that has waited longest
+    DROP_NEWEST = "drop_newest"  # discard the new message
+    RAISE = "raise"  # raise QueueFull
+
+def _work(queue: Deque[Tuple[Webhook, Future]], condition: threading.Condition, closed: threading.Event) -> None:
+    # The loop of a WebhookDispatcher worker thread.
+    while True:
+        with condition:
+            condition.wait_for(lambda: queue or closed.is_set())
+            if not queue:
+                return
+            webhook, future = queue.popleft()
+            condition.notify_all()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(webhook.send())
+        except BaseException as e:
+            future.set_exception(e)
+
+def _drain(queue: Deque[Tuple[Webhook, Future]], condition: threading.Condition, closed: threading.Event, threads: List[threading.Thread], timeout: Optional[float]) -> None:
+    # Shuts a WebhookDispatcher down, from `shutdown`, its finalizer or at exit.
+    with condition:
+        closed.set()
+        condition.notify_all()
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for thread in threads:
+        if thread is not threading.current_thread():
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    with condition:
+        while queue:
+            _, future = queue.popleft()
+            if not future.done():
+                future.set_exception(MessageDropped("The dispatcher shut down before the message was sent."))
+
+class WebhookDispatcher(object):
+    """
+        Sends webhooks in the background from a bounded queue, drained by a pool of worker threads.
+    """
+    workers: int
+    maxsize: int
+    overflow: OverflowPolicy
+    drain_timeout: Optional[float]
+    retry_policy: Optional[RetryPolicy]
+
+    def __init__(self,
+                 workers: int = 4,
+                 maxsize: int = 10000,
+                 overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+                 drain_timeout: Optional[float] = 10.0,
+                 retry_policy: Optional[RetryPolicy] = None) -> None:
+        """
+            Initializes the dispatcher and starts its workers.
+
+            Args:
+                workers (int, optional): The number of worker threads. Defaults to 4.
+                maxsize (int, optional): The maximum number of queued messages. Defaults to 10000.
+                overflow (OverflowPolicy, optional): What to do when the queue is full. Defaults to OverflowPolicy.BLOCK.
+                drain_timeout (Optional[float], optional): How long the queue is drained for when the process exits, or when the dispatcher is garbage collected without being shut down. Defaults to 10.0.
+                retry_policy (Optional[RetryPolicy], optional): The retry policy given to submitted webhooks that don't have their own. Defaults to None.
+        """
+        if maxsize < 1:
+            raise ValueError("The queue must hold at least one message.")
+        self.workers = workers
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.drain_timeout = drain_timeout
+        self.retry_policy = retry_policy
+
+        self._queue: Deque[Tuple[Webhook, Future]] = deque()
+        self._condition = threading.Condition()
+        self._closed = threading.Event()
+        self._threads: List[threading.Thread] = []
+        # The workers and the finalizer only hold the queue, not the dispatcher, so a dispatcher dropped without
+        # being shut down is collected and drained like one still running when the process exits.
+        for i in range(workers):
+            thread = threading.Thread(target=_work, args=(self._queue, self._condition, self._closed), name=f"dishookr-dispatcher-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self._finalizer = weakref.finalize(self, _drain, self._queue, self._condition, self._closed, self._threads, drain_timeout)
+
+    def submit(self, webhook: Webhook, timeout: Optional[float] = None) -> Future:
+        """
+            Queues a fully built webhook to be sent.
+
+            Args:
+                webhook (Webhook): The webhook to send. It should not be modified after being submitted.
+                timeout (Optional[float], optional): How long to wait for space with OverflowPolicy.BLOCK. Defaults to waiting forever.
+
+            Raises:
+                QueueFull: If the queue is full and the policy is OverflowPolicy.RAISE, or the block timed out.
+                RuntimeError: If the dispatcher has been shut down.
+
+            Returns:
+                Future: Resolves to the webhook response from Discord, or fails with the error raised by `send`.
+        """
+        if self.retry_policy is not None and webhook.retry_policy is None:
+            webhook.retry_policy = self.retry_policy
+        future = Future()
+        with self._condition:
+            if self._closed.is_set():
+                raise RuntimeError("Cannot submit to a dispatcher that has been shut down.")
+            if len(self._queue) >= self.maxsize:
+                if self.overflow is OverflowPolicy.BLOCK:
+                    if not self._condition.wait_for(lambda: len(self._queue) < self.maxsize or self._closed.is_set(), timeout):
+                        raise QueueFull("Timed out waiting for space in the dispatcher queue.")
+                    if self._closed.is_set():
+                        raise RuntimeError("Cannot submit to a dispatcher that has been shut down.")
+                elif self.overflow is OverflowPolicy.DROP_OLDEST:
+                    _, dropped = self._queue.popleft()
+                    if not dropped.done():
+                        dropped.set_exception(MessageDropped("Dropped to make room for a newer message."))
+                elif self.overflow is OverflowPolicy.DROP_NEWEST:
+                    future.set_exception(MessageDropped("Dropped because the dispatcher queue is full."))
+                    return future
+                else:
+                    raise QueueFull(f"The dispatcher queue is full ({self.maxsize} messages).")
+            self._queue.append((webhook, future))
+            self._condition.notify_all()
+        return future
+
+    def pending(self) -> int:
+        """
+            Returns the number of messages waiting in the queue.
+
+            Returns:
+                int: The number of queued messages.
+        """
+        return len(self._queue)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+            Stops accepting messages and waits for the queue to drain.
+
+            Args:
+                timeout (Optional[float], optional): The deadline in seconds. Messages still queued after it fail with MessageDropped. Defaults to waiting forever.
+        """
+        self._finalizer.detach()
+        _drain(self._queue, self._condition, self._closed, self._threads, timeout)
+
+    def __enter__(self) -> "WebhookDispatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown(self.drain_timeout)
+
+class AsyncWebhookDispatcher(object):
+    """
+        Sends webhooks in the background from a bounded queue, drained by asyncio worker tasks.
+        `AsyncWebhook`s are awaited directly, blocking `Webhook`s are sent in a thread.
+    """
+    workers: int
+    maxsize: int
+    overflow: OverflowPolicy
+    drain_timeout: Optional[float]
+    retry_policy: Optional[RetryPolicy]
+
+    def __init__(self,
+                 workers: int = 16,
+                 maxsize: int = 10000,
+                 overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+                 drain_timeout: Optional[float] = 10.0,
+                 retry_policy: Optional[RetryPolicy] = None) -> None:
+        """
+            Initializes the dispatcher. Its workers start with `start`, or when used as an async context manager.
+
+            Args:
+                workers (int, optional): The number of worker tasks. Defaults to 16.
+                maxsize (int, optional): The maximum number of queued messages. Defaults to 10000.
+                overflow (OverflowPolicy, optional): What to do when the queue is full. Defaults to OverflowPolicy.BLOCK.
+                drain_timeout (Optional[float], optional): How long the queue is drained for when leaving the async context manager. Defaults to 10.0.
+                retry_policy (Optional[RetryPolicy], optional): The retry policy given to submitted webhooks that don't have their own. Defaults to None.
+        """
+        if maxsize < 1:
+            raise ValueError("The queue must hold at least one message.")
+        self.workers = workers
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.drain_timeout = drain_timeout
+        self.retry_policy = retry_policy
+
+        self._queue: Deque[Tuple[Webhook, asyncio.Future]] = deque()
+        self._condition: Optional[asyncio.Condition] = None
+        self._closed = False
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """
+            Starts the worker tasks on the running event loop.
+        """
+        if self._condition is not None:
+            return
+        self._condition = asyncio.Condition()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def submit(self, webhook: Webhook) -> asyncio.Future:
+        """
+            Queues a fully built webhook to be sent.
+
+            Args:
+                webhook (Webhook): The webhook to send. It should not be modified after being submitted.
+
+            Raises:
+                QueueFull: If the queue is full and the policy is OverflowPolicy.RAISE.
+                RuntimeError: If the dispatcher has been shut down.
+
+            Returns:
+                asyncio.Future: Resolves to the webhook response from Discord, or fails with the error raised by `send`.
+        """
+        self.start()
+        if self.retry_policy is not None and webhook.retry_policy is None:
+            webhook.retry_policy = self.retry_policy
+        future = asyncio.get_running_loop().create_future()
+        async with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a dispatcher that has been shut down.")
+            if len(self._queue) >= self.maxsize:
+                if self.overflow is OverflowPolicy.BLOCK:
+                    await self._condition.wait_for(lambda: len(self._queue) < self.maxsize or self._closed)
+                    if self._closed:
+                        raise RuntimeError("Cannot submit to a dispatcher that has been shut down.")
+                elif self.overflow is OverflowPolicy.DROP_OLDEST:
+                    _, dropped = self._queue.popleft()
+                    if not dropped.done():
+                        dropped.set_exception(MessageDropped("Dropped to make room for a newer message."))
+                elif self.overflow is OverflowPolicy.DROP_NEWEST:
+                    future.set_exception(MessageDropped("Dropped because the dispatcher queue is full."))
+                    return future
+                else:
+                    raise QueueFull(f"The dispatcher queue is full ({self.maxsize} messages).")
+            self._queue.append((webhook, future))
+            self._condition.notify_all()
+        return future
+
+    def pending(self) -> int:
+        """
+            Returns the number of messages waiting in the queue.
+
+            Returns:
+                int: The number of queued messages.
+        """
+        return len(self._queue)
+
+    async def _work(self) -> None:
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                webhook, future = self._queue.popleft()
+                self._condition.notify_all()
+            if future.cancelled():
+                continue
+            try:
+                if asyncio.iscoroutinefunction(webhook.send):
+                    result = await webhook.send()
+                else:
+                    result = await asyncio.to_thread(webhook.send)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+            Stops accepting messages and waits for the queue to drain.
+
+            Args:
+                timeout (Optional[float], optional): The deadline in seconds. Workers are cancelled after it, and messages still queued fail with MessageDropped. Defaults to waiting forever.
+        """
+        if self._condition is None:
+            self._closed = True
+            return
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        _, unfinished = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+        while self._queue:
+            _, future = self._queue.popleft()
+            if not future.done():
+                future.set_exception(MessageDropped("The dispatcher shut down before the message was sent."))
+
+    async def __aenter__(self) -> "AsyncWebhookDispatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.shutdown(self.drain_timeout)
@@ -0,0 +1,129 @@
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+from datetime import date, datetime, time
+from enum import Enum
+import json
+import threading
+
+class JSONBackend(NamedTuple):
+    """
+        A JSON library, as used by dishookr to encode payloads and decode responses.
+
+        Args:
+            name (str): The name the backend is registered under.
+            dumps (Callable[[Any], bytes]): Encodes an object to compact UTF-8 JSON, datetimes as ISO-8601 strings.
+            loads (Callable[[Union[bytes, str]], Any]): Decodes JSON, raising ValueError if it is invalid.
+    """
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+def _default(obj: Any) -> Any:
+    # The types the standard library can't encode but payloads hold.
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _stdlib() -> JSONBackend:
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_default)
+    return JSONBackend("json", lambda obj: encoder.encode(obj).encode(), json.loads)
+
+def _orjson() -> JSONBackend:
+    import orjson
+    option = orjson.OPT_NON_STR_KEYS
+    return JSONBackend("orjson", lambda obj: orjson.dumps(obj, default=_default, option=option), orjson.loads)
+
+def _msgspec() -> JSONBackend:
+    import msgspec
+    encoder = msgspec.json.Encoder(enc_hook=_default)
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return JSONBackend("msgspec", encoder.encode, loads)
+
+# The registered backends, in order of preference when picking the default one.
+BACKENDS: Dict[str, Callable[[], JSONBackend]] = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+def register_backend(name: str, factory: Callable[[], JSONBackend]) -> None:
+    """
+        Registers a JSON backend, which can then be selected with `set_default_backend`.
+
+        Args:
+            name (str): The name of the backend.
+            factory (Callable[[], JSONBackend]): Creates the backend, raising ImportError if its library isn't installed.
+    """
+    BACKENDS[name] = factory
+
+_default_backend: Optional[JSONBackend] = None
+_default_backend_lock = threading.Lock()
+
+def get_default_backend() -> JSONBackend:
+    """
+        Returns the JSON backend used by dishookr: the one set with `set_default_backend`, otherwise the first one
+        installed of orjson, msgspec and the standard library.
+
+        Returns:
+            JSONBackend: The default backend.
+    """
+    global _default_backend
+    if _default_backend is None:
+        with _default_backend_lock:
+            if _default_backend is None:
+                for factory in BACKENDS.values():
+                    try:
+                        _default_backend = factory()
+                        break
+                    except ImportError:
+                        continue
+                else:
+                    _default_backend = _stdlib()
+    return _default_backend
+
+def set_default_backend(backend: Union[str, JSONBackend]) -> None:
+    """
+        Replaces the JSON backend used by dishookr.
+
+        Args:
+            backend (Union[str, JSONBackend]): The backend, or the name it is registered under ("orjson", "msgspec" or "json").
+
+        Raises:
+            KeyError: If no backend is registered under that name.
+            ImportError: If the backend's library isn't installed.
+    """
+    global _default_backend
+    if isinstance(backend, str):
+        backend = BACKENDS[backend]()
+    with _default_backend_lock:
+        _default_backend = backend
+
+def dumps(obj: Any) -> bytes:
+    """
+        Encodes an object to JSON with the default backend.
+
+        Args:
+            obj (Any): The object, typically a message payload.
+
+        Returns:
+            bytes: The encoded JSON.
+    """
+    return (_default_backend or get_default_backend()).dumps(obj)
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+        Decodes JSON with the default backend.
+
+        Args:
+            data (Union[bytes, str]): The JSON.
+
+        Returns:
+            Any: The decoded object.
+
+        Raises:
+            ValueError: If the JSON is invalid.
+    """
+    return (_default_backend or get_default_backend()).loads(data)
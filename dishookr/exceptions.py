@@ -1,2 +1,75 @@
 class EmptyWebhook(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class ValidationError(ValueError):
+    """
+        Raised when a message breaks Discord's limits, with every violation found in it.
+
+        Attributes:
+            errors (Dict[str, Any]): The violations, nested by path like the `errors` of Discord's "Invalid Form Body" responses.
+            messages (List[str]): One "path: message" line per violation.
+    """
+    def __init__(self, errors) -> None:
+        self.errors = errors
+        self.messages = []
+        self._flatten(errors, "")
+        super().__init__(f"{len(self.messages)} validation error(s): " + "; ".join(self.messages))
+
+    def _flatten(self, node, path: str) -> None:
+        for key, child in node.items():
+            if key == "_errors":
+                self.messages.extend(f"{path}: {error['message']}" for error in child)
+            else:
+                self._flatten(child, f"{path}.{key}" if path else key)
+
+class QueueFull(Exception):
+    pass
+
+class MessageDropped(Exception):
+    pass
+
+class HTTPException(Exception):
+    """
+        Raised when Discord rejects a request.
+
+        Attributes:
+            response: The last response from Discord.
+            status (int): The HTTP status code.
+            text (str): The response body.
+            retry_after (Optional[float]): How long Discord asked to wait before retrying, in seconds.
+            attempts (int): How many times the request was sent.
+    """
+    def __init__(self, response, attempts: int = 1, retry_after=None) -> None:
+        self.response = response
+        self.status = response.status_code
+        self.text = response.text
+        self.retry_after = retry_after
+        self.attempts = attempts
+        super().__init__(f"Failed to send webhook ({self.status}) after {attempts} attempt(s): {self.text}")
+
+class RateLimited(HTTPException):
+    pass
+
+class DiscordServerError(HTTPException):
+    pass
+
+class NotFound(HTTPException):
+    pass
+
+class Unauthorized(HTTPException):
+    pass
+
+class CircuitOpen(Exception):
+    """
+        Raised instead of sending a request to a webhook URL that is known to be failing.
+
+        Attributes:
+            url (str): The webhook URL.
+            permanent (bool): Whether the webhook is gone for good (deleted or its token revoked).
+            retry_at (Optional[float]): The `time.monotonic()` value after which a request is let through again, None when permanent.
+    """
+    def __init__(self, url: str, permanent: bool, retry_at=None) -> None:
+        self.url = url
+        self.permanent = permanent
+        self.retry_at = retry_at
+        super().__init__(f"Webhook {'is dead' if permanent else 'is failing, circuit open'}: {url}")
@@ -0,0 +1,266 @@
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+import asyncio
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .transport import Transport, AsyncTransport
+from .encoding import loads
+
+class SessionPool(Transport):
+    """
+        A pool of persistent HTTP sessions, one per host.
+
+        Reusing a session keeps the underlying TCP/TLS connection alive between sends,
+        so only the first message to a host pays for the handshake.
+    """
+    pool_connections: int
+    pool_maxsize: int
+    timeout: Union[float, Tuple[float, float], None]
+    keep_alive: bool
+    transient_errors = (requests.ConnectionError,)  # safe to retry, the request never reached Discord or the connection dropped
+    timeout_errors = (requests.Timeout,)  # not retried, Discord may have received the request
+
+    def __init__(self,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 timeout: Union[float, Tuple[float, float], None] = (5.0, 30.0),
+                 keep_alive: bool = True) -> None:
+        """
+            Initializes the session pool.
+
+            Args:
+                pool_connections (int, optional): The number of connection pools to cache per session. Defaults to 10.
+                pool_maxsize (int, optional): The maximum number of connections kept open per host. Defaults to 10.
+                timeout (Union[float, Tuple[float, float], None], optional): The (connect, read) timeout in seconds. Defaults to (5.0, 30.0).
+                keep_alive (bool, optional): Whether connections are kept open between requests. Defaults to True.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+            Returns the session used for the host of the given URL, creating it if needed.
+
+            Args:
+                url (str): The URL that is about to be requested.
+
+            Returns:
+                requests.Session: The session for the URL's host.
+        """
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}"
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = self._sessions[key] = self._create_session()
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+            Sends a request through the pooled session for the URL's host.
+
+            Args:
+                method (str): The HTTP method.
+                url (str): The URL to request.
+                **kwargs: Extra arguments passed to `requests.Session.request`.
+
+            Returns:
+                requests.Response: The response.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.get_session(url).request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """
+            Closes every session in the pool.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+_default_pool: Optional[SessionPool] = None
+_default_pool_lock = threading.Lock()
+
+def get_default_pool() -> SessionPool:
+    """
+        Returns the process-wide session pool shared by every webhook that isn't given its own.
+
+        Returns:
+            SessionPool: The default session pool.
+    """
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = SessionPool()
+    return _default_pool
+
+def set_default_pool(pool: SessionPool) -> None:
+    """
+        Replaces the process-wide session pool.
+
+        Args:
+            pool (SessionPool): The pool to use by default.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        _default_pool = pool
+
+@dataclass
+class Response:
+    """
+        A fully read HTTP response, as returned by the asynchronous transport.
+
+        Args:
+            status_code (int): The HTTP status code.
+            headers (Mapping[str, str]): The response headers.
+            content (bytes): The raw response body.
+    """
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return loads(self.content)
+
+class AsyncSessionPool(AsyncTransport):
+    """
+        The asyncio counterpart of `SessionPool`, backed by [aiohttp](https://docs.aiohttp.org).
+
+        One client session is kept per event loop, and a semaphore bounds how many requests are in flight at once.
+    """
+    max_concurrency: int
+    pool_maxsize: int
+    timeout: Optional[float]
+    keep_alive: float
+
+    def __init__(self,
+                 max_concurrency: int = 100,
+                 pool_maxsize: int = 100,
+                 timeout: Optional[float] = 30.0,
+                 keep_alive: float = 15.0) -> None:
+        """
+            Initializes the asynchronous session pool.
+
+            Args:
+                max_concurrency (int, optional): The maximum number of requests in flight at once. Defaults to 100.
+                pool_maxsize (int, optional): The maximum number of open connections. Defaults to 100.
+                timeout (Optional[float], optional): The total timeout of a request in seconds. Defaults to 30.0.
+                keep_alive (float, optional): How long idle connections are kept open, in seconds. Defaults to 15.0.
+        """
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+
+        self._sessions: Dict[asyncio.AbstractEventLoop, Tuple[Any, asyncio.Semaphore]] = {}
+
+    def _get_session(self):
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is None or entry[0].closed:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError("AsyncWebhook requires aiohttp, install it with `pip install dishookr[async]`.") from None
+            for other in [other for other in self._sessions if other.is_closed()]:
+                del self._sessions[other]
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_maxsize, keepalive_timeout=self.keep_alive),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            entry = self._sessions[loop] = (session, asyncio.Semaphore(self.max_concurrency))
+        return entry
+
+    @property
+    def transient_errors(self) -> tuple:
+        import aiohttp
+        return (aiohttp.ClientConnectionError,)
+
+    @property
+    def timeout_errors(self) -> tuple:
+        return (asyncio.TimeoutError,)
+
+    async def request(self, method: str, url: str, **kwargs) -> Response:
+        """
+            Sends a request, waiting for a free slot if `max_concurrency` requests are already in flight.
+
+            Args:
+                method (str): The HTTP method.
+                url (str): The URL to request.
+                **kwargs: Extra arguments passed to `aiohttp.ClientSession.request`.
+
+            Returns:
+                Response: The fully read response.
+        """
+        session, semaphore = self._get_session()
+        async with semaphore:
+            async with session.request(method, url, **kwargs) as result:
+                content = await result.read()
+                return Response(status_code=result.status, headers=result.headers, content=content)
+
+    async def close(self) -> None:
+        """
+            Closes the session of the running event loop.
+        """
+        entry = self._sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].close()
+
+    async def __aenter__(self) -> "AsyncSessionPool":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+_default_async_pool: Optional[AsyncSessionPool] = None
+
+def get_default_async_pool() -> AsyncSessionPool:
+    """
+        Returns the process-wide asynchronous session pool shared by every `AsyncWebhook` that isn't given its own.
+
+        Returns:
+            AsyncSessionPool: The default asynchronous session pool.
+    """
+    global _default_async_pool
+    if _default_async_pool is None:
+        with _default_pool_lock:
+            if _default_async_pool is None:
+                _default_async_pool = AsyncSessionPool()
+    return _default_async_pool
@@ -0,0 +1,435 @@
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import asyncio
+import inspect
+import logging
+import threading
+
+from .app import Webhook, EDITABLE_FIELDS
+from .transport import Transport
+from .ratelimit import RateLimiter
+from .circuit import CircuitBreaker
+from .encoding import dumps, loads
+from .objects.enums import InteractionType
+from .objects.interaction_response import InteractionResponse
+from .objects.interaction_callback import InteractionCallbackMessage
+from .signature import SignatureVerifier
+
+logger = logging.getLogger(__name__)
+
+API_BASE = "https://discord.com/api/v10"
+PONG = dumps({"type": 1})
+# What a handler that overruns its budget is answered with: commands and modals get a "thinking..." message,
+# components keep their message as is until it is edited.
+DEFERRED = {2: dumps({"type": 5}), 3: dumps({"type": 6}), 5: dumps({"type": 5})}
+UNAUTHORIZED = dumps({"error": "Invalid request signature."})
+STATUS_LINES = {200: "200 OK", 400: "400 Bad Request", 401: "401 Unauthorized", 404: "404 Not Found", 405: "405 Method Not Allowed"}
+_HANDLER = None  # the key a route is stored under in a trie node, never a character
+
+class Interaction(object):
+    """
+        An interaction received from Discord.
+        - https://discord.com/developers/docs/interactions/receiving-and-responding#interaction-object
+
+        Attributes:
+            payload (dict): The interaction as sent by Discord.
+            type (int): The interaction type, see `InteractionType`.
+            id (str): The ID of the interaction.
+            application_id (str): The ID of the application.
+            token (str): The token to follow up with, valid for 15 minutes.
+            data (dict): The interaction data; empty for PINGs.
+    """
+    __slots__ = ("payload", "type", "id", "application_id", "token", "data")
+
+    def __init__(self, payload: dict) -> None:
+        self.payload = payload
+        self.type = payload["type"]
+        self.id = payload.get("id")
+        self.application_id = payload.get("application_id")
+        self.token = payload.get("token")
+        self.data = payload.get("data") or {}
+
+    @property
+    def name(self) -> Optional[str]:
+        """ The name of the invoked command, for commands and autocompletes. """
+        return self.data.get("name")
+
+    @property
+    def custom_id(self) -> Optional[str]:
+        """ The custom ID of the component or modal, for component interactions and modal submits. """
+        return self.data.get("custom_id")
+
+    @property
+    def webhook_url(self) -> str:
+        """ The URL of the webhook to edit the response and send follow-up messages with, usable for 15 minutes. """
+        return f"{API_BASE}/webhooks/{self.application_id}/{self.token}"
+
+    @property
+    def values(self) -> List[str]:
+        """ The selected values, for select menus. """
+        return self.data.get("values") or []
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """ The command options by name, with sub-command options flattened. """
+        options: Dict[str, Any] = {}
+        pending = list(self.data.get("options") or [])
+        while pending:
+            option = pending.pop()
+            if "options" in option:
+                pending.extend(option["options"])
+            elif "value" in option:
+                options[option["name"]] = option["value"]
+        return options
+
+    @property
+    def focused(self) -> Optional[dict]:
+        """ The option being typed in, for autocompletes. """
+        pending = list(self.data.get("options") or [])
+        while pending:
+            option = pending.pop()
+            if option.get("focused"):
+                return option
+            pending.extend(option.get("options") or [])
+        return None
+
+Handler = Callable[[Interaction], Union[InteractionResponse, dict, bytes, Awaitable[Any]]]
+Route = Tuple[Handler, Optional[float]]  # a handler and the latency budget it was registered with
+
+class _Routes(object):
+    # The routes of one interaction type: a hash lookup by exact key, then the longest registered prefix in a trie.
+    __slots__ = ("exact", "trie", "has_prefixes")
+
+    def __init__(self) -> None:
+        self.exact: Dict[str, Route] = {}
+        self.trie: dict = {}
+        self.has_prefixes = False
+
+    def add(self, key: str, route: Route, prefix: bool) -> None:
+        if not prefix:
+            self.exact[key] = route
+            return
+        node = self.trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[_HANDLER] = route
+        self.has_prefixes = True
+
+    def find(self, key: Optional[str]) -> Optional[Route]:
+        if key is None:
+            return None
+        route = self.exact.get(key)
+        if route is not None or not self.has_prefixes:
+            return route
+        node = self.trie
+        found = node.get(_HANDLER)
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(_HANDLER, found)
+        return found
+
+class InteractionApp(object):
+    """
+        An interaction endpoint, usable as an ASGI application or, through `wsgi`, as a WSGI application:
+
+            app = InteractionApp(public_key="...")  # from the developer portal
+
+            @app.command("ping")
+            def ping(interaction):
+                return InteractionResponse(InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE, InteractionCallbackMessage(content="Pong!"))
+
+            @app.component("vote:", prefix=True)  # vote:yes, vote:no, ...
+            def vote(interaction): ...
+
+        Requests are checked against the application's public key, then PINGs are answered with a PONG without
+        running any handler. Other interactions are routed by command name or custom ID with a hash lookup, then to
+        the handler of the longest matching prefix. Handlers may be coroutine functions, and return an
+        `InteractionResponse`, its dictionary, or encoded JSON.
+
+        Discord drops interactions that aren't answered within 3 seconds. Handlers given a latency budget with
+        `defer_after` run in a worker pool; if one hasn't returned within its budget, the interaction is deferred
+        right away and the handler's message is delivered through the interaction's webhook once it returns.
+    """
+    fallback: Optional[Handler]
+    verifier: Optional[SignatureVerifier]
+    defer_after: Optional[float]
+    follow_up: bool
+    executor: Optional[Executor]
+    session_pool: Optional[Transport]
+
+    def __init__(self, public_key: Optional[Union[str, SignatureVerifier]] = None, fallback: Optional[Handler] = None, defer_after: Optional[float] = None, follow_up: bool = False, executor: Optional[Executor] = None, session_pool: Optional[Transport] = None) -> None:
+        """
+            Initializes the app.
+
+            Args:
+                public_key (Optional[Union[str, SignatureVerifier]], optional): The public key of the application, or a configured verifier. Requests without a valid signature are answered with 401, as Discord requires. Defaults to None, which skips verification, for apps behind a proxy that already verifies.
+                fallback (Optional[Handler], optional): Handles interactions no other handler matches. Defaults to answering 404.
+                defer_after (Optional[float], optional): The latency budget of handlers registered without one, in seconds. Defaults to None, which runs them inline and never defers.
+                follow_up (bool, optional): Whether the message of a deferred handler is sent as a follow-up message rather than as an edit of the original response. Defaults to False.
+                executor (Optional[Executor], optional): The worker pool that handlers with a budget, and plain handlers under ASGI, run in. Defaults to a thread pool created on first use.
+                session_pool (Optional[Transport], optional): The transport deferred messages are delivered through. Defaults to the shared pool.
+        """
+        if isinstance(public_key, str):
+            public_key = SignatureVerifier(public_key)
+        self.verifier = public_key
+        self.fallback = fallback
+        self.defer_after = defer_after
+        self.follow_up = follow_up
+        self.executor = executor
+        self.session_pool = session_pool
+        self._owns_executor = False
+        self._executor_lock = threading.Lock()
+        self._routes: Dict[int, _Routes] = {interaction_type.value: _Routes() for interaction_type in InteractionType}
+
+    def route(self, interaction_type: InteractionType, key: str, handler: Handler, prefix: bool = False, defer_after: Optional[float] = None) -> None:
+        """
+            Registers a handler.
+
+            Args:
+                interaction_type (InteractionType): The type of interactions it handles.
+                key (str): The command name, for commands and autocompletes, or the custom ID, for components and modals.
+                handler (Handler): Called with the `Interaction`, returns the response.
+                prefix (bool, optional): Whether the handler handles every key starting with `key`. Defaults to False.
+                defer_after (Optional[float], optional): The handler's latency budget, in seconds. Defaults to the app's `defer_after`.
+
+            Raises:
+                ValueError: If a budget is given for autocompletes, which can't be deferred.
+        """
+        interaction_type = InteractionType(interaction_type)
+        if defer_after is not None and interaction_type.value not in DEFERRED:
+            raise ValueError(f"{interaction_type.name} interactions can't be deferred.")
+        self._routes[interaction_type.value].add(key, (handler, defer_after), prefix)
+
+    def _decorator(self, interaction_type: InteractionType, key: str, prefix: bool, defer_after: Optional[float] = None) -> Callable[[Handler], Handler]:
+        def register(handler: Handler) -> Handler:
+            self.route(interaction_type, key, handler, prefix, defer_after)
+            return handler
+        return register
+
+    def command(self, name: str, defer_after: Optional[float] = None) -> Callable[[Handler], Handler]:
+        """ Registers the handler of an application command, by name, with an optional latency budget. """
+        return self._decorator(InteractionType.APPLICATION_COMMAND, name, False, defer_after)
+
+    def autocomplete(self, name: str) -> Callable[[Handler], Handler]:
+        """ Registers the autocomplete handler of an application command, by name. """
+        return self._decorator(InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE, name, False)
+
+    def component(self, custom_id: str, prefix: bool = False, defer_after: Optional[float] = None) -> Callable[[Handler], Handler]:
+        """ Registers the handler of a button or select menu, by custom ID or custom ID prefix, with an optional latency budget. """
+        return self._decorator(InteractionType.MESSAGE_COMPONENT, custom_id, prefix, defer_after)
+
+    def modal(self, custom_id: str, prefix: bool = False, defer_after: Optional[float] = None) -> Callable[[Handler], Handler]:
+        """ Registers the handler of a modal submit, by custom ID or custom ID prefix, with an optional latency budget. """
+        return self._decorator(InteractionType.MODAL_SUBMIT, custom_id, prefix, defer_after)
+
+    def find(self, interaction: Interaction) -> Optional[Handler]:
+        """
+            Returns the handler of an interaction.
+
+            Args:
+                interaction (Interaction): The interaction.
+
+            Returns:
+                Optional[Handler]: The handler, the fallback if none matches, or None.
+        """
+        route = self._find(interaction)
+        return route[0] if route is not None else self.fallback
+
+    def _find(self, interaction: Interaction) -> Optional[Route]:
+        routes = self._routes.get(interaction.type)
+        if routes is None:
+            return None
+        data = interaction.data
+        return routes.find(data.get("custom_id") if interaction.type in (3, 5) else data.get("name"))
+
+    def _prepare(self, body: bytes, headers: Mapping[str, str]) -> Union[Tuple[int, bytes], Tuple[Handler, Optional[float], Interaction]]:
+        # Either an immediate answer (status, body), or the handler to run with its latency budget.
+        verifier = self.verifier
+        if verifier is not None and not verifier.verify(body, headers.get("x-signature-ed25519"), headers.get("x-signature-timestamp")):
+            return 401, UNAUTHORIZED
+        try:
+            interaction = Interaction(loads(body))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return 400, dumps({"error": "Invalid interaction payload."})
+        if interaction.type == 1:
+            return 200, PONG
+        route = self._find(interaction)
+        handler, budget = route if route is not None else (self.fallback, None)
+        if handler is None:
+            return 404, dumps({"error": "No handler for this interaction."})
+        if interaction.type not in DEFERRED:
+            budget = None
+        elif budget is None:
+            budget = self.defer_after
+        return handler, budget, interaction
+
+    def _pool(self) -> Executor:
+        if self.executor is None:
+            with self._executor_lock:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(thread_name_prefix="dishookr-interactions")
+                    self._owns_executor = True
+        return self.executor
+
+    @staticmethod
+    def _run(handler: Handler, interaction: Interaction) -> Any:
+        # Runs a handler to completion in a worker thread.
+        result = handler(interaction)
+        if inspect.isawaitable(result):
+            result = asyncio.run(result)
+        return result
+
+    def _deliver_later(self, interaction: Interaction, future: Union[Future, "asyncio.Future"]) -> None:
+        # Called once a deferred handler returns, possibly on the event loop: the request is made in the pool.
+        self._pool().submit(self._deliver, interaction, future)
+
+    def _deliver(self, interaction: Interaction, future: Union[Future, "asyncio.Future"]) -> None:
+        # Sends the message of a deferred handler through the interaction's webhook.
+        try:
+            message = self._message(future.result())
+            if not message:
+                return
+            # Every interaction token is its own webhook URL that expires after 15 minutes, so the shared limiter
+            # and circuit breaker would keep an entry for each one; a delivery gets its own, dropped with it.
+            webhook = Webhook(interaction.webhook_url, wait=True, session_pool=self.session_pool,
+                              rate_limiter=RateLimiter(), circuit_breaker=CircuitBreaker())
+            if self.follow_up:
+                webhook.execute(message)
+            else:
+                webhook.execute_edit({key: value for key, value in message.items() if key in EDITABLE_FIELDS}, "@original")
+        except Exception:
+            logger.exception("The deferred handler of interaction %s failed, or its message could not be delivered", interaction.id)
+
+    @staticmethod
+    def _message(result: Any) -> dict:
+        # The message of a handler's response, as sent through the interaction's webhook.
+        if isinstance(result, bytes):
+            result = loads(result)
+        if isinstance(result, InteractionResponse):
+            return result.data.to_dict() if result.data is not None else {}
+        if isinstance(result, InteractionCallbackMessage):
+            return result.to_dict()
+        if "type" in result:
+            return result.get("data") or {}
+        return result
+
+    def close(self) -> None:
+        """
+            Waits for deferred handlers to return and their messages to be delivered, then shuts the worker pool down
+            if the app created it. Called on ASGI lifespan shutdown.
+        """
+        with self._executor_lock:
+            executor, owned = self.executor, self._owns_executor
+            if owned:
+                self.executor = None
+                self._owns_executor = False
+        if owned:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _encode(result: Any) -> bytes:
+        if isinstance(result, bytes):
+            return result
+        if isinstance(result, InteractionResponse):
+            return dumps(result.to_dict())
+        return dumps(result)
+
+    def handle(self, body: bytes, headers: Mapping[str, str]) -> Tuple[int, bytes]:
+        """
+            Answers an interaction request, running the handler in the calling thread unless it has a latency budget.
+
+            Args:
+                body (bytes): The raw request body.
+                headers (Mapping[str, str]): The request headers, with lowercase names.
+
+            Returns:
+                Tuple[int, bytes]: The HTTP status and the JSON response body.
+        """
+        prepared = self._prepare(body, headers)
+        if isinstance(prepared[0], int):
+            return prepared
+        handler, budget, interaction = prepared
+        if budget is None:
+            return 200, self._encode(self._run(handler, interaction))
+
+        future = self._pool().submit(self._run, handler, interaction)
+        try:
+            result = future.result(timeout=budget)
+        except FutureTimeoutError:
+            future.add_done_callback(lambda done: self._deliver_later(interaction, done))
+            return 200, DEFERRED[interaction.type]
+        return 200, self._encode(result)
+
+    async def handle_async(self, body: bytes, headers: Mapping[str, str]) -> Tuple[int, bytes]:
+        """
+            Answers an interaction request. Handlers that are coroutine functions are awaited on the event loop; the
+            others run in the worker pool, so a blocking handler doesn't hold up other requests.
+
+            Args:
+                body (bytes): The raw request body.
+                headers (Mapping[str, str]): The request headers, with lowercase names.
+
+            Returns:
+                Tuple[int, bytes]: The HTTP status and the JSON response body.
+        """
+        prepared = self._prepare(body, headers)
+        if isinstance(prepared[0], int):
+            return prepared
+        handler, budget, interaction = prepared
+        if inspect.iscoroutinefunction(handler):
+            task = asyncio.ensure_future(handler(interaction))
+        else:
+            task = asyncio.get_running_loop().run_in_executor(self._pool(), self._run, handler, interaction)
+        if budget is None:
+            return 200, self._encode(await task)
+
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), budget)
+        except asyncio.TimeoutError:
+            task.add_done_callback(lambda done: self._deliver_later(interaction, done))
+            return 200, DEFERRED[interaction.type]
+        return 200, self._encode(result)
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        # The ASGI application.
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await asyncio.get_running_loop().run_in_executor(None, self.close)
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            status, body = 405, dumps({"error": "Method not allowed."})
+        else:
+            chunks = []
+            more = True
+            while more:
+                message = await receive()
+                chunks.append(message.get("body", b""))
+                more = message.get("more_body", False)
+            headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]}
+            status, body = await self.handle_async(b"".join(chunks), headers)
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]})
+        await send({"type": "http.response.body", "body": body})
+
+    def wsgi(self, environ: dict, start_response: Callable) -> List[bytes]:
+        """
+            The WSGI application, for servers such as gunicorn or waitress: `gunicorn module:app.wsgi`.
+        """
+        if environ["REQUEST_METHOD"] != "POST":
+            status, body = 405, dumps({"error": "Method not allowed."})
+        else:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            headers = {key[5:].replace("_", "-").lower(): value for key, value in environ.items() if key.startswith("HTTP_")}
+            status, body = self.handle(environ["wsgi.input"].read(length), headers)
+        start_response(STATUS_LINES.get(status, str(status)), [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+        return [body]
@@ -0,0 +1,241 @@
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+import traceback
+
+from .app import Webhook, MAX_EMBEDS
+from .objects.embed import Embed, MAX_EMBED_CHARACTERS
+from .transport import Transport
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+LEVEL_COLORS: Dict[int, int] = {
+    logging.DEBUG: 0x95A5A6,
+    logging.INFO: 0x3498DB,
+    logging.WARNING: 0xF1C40F,
+    logging.ERROR: 0xE74C3C,
+    logging.CRITICAL: 0x992D22,
+}
+
+MAX_DESCRIPTION_LENGTH = 4096
+
+class DiscordHandler(logging.handlers.QueueHandler):
+    """
+        A logging handler that posts records to a Discord webhook as embeds.
+
+        Records are put on a bounded queue and sent by a background thread, so logging never waits on Discord.
+        When the queue is full new records are dropped and counted, and the next message mentions how many were lost.
+        Records gathered during `flush_interval` are packed into as few messages as the embed limits allow.
+    """
+    webhook_url: str
+    capacity: int
+    flush_interval: float
+    username: Optional[str]
+    avatar_url: Optional[str]
+    dropped: int
+
+    def __init__(self,
+                 webhook_url: str,
+                 level: int = logging.NOTSET,
+                 capacity: int = 1000,
+                 flush_interval: float = 2.0,
+                 username: Optional[str] = None,
+                 avatar_url: Optional[str] = None,
+                 thread_id: Optional[int] = None,
+                 session_pool: Optional[Transport] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None) -> None:
+        """
+            Initializes the handler and starts its sending thread.
+
+            Args:
+                webhook_url (str): The URL of the webhook.
+                level (int, optional): The minimum level of the records sent. Defaults to logging.NOTSET.
+                capacity (int, optional): The maximum number of records waiting to be sent. Defaults to 1000.
+                flush_interval (float, optional): How long, in seconds, records are gathered before being sent together. Defaults to 2.0.
+                username (Optional[str], optional): Overrides the username of the webhook. Defaults to None.
+                avatar_url (Optional[str], optional): Overrides the avatar of the webhook. Defaults to None.
+                thread_id (Optional[int], optional): The thread ID to send the messages to. Defaults to None.
+                session_pool (Optional[Transport], optional): The session pool, or any other transport, to send through. Defaults to the shared pool.
+                rate_limiter (Optional[RateLimiter], optional): The rate limiter to respect. Defaults to the shared limiter.
+                retry_policy (Optional[RetryPolicy], optional): How failed sends are retried. Defaults to the shared policy.
+        """
+        if capacity < 1:
+            raise ValueError("The queue must hold at least one record.")
+        super().__init__(queue.Queue(maxsize=capacity))
+        self.setLevel(level)
+        self.webhook_url = webhook_url
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.username = username
+        self.avatar_url = avatar_url
+        self.dropped = 0
+
+        self._webhook_kwargs = dict(thread_id=thread_id, session_pool=session_pool, rate_limiter=rate_limiter, retry_policy=retry_policy)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._listen, name="dishookr-logging", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Records logged while sending (by urllib3 for example) would otherwise feed back into the queue forever.
+        if record.thread == self._thread.ident:
+            return
+        super().emit(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, the traceback is kept apart from the message so it gets its own code block.
+        # Only strings cross the queue; exc_info would keep every frame of the traceback alive.
+        message = record.getMessage()
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.message = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
+
+    def to_embed(self, record: logging.LogRecord) -> Embed:
+        """
+            Turns a prepared record into an embed. Override it to change how records look.
+
+            Args:
+                record (logging.LogRecord): The record to convert.
+
+            Returns:
+                Embed: The embed showing the record.
+        """
+        description = record.getMessage()
+        if record.exc_text:
+            # Keep the end of long tracebacks, it is where the error is.
+            room = MAX_DESCRIPTION_LENGTH - len(description) - len("\n```py\n\n```") - 1
+            exc_text = record.exc_text if len(record.exc_text) <= room else "…" + record.exc_text[-room + 1:]
+            description = f"{description}\n```py\n{exc_text}\n```" if room > 1 else description
+        if len(description) > MAX_DESCRIPTION_LENGTH:
+            description = description[:MAX_DESCRIPTION_LENGTH - 1] + "…"
+
+        embed = Embed(
+            title=record.levelname[:256],
+            description=description,
+            color=self._color(record.levelno),
+            timestamp=datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+        )
+        embed.add_field("Logger", record.name[:1024], inline=True)
+        embed.add_field("Module", record.module[:1024], inline=True)
+        embed.add_field("Line", str(record.lineno), inline=True)
+        return embed
+
+    @staticmethod
+    def _color(levelno: int) -> int:
+        color = LEVEL_COLORS[logging.DEBUG]
+        for level, level_color in sorted(LEVEL_COLORS.items()):
+            if levelno >= level:
+                color = level_color
+        return color
+
+    def _listen(self) -> None:
+        while True:
+            deadline = time.monotonic() + self.flush_interval
+            records = []
+            while len(records) < self.capacity:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0 or self._stop.is_set():
+                    break
+                try:
+                    record = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if record is None:  # woken up by close
+                    break
+                records.append(record)
+            stopping = self._stop.is_set()
+            if stopping:
+                while True:
+                    try:
+                        record = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is not None:
+                        records.append(record)
+            if records or self.dropped:
+                self._send(records)
+            if stopping:
+                return
+
+    def _send(self, records: List[logging.LogRecord]) -> None:
+        dropped, self.dropped = self.dropped, 0
+        content = f"{dropped} log record{'s' if dropped != 1 else ''} dropped, the queue was full." if dropped else None
+
+        embeds: List[Embed] = []
+        for record in records:
+            try:
+                embeds.append(self.to_embed(record))
+            except Exception:
+                self.handleError(record)
+
+        for webhook in self._pack(embeds, content):
+            try:
+                webhook.send()
+            except Exception:
+                # There is no record to blame for a failed send; report it the way logging reports handler errors.
+                if logging.raiseExceptions:
+                    traceback.print_exc()
+
+    def _pack(self, embeds: List[Embed], content: Optional[str]) -> List[Webhook]:
+        webhooks: List[Webhook] = []
+        current: Optional[Webhook] = None
+        chars = 0
+        for embed in embeds:
+            embed_chars = embed.total_characters()
+            if current is None or len(current.embeds) >= MAX_EMBEDS or chars + embed_chars > MAX_EMBED_CHARACTERS:
+                current = self._webhook()
+                webhooks.append(current)
+                chars = 0
+            current.embeds.append(embed)
+            chars += embed_chars
+        if content:
+            if not webhooks:
+                webhooks.append(self._webhook())
+            webhooks[0].content = content
+        return webhooks
+
+    def _webhook(self) -> Webhook:
+        webhook = Webhook(self.webhook_url, **self._webhook_kwargs)
+        webhook.username = self.username
+        webhook.avatar_url = self.avatar_url
+        return webhook
+
+    def flush(self) -> None:
+        """
+            Does nothing; records are sent by the background thread every `flush_interval`, and on `close`.
+        """
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """
+            Sends the queued records and stops the background thread.
+
+            Args:
+                timeout (Optional[float], optional): How long to wait for the queued records to be sent. Defaults to 10.0.
+        """
+        self._stop.set()
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass  # the thread is busy and will see the stop flag
+        if self._thread.is_alive() and threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+        atexit.unregister(self.close)
+        super().close()
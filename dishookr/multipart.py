@@ -0,0 +1,75 @@
+from typing import AsyncIterator, Iterator, List
+import asyncio
+import uuid
+
+from .objects.attachment import File
+from .encoding import dumps
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+class MultipartEncoder(object):
+    """
+        Streams a `multipart/form-data` body made of a `payload_json` part and one part per file.
+
+        The body's length is known up front, so it is sent with a `Content-Length` header, and it can be
+        iterated again when a request has to be retried.
+    """
+    payload: dict
+    files: List[File]
+    boundary: str
+    chunk_size: int
+
+    def __init__(self, payload: dict, files: List[File], chunk_size: int = 64 * 1024) -> None:
+        """
+            Initializes the encoder.
+
+            Args:
+                payload (dict): The JSON payload of the message.
+                files (List[File]): The files to upload, sent as `files[0]`, `files[1]`, ...
+                chunk_size (int, optional): The size of the chunks files are read in. Defaults to 64 KiB.
+        """
+        self.payload = payload
+        self.files = files
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size
+
+        self._payload_part = (
+            f"--{self.boundary}\r\n"
+            'Content-Disposition: form-data; name="payload_json"\r\n'
+            "Content-Type: application/json\r\n\r\n"
+        ).encode() + dumps(payload) + b"\r\n"
+        self._file_headers = [
+            (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="files[{index}]"; filename="{_quote(file.filename)}"\r\n'
+                f"Content-Type: {file.content_type}\r\n\r\n"
+            ).encode()
+            for index, file in enumerate(files)
+        ]
+        self._closing = f"--{self.boundary}--\r\n".encode()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return (len(self._payload_part) + len(self._closing) +
+                sum(len(header) + file.size + 2 for header, file in zip(self._file_headers, self.files)))
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._payload_part
+        for header, file in zip(self._file_headers, self.files):
+            yield header
+            yield from file.iter_chunks(self.chunk_size)
+            yield b"\r\n"
+        yield self._closing
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # Disk reads happen in a worker thread so they never stall the event loop.
+        chunks = iter(self)
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
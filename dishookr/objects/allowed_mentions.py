@@ -1,10 +1,13 @@
 from typing import List, Optional
+from .serializer import serializer
 
 class AllowedMentions:
     """
     Represents allowed mentions in a message.
     - https://discord.com/developers/docs/resources/channel#allowed-mentions-object-allowed-mention-types
     """
+    __slots__ = ("parse", "roles", "users", "replied_user")
+
     parse: Optional[List[str]]
     roles: Optional[List[int]]
     users: Optional[List[int]]
@@ -29,16 +32,4 @@ class AllowedMentions:
         self.users = users
         self.replied_user = replied_user
 
-    def __dict__(self):
-        """
-        Returns the dictionary representation of the allowed mentions.
-
-        Returns:
-            dict: The dictionary representation of the allowed mentions.
-        """
-        return {
-            "parse": self.parse,
-            "roles": self.roles,
-            "users": self.users,
-            "replied_user": self.replied_user
-        }
+    to_dict = serializer("parse", "roles", "users", "replied_user")
@@ -0,0 +1,98 @@
+from typing import BinaryIO, Iterator, Optional, Union
+import mimetypes
+import os
+
+class File(object):
+    """
+        Represents a file attached to a webhook message. The file is streamed from disk when the message is sent,
+        never read into memory as a whole.
+        - https://discord.com/developers/docs/reference#uploading-files
+    """
+    fp: Union[str, os.PathLike, BinaryIO]
+    filename: str
+    description: Optional[str]
+    spoiler: bool
+    content_type: str
+    size: int
+
+    def __init__(self,
+                 fp: Union[str, os.PathLike, BinaryIO],
+                 filename: Optional[str] = None,
+                 description: Optional[str] = None,
+                 spoiler: bool = False) -> None:
+        """
+            Initializes a new instance of the File class.
+
+            Args:
+                fp (Union[str, os.PathLike, BinaryIO]): A path to the file, or a seekable binary file object positioned at the start of the data.
+                filename (Optional[str], optional): The name Discord shows for the file. Defaults to the name of the file on disk.
+                description (Optional[str], optional): The description (alt text) of the file. Defaults to None.
+                spoiler (bool, optional): Whether the file is hidden behind a spoiler. Defaults to False.
+
+            Raises:
+                ValueError: If no filename is given and none can be derived from `fp`.
+        """
+        if isinstance(fp, (str, os.PathLike)):
+            self._start = 0
+            self.size = os.path.getsize(fp)
+            filename = filename or os.path.basename(os.fspath(fp))
+        else:
+            self._start = fp.tell()
+            self.size = fp.seek(0, os.SEEK_END) - self._start
+            fp.seek(self._start)
+            filename = filename or os.path.basename(getattr(fp, "name", "") or "")
+        if not filename:
+            raise ValueError("A filename is required for file objects without a name.")
+        if description and len(description) > 1024:
+            raise ValueError("File description cannot exceed 1024 characters.")
+
+        self.fp = fp
+        self.filename = f"SPOILER_{filename}" if spoiler and not filename.startswith("SPOILER_") else filename
+        self.description = description
+        self.spoiler = spoiler
+        self.content_type = mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+
+    def iter_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+            Reads the file from the start, one chunk at a time. Only the `size` bytes the file had when it was attached
+            are read, so a file that is still being written (a log, say) can't outgrow the length the body was sent with.
+
+            Args:
+                chunk_size (int, optional): The size of each chunk in bytes. Defaults to 64 KiB.
+
+            Returns:
+                Iterator[bytes]: The chunks of the file.
+
+            Raises:
+                ValueError: If the file got shorter than `size` after it was attached.
+        """
+        if isinstance(self.fp, (str, os.PathLike)):
+            with open(self.fp, "rb") as fp:
+                yield from self._read(fp, chunk_size)
+        else:
+            self.fp.seek(self._start)
+            yield from self._read(self.fp, chunk_size)
+
+    def _read(self, fp: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+        remaining = self.size
+        while remaining > 0:
+            chunk = fp.read(min(chunk_size, remaining))
+            if not chunk:
+                raise ValueError(f"{self.filename} got shorter than its {self.size} bytes after it was attached.")
+            remaining -= len(chunk)
+            yield chunk
+
+    def to_attachment(self, index: int) -> dict:
+        """
+            Returns the [attachment object](https://discord.com/developers/docs/resources/message#attachment-object) referencing this file.
+
+            Args:
+                index (int): The position of the file in the message, matching its `files[n]` form field.
+
+            Returns:
+                dict: The dictionary representation of the attachment, without a description if it has none.
+        """
+        attachment = {"id": index, "filename": self.filename}
+        if self.description:
+            attachment["description"] = self.description
+        return attachment
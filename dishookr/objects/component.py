@@ -2,8 +2,9 @@ from typing import List, Optional, Union, Dict
 from dataclasses import dataclass, field
 
 from .emoji import ComponentPartialEmoji
+from .serializer import serializer, nested, nested_list
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     """
         Represents a component in a Discord message.
@@ -14,18 +15,9 @@ class Component:
     """
     type: int
 
-    def __dict__(self) -> Dict[str, Union[int]]:
-        """
-        Returns the dictionary representation of the component.
+    to_dict = serializer("type")
 
-        Returns:
-            dict: The dictionary representation of the component.
-        """
-        return {
-            "type": self.type
-        }
-
-@dataclass
+@dataclass(slots=True)
 class ActionRow(Component):
     """
         Represents an Action Row component in a Discord message.
@@ -37,19 +29,9 @@ class ActionRow(Component):
     components: List[Union['Button', 'StringSelect', 'TextInput', 'UserSelect', 'RoleSelect', 'MentionableSelect', 'ChannelSelect']]
     type: int = field(init=False, default=1)
 
-    def __dict__(self) -> Dict[str, Union[int, List]]:
-        """
-        Returns the dictionary representation of the Action Row component.
-
-        Returns:
-            dict: The dictionary representation of the Action Row component.
-        """
-        return {
-            "type": self.type,
-            "components": [component.__dict__() for component in self.components]
-        }
+    to_dict = serializer("type", nested_list("components", omit_empty=False))
 
-@dataclass
+@dataclass(slots=True)
 class Button(Component):
     """
         Represents a Button component in a Discord message.
@@ -71,26 +53,9 @@ class Button(Component):
     disabled: Optional[bool] = None
     type: int = field(init=False, default=2)
 
-    def __dict__(self) -> Dict[str, Union[int, Optional[str], Optional[Dict[str, Union[str, int]]], Optional[bool]]]:
-        """
-        Returns the dictionary representation of the Button component.
+    to_dict = serializer("type", "style", "label", "custom_id", "url", "disabled", nested("emoji"))
 
-        Returns:
-            dict: The dictionary representation of the Button component.
-        """
-        button_dict = {
-            "type": self.type,
-            "style": self.style,
-            "label": self.label,
-            "custom_id": self.custom_id,
-            "url": self.url,
-            "disabled": self.disabled
-        }
-        if self.emoji:
-            button_dict["emoji"] = self.emoji.__dict__()
-        return button_dict
-
-@dataclass
+@dataclass(slots=True)
 class StringSelect(Component):
     """
         Represents a String Select component in a Discord message.
@@ -110,28 +75,11 @@ class StringSelect(Component):
     min_values: Optional[int]
     max_values: Optional[int]
     disabled: Optional[bool]
+    type: int = field(init=False, default=3)
 
-    def __post_init__(self):
-        super().__init__(type=3)
-
-    def __dict__(self) -> Dict[str, Union[int, str, List[Dict[str, Union[str, int]]], Optional[bool]]]:
-        """
-        Returns the dictionary representation of the String Select component.
+    to_dict = serializer("type", "custom_id", "options", "placeholder", "min_values", "max_values", "disabled")
 
-        Returns:
-            dict: The dictionary representation of the String Select component.
-        """
-        return {
-            "type": self.type,
-            "custom_id": self.custom_id,
-            "options": self.options,
-            "placeholder": self.placeholder,
-            "min_values": self.min_values,
-            "max_values": self.max_values,
-            "disabled": self.disabled
-        }
-
-@dataclass
+@dataclass(slots=True)
 class TextInput(Component):
     """
         Represents a Text Input component in a Discord message.
@@ -155,30 +103,11 @@ class TextInput(Component):
     placeholder: Optional[str]
     required: Optional[bool]
     value: Optional[str]
+    type: int = field(init=False, default=4)
 
-    def __post_init__(self):
-        super().__init__(type=4)
-
-    def __dict__(self) -> Dict[str, Union[int, str, Optional[int], Optional[str], Optional[bool]]]:
-        """
-        Returns the dictionary representation of the Text Input component.
+    to_dict = serializer("type", "custom_id", "style", "label", "min_length", "max_length", "placeholder", "required", "value")
 
-        Returns:
-            dict: The dictionary representation of the Text Input component.
-        """
-        return {
-            "type": self.type,
-            "custom_id": self.custom_id,
-            "style": self.style,
-            "label": self.label,
-            "min_length": self.min_length,
-            "max_length": self.max_length,
-            "placeholder": self.placeholder,
-            "required": self.required,
-            "value": self.value
-        }
-
-@dataclass
+@dataclass(slots=True)
 class UserSelect(Component):
     """
         Represents a User Select component in a Discord message.
@@ -194,26 +123,11 @@ class UserSelect(Component):
     min_values: Optional[int]
     max_values: Optional[int]
     disabled: Optional[bool]
+    type: int = field(init=False, default=5)
 
-    def __post_init__(self):
-        super().__init__(type=5)
-
-    def __dict__(self) -> Dict[str, Union[int, str, Optional[int], Optional[bool]]]:
-        """
-        Returns the dictionary representation of the User Select component.
+    to_dict = serializer("type", "custom_id", "min_values", "max_values", "disabled")
 
-        Returns:
-            dict: The dictionary representation of the User Select component.
-        """
-        return {
-            "type": self.type,
-            "custom_id": self.custom_id,
-            "min_values": self.min_values,
-            "max_values": self.max_values,
-            "disabled": self.disabled
-        }
-
-@dataclass
+@dataclass(slots=True)
 class RoleSelect(Component):
     """
         Represents a Role Select component in a Discord message.
@@ -229,26 +143,11 @@ class RoleSelect(Component):
     min_values: Optional[int]
     max_values: Optional[int]
     disabled: Optional[bool]
+    type: int = field(init=False, default=6)
 
-    def __post_init__(self):
-        super().__init__(type=6)
-
-    def __dict__(self) -> Dict[str, Union[int, str, Optional[int], Optional[bool]]]:
-        """
-        Returns the dictionary representation of the Role Select component.
+    to_dict = serializer("type", "custom_id", "min_values", "max_values", "disabled")
 
-        Returns:
-            dict: The dictionary representation of the Role Select component.
-        """
-        return {
-            "type": self.type,
-            "custom_id": self.custom_id,
-            "min_values": self.min_values,
-            "max_values": self.max_values,
-            "disabled": self.disabled
-        }
-
-@dataclass
+@dataclass(slots=True)
 class MentionableSelect(Component):
     """
         Represents a Mentionable Select component in a Discord message.
@@ -264,26 +163,11 @@ class MentionableSelect(Component):
     min_values: Optional[int]
     max_values: Optional[int]
     disabled: Optional[bool]
+    type: int = field(init=False, default=7)
 
-    def __post_init__(self):
-        super().__init__(type=7)
-
-    def __dict__(self) -> Dict[str, Union[int, str, Optional[int], Optional[bool]]]:
-        """
-        Returns the dictionary representation of the Mentionable Select component.
+    to_dict = serializer("type", "custom_id", "min_values", "max_values", "disabled")
 
-        Returns:
-            dict: The dictionary representation of the Mentionable Select component.
-        """
-        return {
-            "type": self.type,
-            "custom_id": self.custom_id,
-            "min_values": self.min_values,
-            "max_values": self.max_values,
-            "disabled": self.disabled
-        }
-
-@dataclass
+@dataclass(slots=True)
 class ChannelSelect(Component):
     """
         Represents a Channel Select component in a Discord message.
@@ -297,20 +181,6 @@ class ChannelSelect(Component):
     custom_id: str
     channel_types: Optional[List[str]]
     disabled: Optional[bool]
+    type: int = field(init=False, default=8)
 
-    def __post_init__(self):
-        super().__init__(type=8)
-
-    def __dict__(self) -> Dict[str, Union[int, str, Optional[List[str]], Optional[bool]]]:
-        """
-        Returns the dictionary representation of the Channel Select component.
-
-        Returns:
-            dict: The dictionary representation of the Channel Select component.
-        """
-        return {
-            "type": self.type,
-            "custom_id": self.custom_id,
-            "channel_types": self.channel_types,
-            "disabled": self.disabled
-        }
+    to_dict = serializer("type", "custom_id", "channel_types", "disabled")
@@ -1,11 +1,16 @@
 from typing import Optional, List
 from datetime import datetime
+from .serializer import serializer, nested, nested_list, Field
+from ..validation import eager
+
+MAX_EMBED_CHARACTERS = 6000  # combined across title, description, fields, footer text and author name
 
 class EmbedFooter(object):
     """
     Represents the footer of an embed message.
     - https://discord.com/developers/docs/resources/channel#embed-object-embed-footer-structure
     """
+    __slots__ = ("text", "icon_url", "proxy_icon_url")
 
     text: str
     icon_url: Optional[str]
@@ -27,24 +32,14 @@ class EmbedFooter(object):
         self.icon_url = icon_url
         self.proxy_icon_url = proxy_icon_url
     
-    def __dict__(self):
-        """
-        Returns a dictionary representation of the EmbedFooter object.
-
-        Returns:
-            dict: A dictionary representation of the EmbedFooter object.
-        """
-        return {
-            'text': self.text,
-            'icon_url': self.icon_url,
-            'proxy_icon_url': self.proxy_icon_url
-        }
+    to_dict = serializer("text", "icon_url", "proxy_icon_url")
 
 class EmbedImage(object):
     """
     Represents an image in an embed.
     - https://discord.com/developers/docs/resources/channel#embed-object-embed-image-structure
     """
+    __slots__ = ("url", "proxy_url", "height", "width")
 
     def __init__(self, 
                  url: str,
@@ -65,25 +60,15 @@ class EmbedImage(object):
         self.height = height
         self.width = width
     
-    def __dict__(self):
-        """
-            Returns a dictionary representation of the EmbedImage object.
-
-            Returns:
-                dict: A dictionary containing the attributes of the EmbedImage object.
-        """
-        return {
-            'url': self.url,
-            'proxy_url': self.proxy_url,
-            'height': self.height,
-            'width': self.width
-        }
+    to_dict = serializer("url", "proxy_url", "height", "width")
 
 class EmbedThumbnail(object):
     """
         Represents the thumbnail of an embed.
         - https://discord.com/developers/docs/resources/channel#embed-object-embed-thumbnail-structure
     """
+    __slots__ = ("url", "proxy_url", "height", "width")
+
     url: str
     proxy_url: Optional[str]
     height: Optional[int]
@@ -109,25 +94,14 @@ class EmbedThumbnail(object):
         self.height = height
         self.width = width
     
-    def __dict__(self):
-        """
-            Returns a dictionary representation of the EmbedThumbnail object.
-
-            Returns:
-                dict: A dictionary containing the attributes of the EmbedThumbnail object.
-        """
-        return {
-            'url': self.url,
-            'proxy_url': self.proxy_url,
-            'height': self.height,
-            'width': self.width
-        }
+    to_dict = serializer("url", "proxy_url", "height", "width")
 
 class EmbedVideo(object):
     """
     Represents an embedded video.
     - https://discord.com/developers/docs/resources/channel#embed-object-embed-video-structure
     """
+    __slots__ = ("url", "proxy_url", "height", "width")
 
     url: Optional[str]
     proxy_url: Optional[str]
@@ -153,25 +127,14 @@ class EmbedVideo(object):
         self.height = height
         self.width = width
     
-    def __dict__(self):
-        """
-        Returns a dictionary representation of the EmbedVideo object.
-
-        Returns:
-            dict: A dictionary containing the attributes of the EmbedVideo object.
-        """
-        return {
-            'url': self.url,
-            'proxy_url': self.proxy_url,
-            'height': self.height,
-            'width': self.width
-        }
+    to_dict = serializer("url", "proxy_url", "height", "width")
 
 class EmbedProvider(object):
     """
     Represents the provider of an embed.
     - https://discord.com/developers/docs/resources/channel#embed-object-embed-provider-structure
     """
+    __slots__ = ("name", "url")
 
     name: Optional[str]
     url: Optional[str]
@@ -189,23 +152,14 @@ class EmbedProvider(object):
         self.name = name
         self.url = url
     
-    def __dict__(self) -> dict:
-        """
-        Returns a dictionary representation of the EmbedProvider object.
-
-        Returns:
-            dict: A dictionary representation of the EmbedProvider object.
-        """
-        return {
-            'name': self.name,
-            'url': self.url
-        }
+    to_dict = serializer("name", "url")
 
 class EmbedAuthor(object):
     """
     Represents the author of an embed.
     - https://discord.com/developers/docs/resources/channel#embed-object-embed-author-structure
     """
+    __slots__ = ("name", "url", "icon_url", "proxy_icon_url")
 
     name: str
     url: Optional[str]
@@ -231,25 +185,14 @@ class EmbedAuthor(object):
         self.icon_url = icon_url
         self.proxy_icon_url = proxy_icon_url
 
-    def __dict__(self):
-        """
-        Returns a dictionary representation of the EmbedAuthor object.
-
-        Returns:
-            dict: A dictionary representation of the EmbedAuthor object.
-        """
-        return {
-            'name': self.name,
-            'url': self.url,
-            'icon_url': self.icon_url,
-            'proxy_icon_url': self.proxy_icon_url
-        }
+    to_dict = serializer("name", "url", "icon_url", "proxy_icon_url")
 
 class EmbedField(object):
     """
     Represents a field in an embed message.
     - https://discord.com/developers/docs/resources/channel#embed-object-embed-field-structure
     """
+    __slots__ = ("name", "value", "inline")
 
     name: str
     value: str
@@ -271,26 +214,27 @@ class EmbedField(object):
         self.value = value
         self.inline = inline
     
-    def __dict__(self) -> dict:
-        """
-        Returns a dictionary representation of the EmbedField object.
+    to_dict = serializer("name", "value", "inline")
 
-        Returns:
-            dict: A dictionary representation of the EmbedField object.
-        """
-        return {
-            'name': self.name,
-            'value': self.value,
-            'inline': self.inline
-        }
+def _footer_length(footer: Optional[EmbedFooter]) -> int:
+    return len(footer.text) if footer and footer.text else 0
+
+def _author_length(author: Optional[EmbedAuthor]) -> int:
+    return len(author.name) if author and author.name else 0
+
+def _fields_length(fields: List[EmbedField]) -> int:
+    return sum(len(field.name) + len(field.value) for field in fields)
 
 class Embed(object):
     """
     Represents an embed message.
     - https://discord.com/developers/docs/resources/channel#embed-object
     """
+    __slots__ = ("_title", "type", "_description", "url", "timestamp", "color", "_footer", "image", "thumbnail", "video", "provider",
+                 "_author", "_fields", "_characters")
+
     title: Optional[str]
-    type: Optional[str] = "rich"
+    type: Optional[str]
     description: Optional[str]
     url: Optional[str]
     timestamp: Optional[datetime]
@@ -338,25 +282,96 @@ class Embed(object):
         Raises:
             ValueError: If any of the embed limits are exceeded.
         """
-        self.title = title
+        self._title = title
         self.type = type
-        self.description = description
+        self._description = description
         self.url = url
         self.timestamp = timestamp
         self.color = color
-        self.footer = footer
+        self._footer = footer
         self.image = image
         self.thumbnail = thumbnail
         self.video = video
         self.provider = provider
-        self.author = author
-        self.fields = fields if fields is not None else []
+        self._author = author
+        self._fields = fields if fields is not None else []
 
-        self.validate()
+        if eager():
+            self.validate()
+        else:
+            self._characters = self._count()
+
+    # The title, description, footer, author and fields keep the running character total up to date when they are
+    # assigned, so limits are checked in constant time instead of re-counting the whole embed. Only eager validation
+    # checks them, see `dishookr.validation`.
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._title
+
+    @title.setter
+    def title(self, title: Optional[str]) -> None:
+        if eager() and title and len(title) > 256:
+            raise ValueError("Title cannot exceed 256 characters.")
+        self._adjust(len(self._title or ""), len(title or ""))
+        self._title = title
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._description
+
+    @description.setter
+    def description(self, description: Optional[str]) -> None:
+        if eager() and description and len(description) > 4096:
+            raise ValueError("Description cannot exceed 4096 characters.")
+        self._adjust(len(self._description or ""), len(description or ""))
+        self._description = description
+
+    @property
+    def footer(self) -> Optional[EmbedFooter]:
+        return self._footer
+
+    @footer.setter
+    def footer(self, footer: Optional[EmbedFooter]) -> None:
+        if eager() and footer and footer.text and len(footer.text) > 2048:
+            raise ValueError("Footer text cannot exceed 2048 characters.")
+        self._adjust(_footer_length(self._footer), _footer_length(footer))
+        self._footer = footer
+
+    @property
+    def author(self) -> Optional[EmbedAuthor]:
+        return self._author
+
+    @author.setter
+    def author(self, author: Optional[EmbedAuthor]) -> None:
+        if eager() and author and author.name and len(author.name) > 256:
+            raise ValueError("Author name cannot exceed 256 characters.")
+        self._adjust(_author_length(self._author), _author_length(author))
+        self._author = author
+
+    @property
+    def fields(self) -> List[EmbedField]:
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields: Optional[List[EmbedField]]) -> None:
+        fields = fields if fields is not None else []
+        if eager() and len(fields) > 25:
+            raise ValueError("Cannot have more than 25 fields.")
+        self._adjust(_fields_length(self._fields), _fields_length(fields))
+        self._fields = fields
+
+    def _adjust(self, removed: int, added: int) -> None:
+        total = self._characters - removed + added
+        if total > MAX_EMBED_CHARACTERS and eager():
+            raise ValueError("Combined characters in title, description, fields, footer text, and author name cannot exceed 6000.")
+        self._characters = total
 
     def validate(self) -> None:
             """
-            Validates the embed object based on Discord's embed limits.
+            Validates the embed object based on Discord's embed limits, re-counting every character. Only needed after
+            changing nested objects directly, such as `embed.footer.text` or `embed.fields.append(...)`: assignments and
+            `add_field` are checked as they happen in eager validation mode.
 
             Raises:
                 ValueError: If any of the embed limits are exceeded.
@@ -372,14 +387,24 @@ class Embed(object):
             if self.author and self.author.name and len(self.author.name) > 256:
                 raise ValueError("Author name cannot exceed 256 characters.")
             
-            total_chars = (len(self.title or "") + len(self.description or "") +
-                           sum(len(field.name) for field in self.fields) +
-                           sum(len(field.value) for field in self.fields) +
-                           (len(self.footer.text) if self.footer and self.footer.text else 0) +
-                           (len(self.author.name) if self.author and self.author.name else 0))
-            
-            if total_chars > 6000:
+            characters = self._count()
+            if characters > MAX_EMBED_CHARACTERS:
                 raise ValueError("Combined characters in title, description, fields, footer text, and author name cannot exceed 6000.")
+            self._characters = characters
+
+    def _count(self) -> int:
+        return (len(self._title or "") + len(self._description or "") + _fields_length(self._fields) +
+                _footer_length(self._footer) + _author_length(self._author))
+
+    def total_characters(self) -> int:
+        """
+        Returns the number of characters that count towards the 6000 character limit of embeds, as kept up to date
+        by assignments, `add_field` and `validate`.
+
+        Returns:
+            int: The combined length of the title, description, fields, footer text and author name.
+        """
+        return self._characters
 
     def add_field(self, name: str, value: str, inline: Optional[bool] = None) -> None:
         """
@@ -393,33 +418,14 @@ class Embed(object):
         Raises:
             ValueError: If the maximum number of fields (25) has been reached.
         """
-        if len(self.fields) < 25:
-            self.fields.append(
+        if len(self._fields) < 25 or not eager():
+            self._adjust(0, len(name) + len(value))
+            self._fields.append(
                 EmbedField(name=name, value=value, inline=inline)
             )
-            self.validate()
         else:
             raise ValueError("Maximum of 25 fields are allowed.")
     
-    def __dict__(self) -> dict:
-        """
-        Returns a dictionary representation of the Embed object.
-
-        Returns:
-            dict: A dictionary containing the attributes of the Embed object.
-        """
-        return {
-            'title': self.title,
-            'type': self.type,
-            'description': self.description,
-            'url': self.url,
-            'timestamp': self.timestamp,
-            'color': self.color,
-            'footer': self.footer.__dict__() if self.footer is not None else None,
-            'image': self.image.__dict__() if self.image is not None else None,
-            'thumbnail': self.thumbnail.__dict__() if self.thumbnail is not None else None,
-            'video': self.video.__dict__() if self.video is not None else None,
-            'provider': self.provider.__dict__() if self.provider is not None else None,
-            'author': self.author.__dict__() if self.author is not None else None,
-            'fields': [field.__dict__() for field in self.fields]
-        }
+    to_dict = serializer(Field("_title", "title"), "type", Field("_description", "description"), "url", "timestamp", "color",
+                          nested("_footer", "footer"), nested("image"), nested("thumbnail"), nested("video"), nested("provider"),
+                          nested("_author", "author"), nested_list("_fields", "fields"))
@@ -1,7 +1,8 @@
 from typing import Optional, List
 from dataclasses import dataclass
+from .serializer import serializer, Field
 
-@dataclass
+@dataclass(slots=True)
 class Emoji: # Yes, I made this before I properly read the docs. I'm not deleting it now :(
     """
         Represents an emoji.
@@ -26,25 +27,9 @@ class Emoji: # Yes, I made this before I properly read the docs. I'm not deletin
     animated: Optional[bool] = None
     available: Optional[bool] = None
 
-    def __dict__(self):
-        """
-        Returns the dictionary representation of the emoji.
+    to_dict = serializer("id", "name", "roles", "user", "require_colons", "managed", "animated", "available")
 
-        Returns:
-            dict: The dictionary representation of the emoji.
-        """
-        return {
-            "id": self.id,
-            "name": self.name,
-            "roles": self.roles,
-            "user": self.user,
-            "require_colons": self.require_colons,
-            "managed": self.managed,
-            "animated": self.animated,
-            "available": self.available
-        }
-
-@dataclass
+@dataclass(slots=True)
 class PollMediaPartialEmoji:
     """
         Represents a partial emoji as required by the [Poll Media Object](https://discord.com/developers/docs/resources/poll#poll-media-object).
@@ -63,16 +48,9 @@ class PollMediaPartialEmoji:
         if self._id is not None and self.name is not None:
             raise ValueError("Either ID or name must be provided, not both.")
     
-    def __dict__(self):
-        if self._id:
-            return {
-                "id": self._id
-            }
-        return {
-            "name": self.name
-        }
+    to_dict = serializer(Field("_id", "id"), "name")
 
-@dataclass
+@dataclass(slots=True)
 class ComponentPartialEmoji:
     """
         Represents a partial emoji as required by the [Button Component Object](https://discord.com/developers/docs/interactions/message-components#button-component-object).
@@ -94,14 +72,5 @@ class ComponentPartialEmoji:
         if self._id is not None and self.name is not None:
             raise ValueError("Either ID or name must be provided, not both.")
     
-    def __dict__(self):
-        if self._id:
-            return {
-                "id": self._id,
-                "animated": self.animated
-            }
-        return {
-            "name": self.name,
-            "animated": self.animated
-        }
+    to_dict = serializer(Field("_id", "id"), "name", "animated")
     
\ No newline at end of file
@@ -34,6 +34,13 @@ class Locale(Enum):
     ZH_TW = "zh-TW"
     KO = "ko"
 
+class InteractionType(Enum):
+    PING = 1
+    APPLICATION_COMMAND = 2
+    MESSAGE_COMPONENT = 3
+    APPLICATION_COMMAND_AUTOCOMPLETE = 4
+    MODAL_SUBMIT = 5
+
 class InteractionResponseType(Enum):
     PONG = 1
     CHANNEL_MESSAGE_WITH_SOURCE = 4
@@ -1,8 +1,12 @@
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Union
 from .enums import Locale
+from .serializer import serializer, Field
 
-@dataclass
+def _localizations(name_localizations: Dict[Locale, str]) -> Dict[str, str]:
+    return {locale.value: localized_name for locale, localized_name in name_localizations.items()}
+
+@dataclass(slots=True)
 class InteractionChoices:
     """
         Represents an interaction choices object.
@@ -38,15 +42,4 @@ class InteractionChoices:
         elif not isinstance(self.value, (int, float)):
             raise ValueError("The 'value' field must be a string, integer, or double.")
 
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the object.
-
-            Returns:
-                dict: The dictionary representation of the object.
-        """
-        return {
-            "name": self.name,
-            "value": self.value,
-            "name_localizations": {locale.value: localized_name for locale, localized_name in self.name_localizations.items()} if self.name_localizations else None
-        }
+    to_dict = serializer("name", "value", Field("name_localizations", omit_empty=True, convert=_localizations))
@@ -6,8 +6,9 @@ from .component import Component
 from .poll import Poll
 from .interaction import InteractionChoices
 from .enums import MessageFlags
+from .serializer import serializer, nested, nested_list
 
-@dataclass
+@dataclass(slots=True)
 class InteractionCallbackMessage:
     """
         Represents an interaction callback data object.
@@ -31,25 +32,10 @@ class InteractionCallbackMessage:
     attachments: Optional[list[object]] = None
     poll: Optional[Poll] = None
 
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the object.
+    to_dict = serializer("tts", "content", nested_list("embeds"), nested("allowed_mentions"), "flags", nested_list("components"),
+                          "attachments", nested("poll"))
 
-            Returns:
-                dict: The dictionary representation of the object.
-        """
-        return {
-            "tts": self.tts,
-            "content": self.content,
-            "embeds": [embed.__dict__() for embed in self.embeds] if self.embeds else None,
-            "allowed_mentions": self.allowed_mentions.__dict__() if self.allowed_mentions else None,
-            "flags": self.flags,
-            "components": [component.__dict__() for component in self.components] if self.components else None,
-            "attachments": self.attachments,
-            "poll": self.poll.__dict__() if self.poll else None
-        }
-
-@dataclass
+@dataclass(slots=True)
 class InteractionCallbackAutocomplete:
     """
         Represents an interaction callback autocomplete object.
@@ -60,18 +46,9 @@ class InteractionCallbackAutocomplete:
     """
     choices: list[InteractionChoices]
 
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the object.
-
-            Returns:
-                dict: The dictionary representation of the object.
-        """
-        return {
-            "choices": [choice.__dict__() for choice in self.choices]
-        }
+    to_dict = serializer(nested_list("choices", omit_empty=False))
 
-@dataclass
+@dataclass(slots=True)
 class InteractionCallbackModal:
     """
         Represents an interaction callback modal object.
@@ -94,16 +71,5 @@ class InteractionCallbackModal:
         if len(self.components) > 5:
             raise ValueError("The 'components' field must be a list with up to 5 components.")
 
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the object.
-
-            Returns:
-                dict: The dictionary representation of the object.
-        """
-        return {
-            "custom_id": self.custom_id,
-            "title": self.title,
-            "components": [component.__dict__() for component in self.components]
-        }
+    to_dict = serializer("custom_id", "title", nested_list("components", omit_empty=False))
 
@@ -1,22 +1,27 @@
 from dataclasses import dataclass, field
 from typing import Dict, Union, Optional
-from .interaction_callback import InteractionCallbackMessage, InteractionCallbackAutocomplete
+from .interaction_callback import InteractionCallbackMessage, InteractionCallbackAutocomplete, InteractionCallbackModal
+from .enums import InteractionResponseType
+from .serializer import serializer, nested
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionResponse:
     """
         Represents an interaction response object.
+        - https://discord.com/developers/docs/interactions/receiving-and-responding#interaction-response-object
+
+        Args:
+            type (Union[int, InteractionResponseType]): The type of the response.
+            data (Optional[Union[InteractionCallbackMessage, InteractionCallbackAutocomplete, InteractionCallbackModal]], optional): The data of the response. Defaults to None, as for PONG and deferred responses.
     """
     type: int
-    data: Union[InteractionCallbackMessage, InteractionCallbackAutocomplete]
+    data: Optional[Union[InteractionCallbackMessage, InteractionCallbackAutocomplete, InteractionCallbackModal]] = None
 
     def __post_init__(self):
+        if isinstance(self.type, InteractionResponseType):
+            self.type = self.type.value
         if not self.type in [1, 4, 5, 6, 7, 8, 9, 10]:
             raise ValueError("Invalid interaction response type.")
 
-    def __dict__(self):
-        return {
-            "type": self.type,
-            "data": self.data.__dict__()
-        }
+    to_dict = serializer("type", nested("data"))
@@ -1,8 +1,10 @@
 from typing import List, Optional
 from .emoji import PollMediaPartialEmoji
 from dataclasses import dataclass
+from ..validation import eager
+from .serializer import serializer, nested, nested_list, Field
 
-@dataclass
+@dataclass(slots=True)
 class PollMedia:
     """
         Represents the media of a poll.
@@ -15,19 +17,9 @@ class PollMedia:
     text: str
     emoji: Optional[PollMediaPartialEmoji]
     
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the poll media.
-
-            Returns:
-                dict: The dictionary representation of the poll media.
-        """
-        return {
-            "text": self.text,
-            "emoji": self.emoji.__dict__() if self.emoji else None
-        }
+    to_dict = serializer("text", nested("emoji"))
 
-@dataclass
+@dataclass(slots=True)
 class PollAnswer:
     """
         Represents an possible answer to a poll.
@@ -40,19 +32,9 @@ class PollAnswer:
     answer_id: Optional[int] = None
     poll_media: Optional[PollMedia] = None
     
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the poll answer.
+    to_dict = serializer("answer_id", nested("poll_media"))
 
-            Returns:
-                dict: The dictionary representation of the poll answer.
-        """
-        return {
-            "answer_id": self.answer_id,
-            "poll_media": self.poll_media.__dict__()
-        }
-
-@dataclass
+@dataclass(slots=True)
 class PollResultsAnswerCount:
     """
         Represents the answer count of a poll.
@@ -67,20 +49,9 @@ class PollResultsAnswerCount:
     count: int
     me_voted: bool
     
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the answer count.
+    to_dict = serializer(Field("answer_id", "id"), "count", "me_voted")
 
-            Returns:
-                dict: The dictionary representation of the answer count.
-        """
-        return {
-            "id": self.answer_id,
-            "count": self.count,
-            "me_voted": self.me_voted
-        }
-
-@dataclass
+@dataclass(slots=True)
 class PollResults:
     """
         Represents the results of a poll.
@@ -93,19 +64,9 @@ class PollResults:
     is_finalized: bool
     answer_counts: List[PollResultsAnswerCount]
     
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the poll results.
-
-            Returns:
-                dict: The dictionary representation of the poll results.
-        """
-        return {
-            "is_finalized": self.is_finalized,
-            "answer_counts": [answer_count.__dict__() for answer_count in self.answer_counts]
-        }
+    to_dict = serializer("is_finalized", nested_list("answer_counts", omit_empty=False))
 
-@dataclass
+@dataclass(slots=True)
 class Poll:
     """
         Represents a poll.
@@ -125,7 +86,8 @@ class Poll:
     layout_type: Optional[int] = 1
 
     def __post_init__(self):
-        self.validate()
+        if eager():
+            self.validate()
 
     def validate(self) -> None:
         """
@@ -162,19 +124,7 @@ class Poll:
                 poll_media=poll_media
             )
         )
-        self.validate()
+        if eager():
+            self.validate()
 
-    def __dict__(self):
-        """
-            Returns the dictionary representation of the poll.
-
-            Returns:
-                dict: The dictionary representation of the poll.
-        """
-        return {
-            "question": self.question.__dict__(),
-            "answers": [answer.__dict__() for answer in self.answers],
-            "duration": self.duration,
-            "allow_multiselect": self.allow_multiselect,
-            "layout_type": self.layout_type
-        }
+    to_dict = serializer(nested("question"), nested_list("answers", omit_empty=False), "duration", "allow_multiselect", "layout_type")
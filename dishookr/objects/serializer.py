@@ -0,0 +1,78 @@
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+VALUE = "value"  # sent as is
+NESTED = "nested"  # an object serialized with its own to_dict()
+NESTED_LIST = "nested_list"  # a list of such objects
+
+class Field(NamedTuple):
+    """
+        Describes how one attribute is serialized by `serializer`.
+
+        Args:
+            attr (str): The name of the attribute.
+            key (Optional[str], optional): The key in the payload. Defaults to the attribute name.
+            kind (str, optional): VALUE, NESTED or NESTED_LIST. Defaults to VALUE.
+            omit_empty (bool, optional): Whether empty values ([] or "") are left out too, not only None. Defaults to False.
+            convert (Optional[Callable[[Any], Any]], optional): Turns the value into its JSON form. Defaults to None.
+    """
+    attr: str
+    key: Optional[str] = None
+    kind: str = VALUE
+    omit_empty: bool = False
+    convert: Optional[Callable[[Any], Any]] = None
+
+def nested(attr: str, key: Optional[str] = None) -> Field:
+    """ A field holding an object with its own `to_dict()`. """
+    return Field(attr, key, NESTED)
+
+def nested_list(attr: str, key: Optional[str] = None, omit_empty: bool = True) -> Field:
+    """ A field holding a list of objects with their own `to_dict()`; left out when empty unless omit_empty is False. """
+    return Field(attr, key, NESTED_LIST, omit_empty)
+
+def serializer(*fields: Union[str, Field]) -> Callable[[Any], dict]:
+    """
+        Generates a `to_dict()` method from a list of fields, compiled once when the class body runs:
+
+            class EmbedFooter(object):
+                to_dict = serializer("text", "icon_url", "proxy_icon_url")
+
+        The generated method only emits the fields that are set: None values are left out, and so are empty ones for
+        fields marked `omit_empty`, which keeps payloads small and quick to encode.
+
+        Args:
+            *fields (Union[str, Field]): The attributes to serialize, in payload order; plain names are sent as is.
+
+        Returns:
+            Callable[[Any], dict]: The method.
+    """
+    specs = tuple(field if isinstance(field, Field) else Field(field) for field in fields)
+    namespace = {}
+    lines = ["def to_dict(self):", "    payload = {}"]
+    for index, spec in enumerate(specs):
+        if not spec.attr.isidentifier():
+            raise ValueError(f"Invalid attribute name: {spec.attr!r}")
+        lines.append(f"    value = self.{spec.attr}")
+        if spec.kind == NESTED:
+            expression = "value.to_dict()"
+        elif spec.kind == NESTED_LIST:
+            expression = "[item.to_dict() for item in value]"
+        elif spec.convert is not None:
+            namespace[f"convert_{index}"] = spec.convert
+            expression = f"convert_{index}(value)"
+        else:
+            expression = "value"
+        condition = "value" if spec.omit_empty else "value is not None"
+        lines.append(f"    if {condition}:")
+        lines.append(f"        payload[{(spec.key or spec.attr)!r}] = {expression}")
+    lines.append("    return payload")
+    exec(compile("\n".join(lines), "<dishookr serializer>", "exec"), namespace)
+
+    method = namespace["to_dict"]
+    method.__doc__ = """
+        Returns the dictionary representation of the object, leaving out unset fields.
+
+        Returns:
+            dict: The dictionary representation of the object.
+    """
+    method.fields = specs
+    return method
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class AvatarDecorationData:
     asset: str
     sku_id: str
 
-@dataclass
+@dataclass(slots=True)
 class User():
     """
         Represents a Discord User.
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class User:
     # Define the structure of the User object if needed
     id: str
@@ -9,19 +9,19 @@ class User:
     discriminator: str
     avatar: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class PartialGuild:
     # Define the structure of the Partial Guild object if needed
     id: str
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class PartialChannel:
     # Define the structure of the Partial Channel object if needed
     id: str
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class Webhook:
     id: str
     type: int[1, 2, 3]
@@ -0,0 +1,264 @@
+from typing import List, NamedTuple, Optional, Tuple, Union
+from concurrent.futures import Future
+import sqlite3
+import threading
+import time
+import uuid
+
+import requests
+
+from .app import Webhook
+from .exceptions import RateLimited, DiscordServerError, CircuitOpen
+from .encoding import dumps, loads
+
+PENDING = 0
+DELIVERED = 1
+DEAD = 2  # rejected by Discord, replaying it would fail again
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dedup_key TEXT NOT NULL UNIQUE,
+    webhook_url TEXT NOT NULL,
+    wait INTEGER NOT NULL,
+    thread_id TEXT,
+    payload TEXT NOT NULL,
+    state INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (state, id);
+"""
+
+class OutboxEntry(NamedTuple):
+    """
+        A message stored in the outbox.
+    """
+    id: int
+    dedup_key: str
+    webhook_url: str
+    wait: bool
+    thread_id: Optional[str]
+    payload: dict
+    attempts: int
+
+class Outbox(object):
+    """
+        A durable, SQLite backed spool of webhook messages, so messages survive a crash of the process.
+
+        Messages are written before they are sent and marked delivered after Discord accepts them; `replay` sends
+        whatever was left pending. Writes are group committed by a background thread, so many enqueues share a
+        single fsync. Delivery is at-least-once: a crash between Discord accepting a message and the outbox marking
+        it delivered means it is sent again on replay. Dedup keys make sure a message is only stored, and therefore
+        delivered, once however many times it is enqueued.
+    """
+    path: str
+    batch_size: int
+    flush_interval: float
+
+    def __init__(self, path: str, batch_size: int = 1000, flush_interval: float = 0.01) -> None:
+        """
+            Opens (or creates) the outbox.
+
+            Args:
+                path (str): The path of the SQLite database.
+                batch_size (int, optional): The maximum number of writes committed together. Defaults to 1000.
+                flush_interval (float, optional): How long the writer waits for more writes to join a commit, in seconds. Defaults to 0.01.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+        self._writes: List[Tuple[str, tuple, Future]] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="dishookr-outbox", daemon=True)
+        self._writer.start()
+
+    def _write(self, sql: str, params: tuple) -> Future:
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The outbox is closed.")
+            self._writes.append((sql, params, future))
+            self._condition.notify()
+        return future
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._writes or self._closed)
+                if not self._writes and self._closed:
+                    return
+                full = len(self._writes) >= self.batch_size
+            if not full:
+                time.sleep(self.flush_interval)  # let concurrent writers join this commit
+            with self._condition:
+                batch, self._writes = self._writes[:self.batch_size], self._writes[self.batch_size:]
+
+            results = []
+            try:
+                with self._lock:
+                    self._connection.execute("BEGIN IMMEDIATE")
+                    for sql, params, _ in batch:
+                        results.append(self._connection.execute(sql, params).rowcount > 0)
+                    self._connection.execute("COMMIT")
+            except BaseException as e:
+                with self._lock:
+                    if self._connection.in_transaction:
+                        self._connection.execute("ROLLBACK")
+                for _, _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, _, future), result in zip(batch, results):
+                    future.set_result(result)
+
+    def enqueue(self, webhook: Webhook, dedup_key: Optional[str] = None) -> Tuple[str, Future]:
+        """
+            Stores a webhook's message. The write is durable once the returned future resolves.
+
+            Args:
+                webhook (Webhook): The webhook to store. Webhooks with files can't be stored.
+                dedup_key (Optional[str], optional): Identifies the message; enqueuing the same key again is a no-op. Defaults to a random key.
+
+            Returns:
+                Tuple[str, Future]: The dedup key, and a future resolving to whether the message was new once it is committed.
+        """
+        if webhook.files:
+            raise ValueError("Webhooks with files can't be stored in the outbox.")
+        webhook._check_sendable()
+        return self._enqueue(webhook, dedup_key, dumps(webhook.to_dict()))
+
+    def _enqueue(self, webhook: Webhook, dedup_key: Optional[str], payload: bytes) -> Tuple[str, Future]:
+        dedup_key = dedup_key or uuid.uuid4().hex
+        now = time.time()
+        future = self._write(
+            "INSERT OR IGNORE INTO outbox (dedup_key, webhook_url, wait, thread_id, payload, created, updated) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (dedup_key, webhook.webhook_url, int(bool(webhook.wait)),
+             str(webhook.thread_id) if webhook.thread_id else None, payload.decode(), now, now),
+        )
+        return dedup_key, future
+
+    def ack(self, dedup_key: str) -> Future:
+        """
+            Marks a message as delivered.
+
+            Args:
+                dedup_key (str): The dedup key of the message.
+
+            Returns:
+                Future: Resolves once the acknowledgement is committed.
+        """
+        return self._write("UPDATE outbox SET state = ?, updated = ? WHERE dedup_key = ?", (DELIVERED, time.time(), dedup_key))
+
+    def _fail(self, dedup_key: str, error: Exception) -> Future:
+        # Records a failed delivery. Only transient failures are replayed: a message Discord rejected, or one that
+        # can't be sent at all (an invalid URL or payload, say), would fail the same way every time, and so would one
+        # whose webhook the circuit breaker found to be gone.
+        if isinstance(error, CircuitOpen):
+            dead = error.permanent
+        else:
+            dead = not isinstance(error, (RateLimited, DiscordServerError, requests.ConnectionError, requests.Timeout))
+        return self._write(
+            "UPDATE outbox SET state = ?, attempts = attempts + 1, last_error = ?, updated = ? WHERE dedup_key = ?",
+            (DEAD if dead else PENDING, str(error), time.time(), dedup_key),
+        )
+
+    def pending(self, limit: Optional[int] = None) -> List[OutboxEntry]:
+        """
+            Returns the messages that haven't been delivered yet, oldest first.
+
+            Args:
+                limit (Optional[int], optional): The maximum number of messages to return. Defaults to all of them.
+
+            Returns:
+                List[OutboxEntry]: The pending messages.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, dedup_key, webhook_url, wait, thread_id, payload, attempts FROM outbox WHERE state = ? ORDER BY id LIMIT ?",
+                (PENDING, -1 if limit is None else limit),
+            ).fetchall()
+        return [OutboxEntry(id, key, url, bool(wait), thread_id, loads(payload), attempts)
+                for id, key, url, wait, thread_id, payload, attempts in rows]
+
+    def send(self, webhook: Webhook, dedup_key: Optional[str] = None) -> Optional[requests.Response]:
+        """
+            Stores a webhook durably, sends it and marks it delivered.
+
+            Args:
+                webhook (Webhook): The webhook to send.
+                dedup_key (Optional[str], optional): Identifies the message, see `enqueue`. Defaults to a random key.
+
+            Returns:
+                Optional[requests.Response]: The webhook response from Discord, or None if the dedup key was already stored.
+        """
+        if webhook.files:
+            raise ValueError("Webhooks with files can't be stored in the outbox.")
+        webhook._check_sendable()
+        # Encoded once: the same bytes are stored and sent.
+        payload = dumps(webhook.to_dict())
+        dedup_key, stored = self._enqueue(webhook, dedup_key, payload)
+        if not stored.result():
+            return None
+        result, acked = self._deliver(webhook, dedup_key, payload, wait=True)
+        acked.result()
+        return result
+
+    def _deliver(self, webhook: Webhook, dedup_key: str, payload: Union[dict, bytes], wait: bool = False) -> Tuple[requests.Response, Future]:
+        # Sends a stored message and acknowledges it, or records the failure (committed before raising if `wait`).
+        try:
+            result = webhook.execute(payload)
+        except Exception as e:
+            failed = self._fail(dedup_key, e)
+            if wait:
+                failed.result()
+            raise
+        return result, self.ack(dedup_key)
+
+    def replay(self, webhook_kwargs: Optional[dict] = None) -> int:
+        """
+            Sends every pending message, typically after a restart. Messages Discord rejects, that can't be sent at
+            all, or whose webhook is dead, are marked dead; messages that fail transiently stay pending.
+
+            Args:
+                webhook_kwargs (Optional[dict], optional): Extra arguments for the `Webhook` each message is sent through, such as a session pool. Defaults to None.
+
+            Returns:
+                int: The number of messages delivered.
+        """
+        acks = []
+        for entry in self.pending():
+            webhook = Webhook(entry.webhook_url, wait=entry.wait, thread_id=entry.thread_id, **(webhook_kwargs or {}))
+            try:
+                acks.append(self._deliver(webhook, entry.dedup_key, entry.payload)[1])
+            except Exception:
+                continue  # recorded by _deliver
+        for acked in acks:
+            acked.result()
+        return len(acks)
+
+    def close(self) -> None:
+        """
+            Commits outstanding writes and closes the database.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._writer.join()
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "Outbox":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,257 @@
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+import asyncio
+import re
+import threading
+import time
+
+_MESSAGE_ID = re.compile(r"/messages/\d+")
+
+PROBE_TIMEOUT = 5.0
+
+def route_key(method: str, url: str) -> str:
+    """
+        Returns the key identifying the rate limited route of a request.
+        Message IDs are collapsed, since Discord rate limits every message of a webhook together.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The requested URL, the query string is ignored.
+
+        Returns:
+            str: The route key.
+    """
+    parts = urlsplit(url)
+    return f"{method.upper()} {parts.netloc}{_MESSAGE_ID.sub('/messages/{message_id}', parts.path)}"
+
+class RateLimitBucket(object):
+    """
+        The state of one [rate limit bucket](https://discord.com/developers/docs/topics/rate-limits#header-format).
+    """
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_at: float
+
+    def __init__(self) -> None:
+        self.limit = None
+        self.remaining = None  # unknown until Discord tells us
+        self.reset_at = 0.0
+        self.window = 0.0
+        self.probe_until = 0.0
+        self.unlimited = False  # set when Discord sends no rate limit headers for the route
+        self.lock = threading.Lock()
+
+    def reserve(self, now: float) -> float:
+        """
+            Claims a request from the bucket.
+
+            Args:
+                now (float): The current `time.monotonic()` value.
+
+            Returns:
+                float: How long to wait before trying again, or 0 if the request may be sent now.
+        """
+        with self.lock:
+            if self.remaining is not None and now >= self.reset_at:
+                # The window has reset, assume it lasts as long as the last one until Discord says otherwise.
+                self.remaining = self.limit
+                self.reset_at = now + self.window
+            if self.remaining is None:
+                if self.unlimited:
+                    return 0.0
+                # Only one request may go out until Discord reports the bucket's budget.
+                if now < self.probe_until:
+                    return min(self.probe_until - now, 0.05)
+                self.probe_until = now + PROBE_TIMEOUT
+                return 0.0
+            if self.remaining > 0:
+                self.remaining -= 1
+                return 0.0
+            return self.reset_at - now
+
+    def learn(self, now: float, limit: Optional[int], remaining: int, reset_after: float) -> None:
+        """
+            Updates the bucket from the headers of a response.
+
+            Args:
+                now (float): The current `time.monotonic()` value.
+                limit (Optional[int]): The `X-RateLimit-Limit` header.
+                remaining (int): The `X-RateLimit-Remaining` header.
+                reset_after (float): The `X-RateLimit-Reset-After` header.
+        """
+        with self.lock:
+            reset_at = now + reset_after
+            if self.remaining is not None and now < self.reset_at:
+                if reset_at < self.reset_at - self.window / 2:
+                    return  # a late response from a window that has already reset
+                # Requests claimed after this one was sent are still in flight, so never raise the local count.
+                remaining = min(remaining, self.remaining)
+            self.limit = limit if limit is not None else self.limit
+            self.remaining = remaining
+            self.reset_at = reset_at
+            self.window = max(self.window, reset_after)
+            self.probe_until = 0.0
+            self.unlimited = False
+
+class RateLimiter(object):
+    """
+        Tracks Discord's rate limits so requests are delayed before they would be rejected.
+
+        Routes are mapped to the bucket IDs Discord reports in `X-RateLimit-Bucket`, and requests wait while their
+        bucket (or the global limit) is exhausted instead of failing.
+        - https://discord.com/developers/docs/topics/rate-limits
+    """
+    max_retries: int
+
+    def __init__(self, max_retries: int = 5) -> None:
+        """
+            Initializes the rate limiter.
+
+            Args:
+                max_retries (int, optional): How many times a request rejected with 429 is retried before giving up. Defaults to 5.
+        """
+        self.max_retries = max_retries
+
+        self._routes: Dict[str, str] = {}
+        self._buckets: Dict[str, RateLimitBucket] = {}
+        self._global_reset_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_bucket(self, route: str) -> RateLimitBucket:
+        """
+            Returns the bucket a route currently belongs to.
+
+            Args:
+                route (str): The route key, see `route_key`.
+
+            Returns:
+                RateLimitBucket: The bucket.
+        """
+        key = self._routes.get(route, route)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = self._new_bucket(key)
+        return bucket
+
+    def _new_bucket(self, key: str) -> RateLimitBucket:
+        return RateLimitBucket()
+
+    def _bucket_key(self, route: str, bucket_id: str) -> str:
+        # Discord's bucket IDs are only unique together with the route's major parameters (the webhook ID and token).
+        return f"{bucket_id}:{route}"
+
+    def delay(self, route: str) -> float:
+        """
+            Claims a request on a route without waiting.
+
+            Args:
+                route (str): The route key, see `route_key`.
+
+            Returns:
+                float: How long to wait before trying again, or 0 if the request may be sent now.
+        """
+        now = time.monotonic()
+        if now < self._global_reset_at:
+            return self._global_reset_at - now
+        return self.get_bucket(route).reserve(now)
+
+    def acquire(self, route: str) -> None:
+        """
+            Blocks until a request may be sent on the route.
+
+            Args:
+                route (str): The route key, see `route_key`.
+        """
+        while True:
+            delay = self.delay(route)
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    async def acquire_async(self, route: str) -> None:
+        """
+            Waits, without blocking the event loop, until a request may be sent on the route.
+
+            Args:
+                route (str): The route key, see `route_key`.
+        """
+        while True:
+            delay = self.delay(route)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def release(self, route: str) -> None:
+        """
+            Gives back a claim on a route whose request failed before Discord answered.
+
+            Args:
+                route (str): The route key, see `route_key`.
+        """
+        bucket = self.get_bucket(route)
+        with bucket.lock:
+            bucket.probe_until = 0.0
+
+    def update(self, route: str, status_code: int, headers: Mapping[str, str], body: Optional[dict] = None) -> Optional[float]:
+        """
+            Learns the rate limit state from a response.
+
+            Args:
+                route (str): The route key, see `route_key`.
+                status_code (int): The response status code.
+                headers (Mapping[str, str]): The response headers.
+                body (Optional[dict], optional): The decoded response body, only needed for 429 responses. Defaults to None.
+
+            Returns:
+                Optional[float]: The number of seconds to wait before retrying if the request was rate limited, otherwise None.
+        """
+        now = time.monotonic()
+        bucket_id = headers.get("X-RateLimit-Bucket")
+        if bucket_id is not None:
+            key = self._bucket_key(route, bucket_id)
+            if self._routes.get(route, route) != key:
+                with self._lock:
+                    self._routes[route] = key
+                    if key not in self._buckets:
+                        self._buckets[key] = self._new_bucket(key)
+
+        bucket = self.get_bucket(route)
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is not None and reset_after is not None:
+            bucket.learn(now, int(limit) if limit is not None else None, int(remaining), float(reset_after))
+        elif status_code != 429:
+            with bucket.lock:
+                bucket.probe_until = 0.0
+                bucket.unlimited = True
+
+        if status_code != 429:
+            return None
+
+        body = body or {}
+        retry_after = float(body.get("retry_after", headers.get("Retry-After", 1)))
+        if body.get("global") or headers.get("X-RateLimit-Global") or headers.get("X-RateLimit-Scope") == "global":
+            self._global_reset_at = max(self._global_reset_at, now + retry_after)
+            with bucket.lock:
+                bucket.probe_until = 0.0  # the retry waits for the global reset, not for this probe
+        else:
+            with bucket.lock:
+                bucket.remaining = 0
+                bucket.reset_at = max(bucket.reset_at, now + retry_after)
+                bucket.probe_until = 0.0
+        return retry_after
+
+_default_limiter = RateLimiter()
+
+def get_default_limiter() -> RateLimiter:
+    """
+        Returns the process-wide rate limiter, shared by every webhook that isn't given its own.
+
+        Returns:
+            RateLimiter: The default rate limiter.
+    """
+    return _default_limiter
@@ -0,0 +1,153 @@
+from typing import Dict, Optional
+import random
+import threading
+import time
+
+class RetryBudget(object):
+    """
+        Caps retries to a fraction of the requests being made, shared by every policy using it.
+
+        Each request deposits `ratio` tokens and each retry withdraws one, so during an outage the number of
+        retries stays proportional to the normal traffic instead of multiplying it.
+    """
+    ratio: float
+    min_per_second: float
+    max_tokens: float
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 100.0) -> None:
+        """
+            Initializes the retry budget.
+
+            Args:
+                ratio (float, optional): The number of retries allowed per request. Defaults to 0.2.
+                min_per_second (float, optional): Retries allowed per second regardless of traffic, so rare senders can still retry. Defaults to 1.0.
+                max_tokens (float, optional): The maximum number of retries that can be saved up. Defaults to 100.0.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def deposit(self) -> None:
+        """
+            Records a request.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+            Claims a retry.
+
+            Returns:
+                bool: Whether the budget allows the retry.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+_default_budget = RetryBudget()
+
+class RetryPolicy(object):
+    """
+        Decides whether, and after how long, a failed request is retried.
+        Delays grow exponentially with full jitter, and Discord's `Retry-After` header is honoured when present.
+    """
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+    max_elapsed: Optional[float]
+    statuses: Dict[int, int]
+    retry_connection_errors: bool
+    budget: Optional[RetryBudget]
+
+    def __init__(self,
+                 max_attempts: int = 5,
+                 base_delay: float = 0.5,
+                 max_delay: float = 30.0,
+                 max_elapsed: Optional[float] = 60.0,
+                 statuses: Optional[Dict[int, int]] = None,
+                 retry_connection_errors: bool = True,
+                 budget: Optional[RetryBudget] = _default_budget) -> None:
+        """
+            Initializes the retry policy.
+
+            Args:
+                max_attempts (int, optional): The maximum number of attempts, including the first one. Defaults to 5.
+                base_delay (float, optional): The delay cap of the first retry, doubled on every attempt. Defaults to 0.5.
+                max_delay (float, optional): The largest delay between two attempts. Defaults to 30.0.
+                max_elapsed (Optional[float], optional): No retry is started after this many seconds since the first attempt. Defaults to 60.0.
+                statuses (Optional[Dict[int, int]], optional): The retried status codes, mapped to the maximum attempts for each. Defaults to 5 attempts for 500, 502, 503 and 504.
+                retry_connection_errors (bool, optional): Whether errors raised before Discord could have received the request, such as refused connections and connect timeouts, are retried. Read timeouts are never retried, as Discord may already have posted the message. Defaults to True.
+                budget (Optional[RetryBudget], optional): The budget retries are drawn from, None for no budget. Defaults to the process-wide budget.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.statuses = statuses if statuses is not None else {500: max_attempts, 502: max_attempts, 503: max_attempts, 504: max_attempts}
+        self.retry_connection_errors = retry_connection_errors
+        self.budget = budget
+
+    def backoff(self, attempt: int) -> float:
+        """
+            Returns a jittered delay for the given attempt.
+
+            Args:
+                attempt (int): The number of attempts made so far.
+
+            Returns:
+                float: The delay in seconds.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def next_delay(self, attempt: int, started: float, status_code: Optional[int] = None, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+            Decides whether a failed attempt is retried.
+
+            Args:
+                attempt (int): The number of attempts made so far.
+                started (float): The `time.monotonic()` value of the first attempt.
+                status_code (Optional[int], optional): The status code of the failed attempt, None for a connection error. Defaults to None.
+                retry_after (Optional[float], optional): The `Retry-After` sent by Discord, in seconds. Defaults to None.
+
+            Returns:
+                Optional[float]: The delay before the next attempt, or None if it shouldn't be retried.
+        """
+        if status_code is None:
+            if not self.retry_connection_errors:
+                return None
+            max_attempts = self.max_attempts
+        else:
+            max_attempts = min(self.max_attempts, self.statuses.get(status_code, 0))
+        if attempt >= max_attempts:
+            return None
+
+        delay = max(self.backoff(attempt), retry_after or 0.0)
+        if self.max_elapsed is not None and time.monotonic() - started + delay > self.max_elapsed:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        return delay
+
+_default_policy = RetryPolicy()
+
+def get_default_retry_policy() -> RetryPolicy:
+    """
+        Returns the retry policy used by every webhook that isn't given its own.
+
+        Returns:
+            RetryPolicy: The default retry policy.
+    """
+    return _default_policy
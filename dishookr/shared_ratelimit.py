@@ -0,0 +1,238 @@
+from typing import Optional
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+from .ratelimit import RateLimiter, RateLimitBucket
+
+_MAGIC = b"DSHKRL01"
+_HEADER = struct.Struct("<8sIIdd")  # magic, slot count, padding, boot time, global reset
+_SLOT = struct.Struct("<16siidddd?7x")  # key digest, limit, remaining, reset at, window, probe until, last used, unlimited
+_HEADER_SIZE = 64
+_EMPTY = bytes(16)
+_MAX_PROBES = 16
+
+# Limits and counts are stored as signed 32 bit integers, -1 standing for "unknown".
+_LIMIT, _REMAINING, _RESET_AT, _WINDOW, _PROBE_UNTIL, _LAST_USED, _UNLIMITED = range(1, 8)
+
+def _boot_time() -> float:
+    # time.monotonic() is shared by every process on the machine but restarts with it, so the table is only
+    # trusted by processes of the same boot.
+    return time.time() - time.monotonic()
+
+class _TableLock(object):
+    """
+        Locks the whole table: a thread lock for the threads of this process, and a POSIX record lock for other processes.
+        Entering it as a bucket's lock also finds (or claims) the bucket's slot.
+    """
+    def __init__(self, table: "SharedRateLimiter", bucket: Optional["SharedRateLimitBucket"] = None) -> None:
+        self._table = table
+        self._bucket = bucket
+
+    def __enter__(self) -> None:
+        self._table._acquire()
+        if self._bucket is not None:
+            try:
+                self._bucket._offset = self._table._find_slot(self._bucket.digest)
+            except BaseException:
+                self._table._release()
+                raise
+
+    def __exit__(self, *exc) -> None:
+        self._table._release()
+
+class SharedRateLimitBucket(RateLimitBucket):
+    """
+        A rate limit bucket stored in the memory mapped table of a `SharedRateLimiter`, seen by every process using it.
+        Its state may only be read or written while holding `lock`.
+    """
+    def __init__(self, table: "SharedRateLimiter", key: str) -> None:
+        self.digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        self.lock = _TableLock(table, self)
+        self._table = table
+        self._offset = 0
+
+    def _get(self, field: int):
+        return _SLOT.unpack_from(self._table._map, self._offset)[field]
+
+    def _set(self, field: int, value) -> None:
+        values = list(_SLOT.unpack_from(self._table._map, self._offset))
+        values[field] = value
+        _SLOT.pack_into(self._table._map, self._offset, *values)
+
+    @property
+    def limit(self) -> Optional[int]:
+        value = self._get(_LIMIT)
+        return value if value >= 0 else None
+
+    @limit.setter
+    def limit(self, value: Optional[int]) -> None:
+        self._set(_LIMIT, -1 if value is None else value)
+
+    @property
+    def remaining(self) -> Optional[int]:
+        value = self._get(_REMAINING)
+        return value if value >= 0 else None
+
+    @remaining.setter
+    def remaining(self, value: Optional[int]) -> None:
+        self._set(_REMAINING, -1 if value is None else value)
+
+    @property
+    def reset_at(self) -> float:
+        return self._get(_RESET_AT)
+
+    @reset_at.setter
+    def reset_at(self, value: float) -> None:
+        self._set(_RESET_AT, value)
+
+    @property
+    def window(self) -> float:
+        return self._get(_WINDOW)
+
+    @window.setter
+    def window(self, value: float) -> None:
+        self._set(_WINDOW, value)
+
+    @property
+    def probe_until(self) -> float:
+        return self._get(_PROBE_UNTIL)
+
+    @probe_until.setter
+    def probe_until(self, value: float) -> None:
+        self._set(_PROBE_UNTIL, value)
+
+    @property
+    def unlimited(self) -> bool:
+        return self._get(_UNLIMITED)
+
+    @unlimited.setter
+    def unlimited(self, value: bool) -> None:
+        self._set(_UNLIMITED, value)
+
+class SharedRateLimiter(RateLimiter):
+    """
+        A rate limiter whose buckets live in a memory mapped file, so every process on the machine using the same
+        file shares one budget per bucket, for example the workers of a gunicorn server. No external service is needed.
+
+        The file holds a fixed-size hash table; when it is full, the least recently used buckets are reused.
+        Only POSIX systems are supported, since the table is locked with `fcntl`.
+    """
+    path: str
+    slots: int
+
+    def __init__(self, path: str, slots: int = 4096, max_retries: int = 5) -> None:
+        """
+            Opens (or creates) the shared table.
+
+            Args:
+                path (str): The path of the table file. Every process sharing limits must use the same path.
+                slots (int, optional): The number of buckets the table holds, ignored if the file already exists. Defaults to 4096.
+                max_retries (int, optional): How many times a request rejected with 429 is retried before giving up. Defaults to 5.
+
+            Raises:
+                ImportError: If the platform has no `fcntl` module.
+        """
+        try:
+            import fcntl
+        except ImportError:
+            raise ImportError("SharedRateLimiter needs fcntl, which is only available on POSIX systems.") from None
+        self._fcntl = fcntl
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._open(slots)
+        super().__init__(max_retries=max_retries)
+        # A lock held by another thread while forking would never be released in the child.
+        os.register_at_fork(after_in_child=self._reset_thread_lock)
+
+    def _reset_thread_lock(self) -> None:
+        self._thread_lock = threading.Lock()
+
+    def _open(self, slots: int) -> None:
+        self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX)
+        try:
+            size = os.fstat(self._fd).st_size
+            header = os.pread(self._fd, _HEADER.size, 0) if size >= _HEADER_SIZE else b""
+            if len(header) == _HEADER.size:
+                magic, existing_slots, _, boot_time, _ = _HEADER.unpack(header)
+                if magic == _MAGIC and size == _HEADER_SIZE + existing_slots * _SLOT.size:
+                    slots = existing_slots
+                    if abs(boot_time - _boot_time()) < 10:
+                        self.slots = slots
+                        self._map = mmap.mmap(self._fd, size)
+                        return
+            # A new file, or one left behind by an earlier boot: start from an empty table.
+            size = _HEADER_SIZE + slots * _SLOT.size
+            os.ftruncate(self._fd, 0)
+            os.ftruncate(self._fd, size)
+            self.slots = slots
+            self._map = mmap.mmap(self._fd, size)
+            _HEADER.pack_into(self._map, 0, _MAGIC, slots, 0, _boot_time(), 0.0)
+        finally:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN)
+
+    def _acquire(self) -> None:
+        self._thread_lock.acquire()
+        try:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def _release(self) -> None:
+        self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN)
+        self._thread_lock.release()
+
+    def _find_slot(self, digest: bytes) -> int:
+        # Open addressing with linear probing. Slots are never emptied, only reused, so an empty slot ends a search.
+        now = time.monotonic()
+        start = int.from_bytes(digest[:8], "little") % self.slots
+        victim = None
+        victim_score = None
+        for probe in range(min(_MAX_PROBES, self.slots)):
+            offset = _HEADER_SIZE + (start + probe) % self.slots * _SLOT.size
+            values = _SLOT.unpack_from(self._map, offset)
+            if values[0] == digest:
+                _SLOT.pack_into(self._map, offset, *values[:_LAST_USED], now, values[_UNLIMITED])
+                return offset
+            if values[0] == _EMPTY:
+                victim = offset
+                break
+            # Prefer reusing a bucket whose window and probe are over, then the least recently used one.
+            idle = values[_RESET_AT] <= now and values[_PROBE_UNTIL] <= now
+            score = (not idle, values[_LAST_USED])
+            if victim_score is None or score < victim_score:
+                victim, victim_score = offset, score
+        _SLOT.pack_into(self._map, victim, digest, -1, -1, 0.0, 0.0, 0.0, now, False)
+        return victim
+
+    def _new_bucket(self, key: str) -> RateLimitBucket:
+        return SharedRateLimitBucket(self, key)
+
+    def _bucket_key(self, route: str, bucket_id: str) -> str:
+        # Other processes may not have learned the route's bucket ID yet, so buckets are shared by route alone;
+        # the bucket ID adds nothing to a key that already holds the route.
+        return route
+
+    @property
+    def _global_reset_at(self) -> float:
+        return _HEADER.unpack_from(self._map, 0)[4]
+
+    @_global_reset_at.setter
+    def _global_reset_at(self, value: float) -> None:
+        # Only ever pushed back, so a process starting up can't clear a global limit another process hit.
+        with _TableLock(self):
+            values = list(_HEADER.unpack_from(self._map, 0))
+            values[4] = max(values[4], value)
+            _HEADER.pack_into(self._map, 0, *values)
+
+    def close(self) -> None:
+        """
+            Unmaps and closes the table file. The file itself is kept for the other processes.
+        """
+        self._map.close()
+        os.close(self._fd)
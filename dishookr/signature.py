@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import threading
+import time
+
+_verify_keys: Dict[str, Any] = {}
+_verify_keys_lock = threading.Lock()
+
+def get_verify_key(public_key: str):
+    """
+        Returns the PyNaCl verify key of an application's public key, parsed once and cached for the process.
+
+        Args:
+            public_key (str): The public key of the application, hex-encoded as shown in the developer portal.
+
+        Returns:
+            nacl.signing.VerifyKey: The verify key.
+
+        Raises:
+            ImportError: If PyNaCl isn't installed.
+            ValueError: If the public key is invalid.
+    """
+    key = _verify_keys.get(public_key)
+    if key is not None:
+        return key
+    try:
+        from nacl.signing import VerifyKey
+    except ImportError:
+        raise ImportError("Signature verification requires PyNaCl, install it with `pip install dishookr[interactions]`.") from None
+    try:
+        key = VerifyKey(bytes.fromhex(public_key))
+    except Exception as e:
+        raise ValueError(f"Invalid public key: {public_key!r}") from e
+    with _verify_keys_lock:
+        return _verify_keys.setdefault(public_key, key)
+
+class SignatureVerifier(object):
+    """
+        Verifies the `X-Signature-Ed25519` and `X-Signature-Timestamp` headers Discord signs interactions with.
+        - https://discord.com/developers/docs/interactions/overview#setting-up-an-endpoint-validating-security-request-headers
+
+        The signature is checked against the raw request body, before it is decoded. Requests signed too long ago,
+        or whose signature was already accepted, are rejected before the signature is checked, which makes
+        replayed requests cheap to drop.
+    """
+    window: float
+    replay_cache_size: int
+
+    def __init__(self, public_key: str, window: float = 300.0, replay_cache_size: int = 4096) -> None:
+        """
+            Initializes the verifier.
+
+            Args:
+                public_key (str): The public key of the application, hex-encoded as shown in the developer portal.
+                window (float, optional): How far the signed timestamp may be from the current time, in seconds. Defaults to 300.
+                replay_cache_size (int, optional): How many accepted signatures are remembered to reject replays. Defaults to 4096.
+
+            Raises:
+                ImportError: If PyNaCl isn't installed.
+                ValueError: If the public key is invalid.
+        """
+        try:
+            from nacl.exceptions import BadSignatureError
+        except ImportError:
+            raise ImportError("Signature verification requires PyNaCl, install it with `pip install dishookr[interactions]`.") from None
+        self._key = get_verify_key(public_key)
+        self._bad_signature = BadSignatureError
+        self.window = window
+        self.replay_cache_size = replay_cache_size
+        self._seen: "OrderedDict[bytes, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, body: bytes, signature: Optional[str], timestamp: Optional[str]) -> bool:
+        """
+            Checks the signature of a request.
+
+            Args:
+                body (bytes): The raw request body.
+                signature (Optional[str]): The `X-Signature-Ed25519` header.
+                timestamp (Optional[str]): The `X-Signature-Timestamp` header.
+
+            Returns:
+                bool: Whether the request is genuine, recent and not a replay.
+        """
+        if not signature or not timestamp:
+            return False
+        try:
+            signed_at = int(timestamp)
+            signature_bytes = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        if len(signature_bytes) != 64 or abs(time.time() - signed_at) > self.window:
+            return False
+        if signature_bytes in self._seen:
+            return False
+
+        try:
+            self._key.verify(timestamp.encode() + body, signature_bytes)
+        except self._bad_signature:
+            return False
+
+        with self._lock:
+            if signature_bytes in self._seen:
+                return False
+            self._seen[signature_bytes] = None
+            if len(self._seen) > self.replay_cache_size:
+                self._seen.popitem(last=False)
+        return True
@@ -0,0 +1,163 @@
+from typing import Any, Dict, FrozenSet, List, Tuple, Union
+import re
+
+from .app import Webhook
+from .objects.embed import Embed, MAX_EMBED_CHARACTERS
+from .encoding import dumps
+from .validation import check_payload
+
+PLACEHOLDER = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+# Discord's length limits of the strings a placeholder can be in, by path; "*" stands for any list index.
+STRING_LIMITS = {
+    ("content",): 2000,
+    ("username",): 80,
+    ("embeds", "*", "title"): 256,
+    ("embeds", "*", "description"): 4096,
+    ("embeds", "*", "fields", "*", "name"): 256,
+    ("embeds", "*", "fields", "*", "value"): 1024,
+    ("embeds", "*", "footer", "text"): 2048,
+    ("embeds", "*", "author", "name"): 256,
+    ("poll", "question", "text"): 300,
+    ("poll", "answers", "*", "poll_media", "text"): 55,
+}
+# The strings Discord rejects when empty; the others may render to "".
+STRING_MINIMUMS = {
+    ("username",): 1,
+    ("embeds", "*", "fields", "*", "name"): 1,
+    ("embeds", "*", "fields", "*", "value"): 1,
+    ("embeds", "*", "footer", "text"): 1,
+    ("embeds", "*", "author", "name"): 1,
+    ("poll", "question", "text"): 1,
+}
+# The embed strings counting towards MAX_EMBED_CHARACTERS, which all the embeds of a message share.
+EMBED_TOTAL_PATHS = {path for path in STRING_LIMITS if path[0] == "embeds"}
+MAX_EMBEDS = 10
+
+def _static(value: Any) -> Any:
+    # The message as if every placeholder rendered to "": a string made only of placeholders is left out, since
+    # its length is only known once rendered.
+    if isinstance(value, dict):
+        return {key: _static(child) for key, child in value.items()}
+    if isinstance(value, list):
+        return [_static(child) for child in value]
+    if isinstance(value, str) and PLACEHOLDER.search(value):
+        return PLACEHOLDER.sub("", value) or None
+    return value
+
+class MessageTemplate(object):
+    """
+        A message frozen with `{name}` placeholders in its strings, for alerts that are sent over and over with only
+        a few values changed:
+
+            template = MessageTemplate(webhook)  # webhook.set_content("{service} is down"), ...
+            template.send(webhook, service="api", region="eu-west-1")
+
+        The message is validated and encoded to JSON once, with its placeholders left empty. Rendering only escapes
+        the values and splices them between the pre-encoded fragments, which is much faster than building and
+        encoding the objects again. Each string holding placeholders is checked against its Discord limits when
+        rendered, and so is the combined length of the embeds.
+    """
+    placeholders: FrozenSet[str]
+
+    def __init__(self, message: Union[Webhook, Embed, dict]) -> None:
+        """
+            Freezes a message into a template.
+
+            Args:
+                message (Union[Webhook, Embed, dict]): The message: a webhook (only its message is used, not its URL), a single embed, or a serialized message.
+
+            Raises:
+                ValueError: If the webhook has files, which can't be templated, or the message has more than 10 embeds.
+                ValidationError: If the static text of the message breaks Discord's limits, whatever the placeholders render to.
+        """
+        if isinstance(message, Webhook):
+            if message.files:
+                raise ValueError("Messages with files can't be templated.")
+            payload = message.to_dict()
+        elif isinstance(message, Embed):
+            payload = {"embeds": [message.to_dict()]}
+        else:
+            payload = message
+        if len(payload.get("embeds") or []) > MAX_EMBEDS:
+            raise ValueError(f"A message cannot have more than {MAX_EMBEDS} embeds.")
+        check_payload(_static(payload))
+
+        self._limits: List[Tuple[str, int, int, int, Tuple[str, ...]]] = []
+        self._embed_static = 0
+        self._embed_names: List[str] = []
+        self._collect(payload, ())
+
+        parts = PLACEHOLDER.split(dumps(payload).decode())
+        self._fragments = [part.encode() for part in parts[0::2]]
+        self._names = parts[1::2]
+        self.placeholders = frozenset(self._names)
+
+    def _collect(self, value: Any, path: Tuple[Union[str, int], ...]) -> None:
+        # Records the limited strings holding placeholders with the length of their static text, and the static
+        # length and placeholders of the strings counting towards the embed total.
+        if isinstance(value, dict):
+            for key, child in value.items():
+                self._collect(child, path + (key,))
+        elif isinstance(value, list):
+            for i, child in enumerate(value):
+                self._collect(child, path + (i,))
+        elif isinstance(value, str):
+            pattern = tuple("*" if isinstance(part, int) else part for part in path)
+            if pattern not in STRING_LIMITS:
+                return
+            names = tuple(PLACEHOLDER.findall(value))
+            static = len(PLACEHOLDER.sub("", value)) if names else len(value)
+            if names:
+                self._limits.append((".".join(map(str, path)), STRING_MINIMUMS.get(pattern, 0), STRING_LIMITS[pattern], static, names))
+            if pattern in EMBED_TOTAL_PATHS:
+                self._embed_static += static
+                self._embed_names.extend(names)
+
+    def render(self, **values: Any) -> bytes:
+        """
+            Renders the message with the given values.
+
+            Args:
+                **values (Any): The value of each placeholder; values that aren't strings are converted with `str()`.
+
+            Returns:
+                bytes: The encoded JSON payload, ready for `Webhook.execute`.
+
+            Raises:
+                KeyError: If a placeholder has no value.
+                ValueError: If a rendered string is shorter or longer than Discord allows, or the rendered embeds exceed 6000 characters together.
+        """
+        missing = self.placeholders.difference(values)
+        if missing:
+            raise KeyError(f"No value for the placeholder(s): {', '.join(sorted(missing))}")
+        strings: Dict[str, str] = {name: value if isinstance(value, str) else str(value) for name, value in values.items()}
+
+        for path, minimum, limit, static, names in self._limits:
+            length = static + sum(len(strings[name]) for name in names)
+            if length > limit:
+                raise ValueError(f"Rendered {path} cannot exceed {limit} characters.")
+            if length < minimum:
+                raise ValueError(f"Rendered {path} cannot be empty.")
+        if self._embed_static + sum(len(strings[name]) for name in self._embed_names) > MAX_EMBED_CHARACTERS:
+            raise ValueError(f"Rendered embeds cannot exceed {MAX_EMBED_CHARACTERS} characters together.")
+
+        escaped = {name: dumps(strings[name])[1:-1] for name in self.placeholders}
+        fragments = self._fragments
+        parts = [fragments[0]]
+        for name, fragment in zip(self._names, fragments[1:]):
+            parts.append(escaped[name])
+            parts.append(fragment)
+        return b"".join(parts)
+
+    def send(self, webhook: Webhook, **values: Any):
+        """
+            Renders the message and sends it through a webhook's URL, session pool, rate limiter and retry policy.
+
+            Args:
+                webhook (Webhook): The webhook to send through; an `AsyncWebhook` returns a coroutine to await.
+                **values (Any): The value of each placeholder.
+
+            Returns:
+                requests.Response: The webhook response from Discord.
+        """
+        return webhook.execute(self.render(**values))
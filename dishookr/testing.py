@@ -0,0 +1,396 @@
+"""
+    An in-memory stand-in for Discord's webhook API, for tests, benchmarks and load tests that must not reach Discord.
+"""
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import asyncio
+import hashlib
+import math
+import re
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .http import Response
+from .multipart import MultipartEncoder
+from .transport import Transport, AsyncTransport
+from .encoding import dumps, loads
+from .validation import validate_payload
+
+DISCORD_EPOCH = 1420070400000
+_ROUTE = re.compile(r"^/api(?:/v\d+)?/webhooks/(\d+)/([^/]+)(?:/messages/(\d+|@original))?/?$")
+
+class FakeRequest(NamedTuple):
+    """
+        A request received by `FakeDiscord`.
+    """
+    method: str
+    path: str
+    payload: Optional[dict]
+    status: int
+
+def _milliseconds(seconds: float) -> float:
+    # Rounded up, so a client waiting exactly as long as it is told never arrives before the window resets.
+    return math.ceil(seconds * 1000) / 1000
+
+class _Bucket(object):
+    def __init__(self, key: str) -> None:
+        self.id = hashlib.sha1(key.encode()).hexdigest()[:32]
+        self.remaining = 0
+        self.reset_at = 0.0
+
+def _parse_multipart(body: bytes, content_type: str) -> Tuple[dict, List[Tuple[str, int]]]:
+    boundary = content_type.split("boundary=", 1)[1].strip('"').encode()
+    payload: dict = {}
+    files = []
+    for part in body.split(b"--" + boundary)[1:-1]:
+        head, _, data = part.partition(b"\r\n\r\n")
+        data = data[:-2]  # the part's trailing CRLF
+        disposition = re.search(rb'name="([^"]*)"(?:; filename="([^"]*)")?', head)
+        if disposition is None:
+            continue
+        if disposition.group(1) == b"payload_json":
+            payload = loads(data)
+        elif disposition.group(2) is not None:
+            files.append((disposition.group(2).decode(), len(data)))
+    return payload, files
+
+class FakeDiscord(Transport):
+    """
+        A transport that answers webhook requests in memory, the way Discord would, without any network I/O.
+
+        Payloads are validated against Discord's limits (invalid ones get the same 400 "Invalid Form Body" answer),
+        `wait=true` sends get realistic message objects, and messages can be edited and deleted. Interaction tokens
+        work too: the first edit of `@original` stands in for the deferred response and creates it. Per-webhook bucket
+        and global rate limits are emulated with Discord's `X-RateLimit-*` headers and 429 bodies.
+
+        Webhooks are created on first use; a later request with another token is rejected with 401, and
+        `delete_webhook` makes a webhook answer 404. Pass it to a webhook as its `session_pool`.
+    """
+    bucket_limit: int
+    bucket_window: float
+    global_limit: int
+    latency: float
+    record: bool
+    messages: Dict[int, dict]
+    requests: List[FakeRequest]
+    status_counts: Dict[int, int]
+    transient_errors = (requests.ConnectionError,)
+    timeout_errors = (requests.Timeout,)
+
+    def __init__(self,
+                 bucket_limit: int = 5,
+                 bucket_window: float = 2.0,
+                 global_limit: int = 50,
+                 latency: float = 0.0,
+                 record: bool = True,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+            Initializes the fake.
+
+            Args:
+                bucket_limit (int, optional): The requests allowed per webhook and method in each bucket window. Defaults to 5.
+                bucket_window (float, optional): The length of a bucket window in seconds. Defaults to 2.0.
+                global_limit (int, optional): The requests allowed per second across every webhook. Defaults to 50.
+                latency (float, optional): How long each request takes, in seconds, to emulate the network. Defaults to 0.0.
+                record (bool, optional): Whether received requests are kept in `requests`; turn it off for long load tests. Defaults to True.
+                clock (Callable[[], float], optional): The clock rate limits are measured with. Defaults to `time.monotonic`.
+        """
+        self.bucket_limit = bucket_limit
+        self.bucket_window = bucket_window
+        self.global_limit = global_limit
+        self.latency = latency
+        self.record = record
+        self.clock = clock
+
+        self.messages = {}
+        self.requests = []
+        self.status_counts = {}
+        self._webhooks: Dict[int, dict] = {}
+        self._buckets: Dict[str, _Bucket] = {}
+        self._global_count = 0
+        self._global_reset_at = 0.0
+        self._failures: List[Tuple[Optional[int], Optional[BaseException]]] = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def fail(self, status: Optional[int] = 500, times: int = 1, error: Optional[BaseException] = None) -> None:
+        """
+            Makes the next requests fail, to exercise retries and circuit breaking.
+
+            Args:
+                status (Optional[int], optional): The status code the requests are answered with. Defaults to 500.
+                times (int, optional): The number of requests that fail. Defaults to 1.
+                error (Optional[BaseException], optional): An exception raised instead of answering, such as `requests.ConnectionError()`. Defaults to None.
+        """
+        with self._lock:
+            self._failures.extend([(status, error)] * times)
+
+    def delete_webhook(self, webhook_id: int) -> None:
+        """
+            Deletes a webhook, so requests to it are answered with 404 Unknown Webhook.
+
+            Args:
+                webhook_id (int): The ID of the webhook.
+        """
+        with self._lock:
+            self._webhooks[webhook_id] = {"deleted": True}
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.handle(method, url, **kwargs)
+
+    def handle(self, method: str, url: str, **kwargs) -> Response:
+        """
+            Answers a request right away, without the emulated latency.
+
+            Args:
+                method (str): The HTTP method.
+                url (str): The requested URL.
+                **kwargs: The body and headers, named like the arguments of `requests.Session.request`.
+
+            Returns:
+                Response: The answer Discord would have given.
+        """
+        method = method.upper()
+        parts = urlsplit(url)
+        payload, files = self._read_body(kwargs)
+        with self._lock:
+            if self._failures:
+                status, error = self._failures.pop(0)
+                if error is not None:
+                    raise error
+                result = self._json(status, {"message": "Injected failure", "code": 0})
+            else:
+                result = self._route(method, parts.path, parse_qs(parts.query), payload, files)
+            self.status_counts[result.status_code] = self.status_counts.get(result.status_code, 0) + 1
+            if self.record:
+                self.requests.append(FakeRequest(method, parts.path, payload, result.status_code))
+        return result
+
+    @staticmethod
+    def _read_body(kwargs: dict) -> Tuple[Optional[dict], List[Tuple[str, int]]]:
+        if kwargs.get("json") is not None:
+            # Round trip through JSON, so payloads requests couldn't encode fail here too.
+            return loads(dumps(kwargs["json"])), []
+        data = kwargs.get("data")
+        if data is None:
+            return None, []
+        if isinstance(data, MultipartEncoder):
+            body = b"".join(data)
+            content_type = data.content_type
+        else:
+            body = data.encode() if isinstance(data, str) else bytes(data)
+            content_type = CaseInsensitiveDict(kwargs.get("headers") or {}).get("Content-Type", "application/json")
+        if content_type.startswith("multipart/form-data"):
+            return _parse_multipart(body, content_type)
+        return loads(body) if body else None, []
+
+    def _json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+        content = dumps(body) if body is not None else b""
+        response_headers = CaseInsensitiveDict(headers or {})
+        if body is not None:
+            response_headers["Content-Type"] = "application/json"
+        return Response(status_code=status, headers=response_headers, content=content)
+
+    def _rate_limit(self, key: str, now: float) -> Tuple[Optional[Response], Dict[str, str]]:
+        if now >= self._global_reset_at:
+            self._global_count = 0
+            self._global_reset_at = now + 1.0
+        if self._global_count >= self.global_limit:
+            retry_after = _milliseconds(self._global_reset_at - now)
+            headers = {"Retry-After": str(max(1, round(retry_after))), "X-RateLimit-Global": "true", "X-RateLimit-Scope": "global"}
+            return self._json(429, {"message": "You are being rate limited.", "retry_after": retry_after, "global": True}, headers), {}
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(key)
+        if now >= bucket.reset_at:
+            bucket.remaining = self.bucket_limit
+            bucket.reset_at = now + self.bucket_window
+        reset_after = _milliseconds(bucket.reset_at - now)
+        headers = {
+            "X-RateLimit-Bucket": bucket.id,
+            "X-RateLimit-Limit": str(self.bucket_limit),
+            "X-RateLimit-Reset": f"{time.time() + reset_after:.3f}",
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+        }
+        if bucket.remaining <= 0:
+            headers.update({"X-RateLimit-Remaining": "0", "Retry-After": str(max(1, round(reset_after))), "X-RateLimit-Scope": "user"})
+            return self._json(429, {"message": "You are being rate limited.", "retry_after": reset_after, "global": False}, headers), {}
+
+        self._global_count += 1
+        bucket.remaining -= 1
+        headers["X-RateLimit-Remaining"] = str(bucket.remaining)
+        return None, headers
+
+    def _route(self, method: str, path: str, query: Dict[str, List[str]], payload: Optional[dict], files: List[Tuple[str, int]]) -> Response:
+        match = _ROUTE.match(path)
+        if match is None:
+            return self._json(404, {"message": "404: Not Found", "code": 0})
+        webhook_id, token, message_id = int(match.group(1)), match.group(2), match.group(3)
+
+        webhook = self._webhooks.setdefault(webhook_id, {"token": token, "channel_id": self._snowflake()})
+        if webhook.get("deleted"):
+            return self._json(404, {"message": "Unknown Webhook", "code": 10015})
+        if webhook["token"] != token:
+            return self._json(401, {"message": "Invalid Webhook Token", "code": 50027})
+
+        limited, headers = self._rate_limit(f"{method} {webhook_id}", self.clock())
+        if limited is not None:
+            return limited
+
+        if message_id is None:
+            if method != "POST":
+                return self._json(405, {"message": "405: Method Not Allowed", "code": 0}, headers)
+            return self._create(webhook_id, webhook, query, payload or {}, files, headers)
+
+        if message_id == "@original":
+            message = self.messages.get(webhook.get("original"))
+            if message is None and method == "PATCH":
+                # An interaction token's original response: the deferred one Discord holds until it is edited.
+                message = self._original(webhook_id, webhook)
+        else:
+            message = self.messages.get(int(message_id))
+        if message is None or message["webhook_id"] != str(webhook_id):
+            return self._json(404, {"message": "Unknown Message", "code": 10008}, headers)
+        if method == "DELETE":
+            del self.messages[int(message["id"])]
+            return self._json(204, None, headers)
+        if method == "PATCH":
+            return self._edit(message, payload or {}, files, headers)
+        if method == "GET":
+            return self._json(200, message, headers)
+        return self._json(405, {"message": "405: Method Not Allowed", "code": 0}, headers)
+
+    def _create(self, webhook_id: int, webhook: dict, query: Dict[str, List[str]], payload: dict, files: List[Tuple[str, int]], headers: Dict[str, str]) -> Response:
+        errors = validate_payload(payload, len(files))
+        if errors:
+            return self._json(400, {"message": "Invalid Form Body", "code": 50035, "errors": errors}, headers)
+        if not (payload.get("content") or payload.get("embeds") or payload.get("components") or payload.get("poll") or files):
+            return self._json(400, {"message": "Cannot send an empty message", "code": 50006}, headers)
+
+        message = self._message(webhook_id, webhook, payload, files, query.get("thread_id", [None])[0])
+        self.messages[int(message["id"])] = message
+        if query.get("wait", ["false"])[0].lower() != "true":
+            return self._json(204, None, headers)
+        return self._json(200, message, headers)
+
+    def _original(self, webhook_id: int, webhook: dict) -> dict:
+        message = self._message(webhook_id, webhook, {}, [])
+        self.messages[int(message["id"])] = message
+        webhook["original"] = int(message["id"])
+        return message
+
+    def _message(self, webhook_id: int, webhook: dict, payload: dict, files: List[Tuple[str, int]], thread_id: Optional[str] = None) -> dict:
+        message = {
+            "id": str(self._snowflake()),
+            "type": 0,
+            "content": payload.get("content") or "",
+            "channel_id": thread_id or str(webhook["channel_id"]),
+            "author": {"id": str(webhook_id), "username": payload.get("username") or "Captain Hook", "avatar": None, "discriminator": "0000", "bot": True},
+            "attachments": self._attachments(payload, files),
+            "embeds": [{key: value for key, value in embed.items() if value is not None} for embed in payload.get("embeds") or []],
+            "mentions": [],
+            "mention_roles": [],
+            "pinned": False,
+            "mention_everyone": False,
+            "tts": bool(payload.get("tts")),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "edited_timestamp": None,
+            "flags": 0,
+            "components": payload.get("components") or [],
+            "webhook_id": str(webhook_id),
+        }
+        if payload.get("poll"):
+            message["poll"] = payload["poll"]
+        return message
+
+    def _edit(self, message: dict, payload: dict, files: List[Tuple[str, int]], headers: Dict[str, str]) -> Response:
+        edited = dict(message)
+        for key in ("content", "embeds", "components"):
+            if key in payload:
+                edited[key] = payload[key] if payload[key] is not None else ([] if key != "content" else "")
+        if "attachments" in payload or files:
+            edited["attachments"] = self._attachments(payload, files)
+        errors = validate_payload(edited, len(files))
+        if errors:
+            return self._json(400, {"message": "Invalid Form Body", "code": 50035, "errors": errors}, headers)
+        edited["edited_timestamp"] = datetime.now(timezone.utc).isoformat()
+        message.update(edited)
+        return self._json(200, message, headers)
+
+    def _attachments(self, payload: dict, files: List[Tuple[str, int]]) -> List[dict]:
+        attachments = []
+        for index, (filename, size) in enumerate(files):
+            described = next((a for a in payload.get("attachments") or [] if str(a.get("id")) == str(index)), {})
+            attachment_id = self._snowflake()
+            attachments.append({
+                "id": str(attachment_id),
+                "filename": filename,
+                "description": described.get("description"),
+                "size": size,
+                "url": f"https://cdn.discordapp.com/attachments/0/{attachment_id}/{filename}",
+            })
+        return attachments
+
+    def _snowflake(self) -> int:
+        self._sequence = (self._sequence + 1) & 0xFFF
+        return ((int(time.time() * 1000) - DISCORD_EPOCH) << 22) | self._sequence
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+        """
+            Serves the fake over HTTP in a background thread, for load testing other processes or the real transport.
+
+            Args:
+                host (str, optional): The address to listen on. Defaults to "127.0.0.1".
+                port (int, optional): The port to listen on, 0 for any free port. Defaults to 0.
+
+            Returns:
+                Tuple[ThreadingHTTPServer, str]: The server, and the base URL to build webhook URLs on (`{base}/api/webhooks/{id}/{token}`).
+        """
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                try:
+                    result = fake.request(self.command, self.path, data=body, headers={"Content-Type": self.headers.get("Content-Type", "application/json")})
+                except requests.RequestException:
+                    self.close_connection = True
+                    return
+                self.send_response(result.status_code)
+                for key, value in result.headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(result.content)))
+                self.end_headers()
+                self.wfile.write(result.content)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _reply
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="dishookr-fake-discord", daemon=True).start()
+        return server, f"http://{server.server_address[0]}:{server.server_address[1]}"
+
+class AsyncFakeDiscord(FakeDiscord, AsyncTransport):
+    """
+        The asyncio counterpart of `FakeDiscord`, for `AsyncWebhook`. Latency is emulated without blocking the event loop.
+    """
+    async def request(self, method: str, url: str, **kwargs) -> Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.handle(method, url, **kwargs)
+
+    async def close(self) -> None:
+        pass
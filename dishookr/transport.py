@@ -0,0 +1,58 @@
+from typing import Any
+from abc import ABC, abstractmethod
+
+class Transport(ABC):
+    """
+        Sends the HTTP requests of webhooks. `SessionPool` is the default; other transports, such as
+        `dishookr.testing.FakeDiscord`, can be passed to a webhook as its `session_pool`.
+
+        A transport's `request` takes the arguments of `requests.Session.request` (`json`, `data`, `headers`, ...)
+        and returns a response with `status_code`, `headers`, `content`, `text` and `json()`.
+    """
+    transient_errors: tuple = ()  # errors raised before Discord could have received the request, safe to retry
+    timeout_errors: tuple = ()  # errors raised when Discord took too long to answer, not retried
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        """
+            Sends a request.
+
+            Args:
+                method (str): The HTTP method.
+                url (str): The URL to request.
+                **kwargs: The body and headers of the request, named like the arguments of `requests.Session.request`.
+
+            Returns:
+                Any: The response.
+        """
+
+    def close(self) -> None:
+        """
+            Releases the transport's connections.
+        """
+
+class AsyncTransport(ABC):
+    """
+        The asyncio counterpart of `Transport`, used by `AsyncWebhook`. `AsyncSessionPool` is the default.
+    """
+    transient_errors: tuple = ()
+    timeout_errors: tuple = ()
+
+    @abstractmethod
+    async def request(self, method: str, url: str, **kwargs) -> Any:
+        """
+            Sends a request.
+
+            Args:
+                method (str): The HTTP method.
+                url (str): The URL to request.
+                **kwargs: The body and headers of the request, named like the arguments of `requests.Session.request`.
+
+            Returns:
+                Any: The fully read response.
+        """
+
+    async def close(self) -> None:
+        """
+            Releases the transport's connections.
+        """
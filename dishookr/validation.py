@@ -0,0 +1,166 @@
+from typing import Any, Dict, Optional, Union
+from datetime import datetime
+from enum import Enum
+import threading
+
+from .exceptions import ValidationError
+
+class ValidationMode(Enum):
+    """
+        When messages are checked against Discord's limits.
+
+        - EAGER: every change is checked as it is made, and the first violation is raised right away.
+        - LAZY: nothing is checked while a message is built; the whole message is checked in one pass when it is
+          sent, and every violation is raised together in a `ValidationError`.
+        - OFF: nothing is checked, for messages known to be valid such as rendered templates.
+    """
+    EAGER = "eager"
+    LAZY = "lazy"
+    OFF = "off"
+
+_default_mode = ValidationMode.EAGER
+_default_mode_lock = threading.Lock()
+
+def get_default_validation_mode() -> ValidationMode:
+    """
+        Returns the validation mode of embeds, polls, and webhooks that aren't given their own.
+
+        Returns:
+            ValidationMode: The default validation mode.
+    """
+    return _default_mode
+
+def set_default_validation_mode(mode: Union[str, ValidationMode]) -> None:
+    """
+        Replaces the default validation mode.
+
+        Args:
+            mode (Union[str, ValidationMode]): The mode, or its name: "eager", "lazy" or "off".
+    """
+    global _default_mode
+    with _default_mode_lock:
+        _default_mode = ValidationMode(mode)
+
+def eager(mode: Optional[ValidationMode] = None) -> bool:
+    """
+        Returns whether changes are checked as they are made.
+
+        Args:
+            mode (Optional[ValidationMode], optional): A webhook's own mode. Defaults to the default mode.
+
+        Returns:
+            bool: True in eager mode.
+    """
+    return (mode or _default_mode) is ValidationMode.EAGER
+
+def lazy(mode: Optional[ValidationMode] = None) -> bool:
+    """
+        Returns whether messages are checked in one pass when they are sent.
+
+        Args:
+            mode (Optional[ValidationMode], optional): A webhook's own mode. Defaults to the default mode.
+
+        Returns:
+            bool: True in lazy mode.
+    """
+    return (mode or _default_mode) is ValidationMode.LAZY
+
+def _error(errors: Dict[str, Any], path: str, code: str, message: str) -> None:
+    # Discord nests form errors by path: {"embeds": {"0": {"title": {"_errors": [...]}}}}
+    node = errors
+    for part in path.split("."):
+        node = node.setdefault(part, {})
+    node.setdefault("_errors", []).append({"code": code, "message": message})
+
+def _check_length(errors: Dict[str, Any], path: str, value: Any, maximum: int, minimum: int = 0) -> int:
+    if value is None:
+        return 0
+    if not isinstance(value, str):
+        _error(errors, path, "BASE_TYPE_STRING", "Must be a string.")
+        return 0
+    if not minimum <= len(value) <= maximum:
+        _error(errors, path, "BASE_TYPE_BAD_LENGTH", f"Must be between {minimum} and {maximum} in length.")
+    return len(value)
+
+def validate_payload(payload: dict, file_count: int = 0) -> Dict[str, Any]:
+    """
+        Checks a message payload against Discord's documented limits.
+
+        Args:
+            payload (dict): The JSON payload of the message.
+            file_count (int, optional): The number of uploaded files. Defaults to 0.
+
+        Returns:
+            Dict[str, Any]: The errors, nested like the `errors` of Discord's "Invalid Form Body" responses; empty if the payload is valid.
+    """
+    errors: Dict[str, Any] = {}
+    _check_length(errors, "content", payload.get("content"), 2000)
+    username = payload.get("username")
+    _check_length(errors, "username", username, 80, 1)
+    if isinstance(username, str) and ("clyde" in username.lower() or "discord" in username.lower()):
+        _error(errors, "username", "USERNAME_INVALID_CONTAINS", "Username cannot contain \"clyde\" or \"discord\".")
+
+    embeds = payload.get("embeds") or []
+    if len(embeds) > 10:
+        _error(errors, "embeds", "BASE_TYPE_MAX_LENGTH", "Must be 10 or fewer in length.")
+    total = 0
+    for i, embed in enumerate(embeds):
+        path = f"embeds.{i}"
+        total += _check_length(errors, f"{path}.title", embed.get("title"), 256)
+        total += _check_length(errors, f"{path}.description", embed.get("description"), 4096)
+        fields = embed.get("fields") or []
+        if len(fields) > 25:
+            _error(errors, f"{path}.fields", "BASE_TYPE_MAX_LENGTH", "Must be 25 or fewer in length.")
+        for j, field in enumerate(fields):
+            name, value = field.get("name"), field.get("value")
+            if type(name) is str and type(value) is str and 0 < len(name) <= 256 and 0 < len(value) <= 1024:
+                total += len(name) + len(value)  # the common case, without building the error paths
+                continue
+            total += _check_length(errors, f"{path}.fields.{j}.name", name, 256, 1)
+            total += _check_length(errors, f"{path}.fields.{j}.value", value, 1024, 1)
+        if embed.get("footer"):
+            total += _check_length(errors, f"{path}.footer.text", embed["footer"].get("text"), 2048, 1)
+        if embed.get("author"):
+            total += _check_length(errors, f"{path}.author.name", embed["author"].get("name"), 256, 1)
+        timestamp = embed.get("timestamp")
+        if timestamp is not None:
+            try:
+                datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+            except ValueError:
+                _error(errors, f"{path}.timestamp", "DATE_TIME_TYPE_PARSE", "Could not parse timestamp.")
+    if total > 6000:
+        _error(errors, "embeds", "MAX_EMBED_SIZE_EXCEEDED", "Embed size exceeds maximum size of 6000.")
+
+    if len(payload.get("components") or []) > 5:
+        _error(errors, "components", "BASE_TYPE_MAX_LENGTH", "Must be 5 or fewer in length.")
+    poll = payload.get("poll")
+    if poll:
+        _check_length(errors, "poll.question.text", (poll.get("question") or {}).get("text"), 300, 1)
+        answers = poll.get("answers") or []
+        if not 1 <= len(answers) <= 10:
+            _error(errors, "poll.answers", "BASE_TYPE_BAD_LENGTH", "Must be between 1 and 10 in length.")
+        for i, answer in enumerate(answers):
+            _check_length(errors, f"poll.answers.{i}.poll_media.text", (answer.get("poll_media") or {}).get("text"), 55)
+        duration = poll.get("duration")
+        if isinstance(duration, int) and duration > 168:
+            _error(errors, "poll.duration", "NUMBER_TYPE_MAX", "Must be 168 or less.")
+        if poll.get("layout_type", 1) != 1:
+            _error(errors, "poll.layout_type", "ENUM_TYPE_COERCE", "Value is not a valid enum value.")
+    if file_count > 10 or len(payload.get("attachments") or []) > 10:
+        _error(errors, "attachments", "BASE_TYPE_MAX_LENGTH", "Must be 10 or fewer in length.")
+    return errors
+
+def check_payload(payload: dict, file_count: int = 0) -> None:
+    """
+        Checks a message payload against Discord's documented limits in a single pass.
+
+        Args:
+            payload (dict): The JSON payload of the message.
+            file_count (int, optional): The number of uploaded files. Defaults to 0.
+
+        Raises:
+            ValidationError: With every violation found, if there is any.
+    """
+    errors = validate_payload(payload, file_count)
+    if errors:
+        raise ValidationError(errors)
@@ -0,0 +1,17 @@
+import asyncio
+from dishookr import AsyncWebhook, AsyncSessionPool
+
+""" AsyncWebhook requires aiohttp: pip install dishookr[async] """
+
+async def main():
+    # At most 50 messages are in flight at once, the rest wait their turn.
+    async with AsyncSessionPool(max_concurrency=50) as pool:
+        webhooks = []
+        for i in range(500):
+            webhook = AsyncWebhook("https://discord.webhook.url", session_pool=pool)
+            webhook.set_content(f"Message #{i}")
+            webhooks.append(webhook)
+
+        await asyncio.gather(*(webhook.send() for webhook in webhooks))
+
+asyncio.run(main())
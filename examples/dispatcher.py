@@ -0,0 +1,21 @@
+from dishookr import Webhook, WebhookDispatcher, OverflowPolicy
+
+"""
+- The dispatcher sends webhooks from worker threads, so submitting never waits on Discord.
+- When the queue is full, DROP_OLDEST evicts the message that has waited longest.
+"""
+
+dispatcher = WebhookDispatcher(workers=4, maxsize=1000, overflow=OverflowPolicy.DROP_OLDEST)
+
+for i in range(100):
+    webhook = Webhook("https://discord.webhook.url")
+    webhook.set_content(f"Alert #{i}")
+    dispatcher.submit(webhook)
+
+webhook = Webhook("https://discord.webhook.url", wait=True)
+webhook.set_content("I need the response!")
+future = dispatcher.submit(webhook)
+print(future.result().json())
+
+# Waits up to 10 seconds for everything queued to be sent.
+dispatcher.shutdown(timeout=10)
@@ -0,0 +1,11 @@
+from dishookr import Webhook, File
+
+webhook = Webhook("https://discord.webhook.url")
+
+webhook.set_content("Here are the logs from last night's incident.")
+
+""" Files are streamed from disk while sending, so large files are never held in memory. """
+webhook.add_file(File("incident.log", description="Application log"))
+webhook.add_file(File("screenshot.png", spoiler=True))
+
+webhook.send()
@@ -1,40 +1,34 @@
-from vortexkit import App, Request, JSONResponse
-from dishookr import InteractionResponse, InteractionCallbackMessage, InteractionResponseType
+from dishookr import InteractionApp, InteractionResponse, InteractionCallbackMessage, InteractionResponseType
 
 """
-    - This is an example of how to use the InteractionResponse class to create an interaction response object that is fully accepted by Discord.
-    - This InteractionResponse object is used in response to a discord interaction, received from a discord interaction callback.
-    - This webserver is ran by VortexKit, a lightweight web framework.
+    - This is an example of how to answer Discord interactions with the bundled InteractionApp.
+    - PINGs are answered for you; other interactions are routed to the handler registered for their command name or custom_id.
+    - InteractionApp is an ASGI application (app.wsgi is its WSGI counterpart), so any server can run it: uvicorn examples.interaction_response:app
 """
 
-app = App()
+app = InteractionApp(public_key="your application's public key")  # shown in the developer portal, needs `pip install dishookr[interactions]`
 
-@app.route("/interaction-callback")
-def interaction_callback(request: Request):
-    if not request.method == "POST":
-        return JSONResponse({"error": "Method not allowed"}, status_code=405)
-    
-    if not type(request.body) == dict:
-        return JSONResponse({"error": "Request body must be JSON"}, status_code=400)
-    
-    if request.body["type"] not in range(1,10):
-        return JSONResponse({"error": "Invalid interaction type"}, status_code=400)
-    
-    # Handle the button click with custom_id of "button1"
-    if request.body["type"] == 3 and request.body["data"]["custom_id"] == "button1":
-
-        my_dishook_response = InteractionResponse(
-                type=InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-                data=InteractionCallbackMessage(
-                    content="You clicked the button!"
-                )
-            )
-
-        return JSONResponse(
-            my_dishook_response.__dict__()
+# Handle the button click with custom_id of "button1"
+@app.component("button1")
+def button1(interaction):
+    return InteractionResponse(
+        type=InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+        data=InteractionCallbackMessage(
+            content="You clicked the button!"
         )
+    )
 
-    return JSONResponse({"error": "Invalid interaction type"}, status_code=400)
+# Handle every button whose custom_id starts with "vote:", such as "vote:yes" and "vote:no"
+@app.component("vote:", prefix=True)
+def vote(interaction):
+    choice = interaction.custom_id.split(":", 1)[1]
+    return InteractionResponse(
+        type=InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+        data=InteractionCallbackMessage(
+            content=f"You voted {choice}."
+        )
+    )
 
 if __name__ == "__main__":
-    app.run(host="localhost", port=8080)
+    from wsgiref.simple_server import make_server
+    make_server("localhost", 8080, app.wsgi).serve_forever()
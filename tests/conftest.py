@@ -0,0 +1,121 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, NamedTuple, Optional
+import itertools
+import json
+import threading
+import time
+
+import pytest
+
+from dishookr.testing import FakeDiscord, AsyncFakeDiscord
+
+_webhook_ids = itertools.count(1000)
+
+class StubRequest(NamedTuple):
+    method: str
+    path: str
+    headers: dict
+    body: bytes
+
+    @property
+    def payload(self) -> dict:
+        return json.loads(self.body)
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+
+    def _reply(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        request = StubRequest(self.command, self.path, dict(self.headers), self.rfile.read(length) if length else b"")
+        status, body, headers = self.server.stub._answer(request)
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_POST = do_PATCH = do_DELETE = do_GET = _reply
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # concurrent tests open many connections at once
+
+class Stub(object):
+    """ A local HTTP server standing in for Discord: it records requests and answers them with queued responses. """
+    requests: List[StubRequest]
+    delay: float
+
+    def __init__(self) -> None:
+        self.requests = []
+        self.delay = 0.0
+        self._responses = []
+        self._deleted = set()
+        self._message_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.server = _StubServer(("127.0.0.1", 0), _StubHandler)
+        self.server.stub = self
+        threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True).start()
+        host, port = self.server.server_address
+        self.base = f"http://{host}:{port}"
+
+    def url(self) -> str:
+        """ A webhook URL no other test uses, so shared rate limit state can't leak between tests. """
+        return f"{self.base}/api/webhooks/{next(_webhook_ids)}/token"
+
+    def queue(self, status: int, body: Optional[dict] = None, headers: Optional[dict] = None, times: int = 1) -> None:
+        """ Answers the next `times` requests with the given response instead of the default one. """
+        with self._lock:
+            self._responses.extend([(status, body, headers)] * times)
+
+    def delete(self, url: str) -> None:
+        """ Deletes the webhook at `url`: every later request to it gets Discord's Unknown Webhook error. """
+        with self._lock:
+            self._deleted.add(url[len(self.base):])
+
+    def _answer(self, request: StubRequest) -> tuple:
+        time.sleep(self.delay)
+        with self._lock:
+            self.requests.append(request)
+            if request.path.split("?")[0] in self._deleted:
+                return 404, {"message": "Unknown Webhook", "code": 10015}, None
+            if self._responses:
+                return self._responses.pop(0)
+            message_id = str(next(self._message_ids))
+        # Like Discord: the message is only returned when the sender waits for it.
+        if request.method == "PATCH" or (request.method == "POST" and "wait=true" in request.path):
+            return 200, {"id": message_id, **request.payload}, None
+        return 204, None, None
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def stub():
+    stub = Stub()
+    yield stub
+    stub.close()
+
+@pytest.fixture
+def fake() -> FakeDiscord:
+    """ A fake Discord with limits high enough not to get in the way, unless a test lowers them. """
+    return FakeDiscord(bucket_limit=1000, global_limit=10000)
+
+@pytest.fixture
+def async_fake() -> AsyncFakeDiscord:
+    return AsyncFakeDiscord(bucket_limit=1000, global_limit=10000)
+
+@pytest.fixture
+def served(fake):
+    """ The fake served over HTTP, for tests of the real transports; yields the base URL to build webhook URLs on. """
+    server, base = fake.serve()
+    yield base
+    server.shutdown()
+    server.server_close()
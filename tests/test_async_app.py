@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from dishookr import AsyncWebhook, AsyncSessionPool
+from dishookr.exceptions import EmptyWebhook
+from dishookr.http import Response
+
+def test_send_over_aiohttp(stub):
+    async def run():
+        async with AsyncSessionPool() as pool:
+            webhook = AsyncWebhook(stub.url(), wait=True, session_pool=pool)
+            webhook.set_content("over http")
+            return await webhook.send()
+    result = asyncio.run(run())
+    assert (result.status_code, result.json()["content"]) == (200, "over http")
+    assert stub.requests[-1].payload["content"] == "over http"
+
+def test_sends_run_concurrently(stub):
+    stub.delay = 0.2
+
+    async def run():
+        async with AsyncSessionPool() as pool:
+            webhooks = [AsyncWebhook(stub.url(), session_pool=pool) for _ in range(10)]
+            for webhook in webhooks:
+                webhook.set_content("hello")
+            started = asyncio.get_running_loop().time()
+            await asyncio.gather(*(webhook.send() for webhook in webhooks))
+            return asyncio.get_running_loop().time() - started
+    assert asyncio.run(run()) < 1.0
+    assert len(stub.requests) == 10
+
+def test_max_concurrency_bounds_requests_in_flight(stub):
+    stub.delay = 0.1
+
+    async def run():
+        async with AsyncSessionPool(max_concurrency=2) as pool:
+            started = asyncio.get_running_loop().time()
+            await asyncio.gather(*(pool.request("POST", stub.url(), json={"content": "hi"}) for _ in range(4)))
+            return asyncio.get_running_loop().time() - started
+    assert asyncio.run(run()) >= 0.2
+
+def test_one_session_per_event_loop():
+    pool = AsyncSessionPool()
+
+    async def session():
+        try:
+            return pool._get_session()[0]
+        finally:
+            await pool.close()
+    assert asyncio.run(session()) is not asyncio.run(session())
+    assert pool._sessions == {}
+
+def test_empty_webhooks_are_rejected_before_sending():
+    with pytest.raises(EmptyWebhook):
+        asyncio.run(AsyncWebhook("https://discord.com/api/webhooks/1/token").send())
+
+def test_response_helpers():
+    response = Response(200, {"Content-Type": "application/json"}, b'{"id": "1"}')
+    assert (response.ok, response.text, response.json()) == (True, '{"id": "1"}', {"id": "1"})
+    assert not Response(404, {}, b"").ok
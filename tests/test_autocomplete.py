@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from dishookr import AutocompleteIndex, Interaction, InteractionChoices
+from dishookr.objects.enums import Locale
+
+FRUITS = ["Apple", "Apricot", "Banana", "Blackberry", "Blueberry", "Cherry", "Grape", "Pineapple"]
+
+def names(choices) -> list:
+    return [choice.name for choice in choices]
+
+def fruit_index(**kwargs) -> AutocompleteIndex:
+    return AutocompleteIndex((InteractionChoices(name, name.lower()) for name in FRUITS), **kwargs)
+
+def test_prefix_search_is_case_insensitive_and_sorted():
+    index = fruit_index()
+    assert names(index.search("ap")) == ["Apple", "Apricot"]
+    assert names(index.search("BL")) == ["Blackberry", "Blueberry"]
+    assert names(index.search("")) == sorted(FRUITS)
+    assert index.search("kiwi") == []
+
+def test_results_are_limited_to_25():
+    index = AutocompleteIndex(InteractionChoices(f"item {n:03}", n) for n in range(100))
+    assert len(index.search("item")) == 25
+    assert names(index.search("item", limit=3)) == ["item 000", "item 001", "item 002"]
+
+def test_add_and_remove_update_cached_results():
+    index = fruit_index()
+    assert names(index.search("ch")) == ["Cherry"]
+    index.add(InteractionChoices("Chestnut", "chestnut"))
+    assert names(index.search("ch")) == ["Cherry", "Chestnut"]
+    index.add(InteractionChoices("Chestnuts", "chestnut"))  # same value, replaced
+    assert names(index.search("ch")) == ["Cherry", "Chestnuts"]
+    index.remove("cherry")
+    assert names(index.search("ch")) == ["Chestnuts"]
+    assert ("cherry" in index, len(index)) == (False, len(FRUITS))
+    with pytest.raises(KeyError):
+        index.remove("cherry")
+
+def test_fuzzy_matches_words_inside_names():
+    assert names(fruit_index().search("apple")) == ["Apple"]
+    assert names(fruit_index(fuzzy=True).search("apple")) == ["Apple", "Pineapple"]
+    assert "Grape" in names(fruit_index(fuzzy=True).search("grap3"))
+
+def test_removing_a_choice_keeps_shared_trigrams():
+    index = fruit_index(fuzzy=True)
+    index.remove("apple")
+    assert names(index.search("apple")) == ["Pineapple"]
+    index.remove("pineapple")
+    assert index.search("apple") == []
+    assert "app" not in index._ngrams
+
+def test_localized_names_are_matched_first():
+    index = AutocompleteIndex([
+        InteractionChoices("Apple", "apple", {Locale.DE: "Apfel"}),
+        InteractionChoices("Apricot", "apricot", {Locale.DE: "Aprikose"}),
+        InteractionChoices("Avocado", "avocado"),
+    ])
+    assert names(index.search("ap", locale="de")) == ["Apple", "Apricot"]
+    assert names(index.search("apf", locale=Locale.DE)) == ["Apple"]
+    assert names(index.search("apf")) == []
+    assert names(index.search("av", locale="not-a-locale")) == ["Avocado"]
+
+def test_respond_answers_the_focused_option():
+    index = fruit_index()
+    payload = {"type": 4, "id": "1", "application_id": "1", "token": "tok", "locale": "en-US",
+               "data": {"name": "fruit", "options": [{"name": "name", "type": 3, "value": "bl", "focused": True}]}}
+    response = index.respond(Interaction(payload)).to_dict()
+    assert response["type"] == 8
+    assert [choice["value"] for choice in response["data"]["choices"]] == ["blackberry", "blueberry"]
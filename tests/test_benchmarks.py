@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from benchmarks.payload_size import baseline, embed_heavy_webhook
+from benchmarks.run import format_time, measure
+from benchmarks.suite import BENCHMARKS
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_benchmark_runs(name):
+    BENCHMARKS[name]()()
+
+def test_measure_reports_per_call_times():
+    result = measure(lambda: (lambda: None), repeat=3, min_time=0.01)
+    assert result["repeat"] == 3 and result["number"] >= 1
+    assert 0 < result["min"] <= result["median"]
+
+def test_format_time():
+    assert [format_time(t) for t in (1.5, 0.0025, 3e-6, 4e-8)] == ["1.500s", "2.500ms", "3.000us", "40.0ns"]
+
+def test_payload_size_baseline_keeps_every_field():
+    webhook = embed_heavy_webhook()
+    payload = baseline(webhook)
+    assert payload["content"] is None and payload["embeds"][0]["footer"] is None
+    assert payload["embeds"][0]["fields"][0] == {"name": "Host", "value": "web-0", "inline": True}
+    assert len(json.dumps(payload)) > len(json.dumps(webhook.to_dict()))
@@ -0,0 +1,30 @@
+import pytest
+
+from dishookr import Webhook, File, broadcast
+
+def test_sends_to_every_url_once(stub):
+    urls = [stub.url() for _ in range(20)]
+    stub.delete(urls[6])
+    result = broadcast({"content": "maintenance at noon"}, urls + urls[:5], processes=2, threads=4)
+    assert len(result.outcomes) == 20
+    assert len(result.succeeded) == 19
+    [failed] = result.failed
+    assert (failed.url, failed.status) == (urls[6], 404)
+    assert sorted(request.path.split("?")[0] for request in stub.requests) == sorted(url[len(stub.base):] for url in urls)
+    assert all(request.payload == {"content": "maintenance at noon"} for request in stub.requests)
+    assert result.throughput > 0
+
+def test_unreachable_urls_are_reported():
+    result = broadcast(b'{"content": "hello"}', ["http://127.0.0.1:9/api/webhooks/1/token"], processes=1, threads=1)
+    [outcome] = result.outcomes.values()
+    assert outcome.status is None and not outcome.ok
+
+def test_files_cant_be_broadcast():
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    webhook.set_content("hello")
+    webhook.add_file(File(__file__))
+    with pytest.raises(ValueError):
+        broadcast(webhook, ["https://discord.com/api/webhooks/2/token"])
+
+def test_nothing_to_send():
+    assert broadcast({"content": "hello"}, []).outcomes == {}
@@ -0,0 +1,109 @@
+import time
+
+import pytest
+
+from dishookr import CircuitBreaker, CircuitState, CircuitOpen, DiscordServerError, NotFound, Unauthorized, RateLimiter, RetryPolicy, Webhook
+
+URL = "https://discord.com/api/webhooks/1/token"
+
+def make_webhook(url: str, breaker: CircuitBreaker, **kwargs) -> Webhook:
+    kwargs.setdefault("retry_policy", RetryPolicy(base_delay=0.001, budget=None))
+    webhook = Webhook(url, rate_limiter=RateLimiter(), circuit_breaker=breaker, **kwargs)
+    webhook.set_content("hello")
+    return webhook
+
+def test_opens_after_the_failure_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+    for _ in range(2):
+        breaker.record_failure(URL)
+    breaker.allow(URL)
+    breaker.record_failure(URL)
+    assert breaker.state(URL) is CircuitState.OPEN
+    with pytest.raises(CircuitOpen) as raised:
+        breaker.allow(URL + "?wait=true")
+    assert not raised.value.permanent
+
+def test_success_resets_the_count():
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure(URL)
+    breaker.record_success(URL)
+    breaker.record_failure(URL)
+    assert breaker.state(URL) is CircuitState.CLOSED
+
+def test_probe_closes_or_reopens_for_longer():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, max_reset_timeout=0.15)
+    breaker.record_failure(URL)
+    time.sleep(0.06)
+    breaker.allow(URL)
+    assert breaker.state(URL) is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.allow(URL)  # only one probe at a time
+    breaker.record_failure(URL)
+    assert breaker._circuits[URL].timeout == pytest.approx(0.1)
+    time.sleep(0.11)
+    breaker.allow(URL)
+    breaker.record_failure(URL)
+    assert breaker._circuits[URL].timeout == pytest.approx(0.15)  # capped
+    time.sleep(0.16)
+    breaker.allow(URL)
+    breaker.record_success(URL)
+    assert breaker.state(URL) is CircuitState.CLOSED
+
+def test_dead_webhooks_are_open_for_good():
+    dead = []
+    breaker = CircuitBreaker(on_dead=lambda url, status: dead.append((url, status)))
+    breaker.record_response(URL, 404, 10015)
+    breaker.record_response(URL, 404, 10015)
+    assert dead == [(URL, 404)]
+    assert breaker.dead() == [URL]
+    with pytest.raises(CircuitOpen) as raised:
+        breaker.allow(URL)
+    assert raised.value.permanent
+    breaker.reset(URL)
+    breaker.allow(URL)
+
+def test_unknown_message_keeps_the_webhook_alive():
+    breaker = CircuitBreaker()
+    breaker.record_response(URL, 404, 10008)
+    assert breaker.state(URL) is CircuitState.CLOSED
+
+def test_sends_to_a_deleted_webhook_fail_fast(stub):
+    webhook = make_webhook(stub.url(), CircuitBreaker())
+    stub.queue(404, {"message": "Unknown Webhook", "code": 10015})
+    with pytest.raises(NotFound):
+        webhook.send()
+    with pytest.raises(CircuitOpen):
+        webhook.send()
+    assert len(stub.requests) == 1
+
+def test_revoked_token_is_dead(stub):
+    breaker = CircuitBreaker()
+    webhook = make_webhook(stub.url(), breaker)
+    stub.queue(401, {"message": "Invalid Webhook Token", "code": 50027})
+    with pytest.raises(Unauthorized):
+        webhook.send()
+    assert breaker.dead() == [webhook.webhook_url]
+
+def test_failing_webhook_opens_and_recovers(stub):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    webhook = make_webhook(stub.url(), breaker, retry_policy=RetryPolicy(max_attempts=1, budget=None))
+    stub.queue(503, {"message": "unavailable"}, times=2)
+    for _ in range(2):
+        with pytest.raises(DiscordServerError):
+            webhook.send()
+    with pytest.raises(CircuitOpen):
+        webhook.send()
+    time.sleep(0.06)
+    webhook.send()
+    assert breaker.state(webhook.webhook_url) is CircuitState.CLOSED
+
+def test_late_failures_keep_an_open_circuits_backoff():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, max_reset_timeout=1.0)
+    breaker.record_failure(URL)
+    time.sleep(0.06)
+    breaker.allow(URL)
+    breaker.record_failure(URL)
+    retry_at = breaker._circuits[URL].retry_at
+    breaker.record_failure(URL)  # a request sent before the circuit opened
+    assert breaker._circuits[URL].timeout == pytest.approx(0.1)
+    assert breaker._circuits[URL].retry_at == retry_at
@@ -0,0 +1,110 @@
+import asyncio
+import io
+import time
+import warnings
+
+from dishookr import Webhook, AsyncWebhook, WebhookCoalescer, Embed, File, RateLimiter
+
+def destination(url, **kwargs):
+    """ Builds webhooks that share a URL and limiter, so the coalescer merges them. """
+    limiter = RateLimiter()
+    def make(content):
+        webhook = Webhook(url, rate_limiter=limiter, **kwargs)
+        if content is not None:
+            webhook.set_content(content)
+        return webhook
+    return make
+
+def test_packs_messages_to_one_destination(stub):
+    make = destination(stub.url())
+    with WebhookCoalescer(window=60) as coalescer:
+        for line in ("one", "two", "three"):
+            coalescer.push(make(line))
+    assert [request.payload["content"] for request in stub.requests] == ["one\ntwo\nthree"]
+
+def test_destinations_are_packed_apart(stub):
+    first, second = destination(stub.url()), destination(stub.url())
+    with WebhookCoalescer(window=60) as coalescer:
+        coalescer.push(first("a"))
+        coalescer.push(second("b"))
+        coalescer.push(first("c"))
+    assert sorted(request.payload["content"] for request in stub.requests) == ["a\nc", "b"]
+
+def test_window_flushes_on_its_own(stub):
+    coalescer = WebhookCoalescer(window=0.05)
+    coalescer.push(destination(stub.url())("later"))
+    deadline = time.monotonic() + 5
+    while not stub.requests and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [request.payload["content"] for request in stub.requests] == ["later"]
+
+def test_splits_batches_at_discord_limits():
+    make = destination("https://discord.com/api/webhooks/1/token")
+    coalescer = WebhookCoalescer(window=60)
+    webhooks = []
+    for i in range(12):
+        webhook = make(None)
+        webhook.add_embed(Embed(title=f"embed {i}"))
+        webhooks.append(webhook)
+    assert [len(webhook.embeds) for webhook in coalescer.pack(webhooks)] == [10, 2]
+    assert [len(webhook.content) for webhook in coalescer.pack([make("x" * 1500), make("y" * 1500)])] == [1500, 1500]
+
+def test_unmergeable_messages_keep_their_order():
+    sent = []
+    make = destination("https://discord.com/api/webhooks/1/token")
+    coalescer = WebhookCoalescer(window=60, sender=sent.append)
+    coalescer.push(make("before"))
+    upload = make(None)
+    upload.add_file(File(io.BytesIO(b"data"), "report.txt"))
+    coalescer.push(upload)
+    coalescer.push(make("after"))
+    coalescer.close()
+    assert [webhook.content for webhook in sent] == ["before", None, "after"]
+    assert sent[1] is upload
+
+def failing_sender(webhook):
+    if "dead" in webhook.content:
+        raise ConnectionError("gone")
+    return webhook.content
+
+def test_failed_destination_does_not_drop_other_batches():
+    dead, alive = destination("https://discord.com/api/webhooks/1/token"), destination("https://discord.com/api/webhooks/2/token")
+    errors = []
+    coalescer = WebhookCoalescer(window=60, sender=failing_sender, on_error=lambda webhook, error: errors.append((webhook.webhook_url, error)))
+    coalescer.push(dead("dead"))
+    coalescer.push(alive("delivered"))
+    results = coalescer.flush()
+    assert isinstance(results[0], ConnectionError) and results[1] == "delivered"
+    assert len(errors) == 1 and errors[0][0] == "https://discord.com/api/webhooks/1/token"
+
+def test_errors_are_logged_without_on_error(caplog):
+    coalescer = WebhookCoalescer(window=60, sender=failing_sender)
+    coalescer.push(destination("https://discord.com/api/webhooks/1/token")("dead"))
+    coalescer.flush()
+    assert "Failed to send a coalesced message" in caplog.text
+
+def test_async_webhooks_are_sent_on_their_event_loop(stub):
+    url = stub.url()
+
+    async def main():
+        coalescer = WebhookCoalescer(window=60)
+        for line in ("one", "two"):
+            webhook = AsyncWebhook(url)
+            webhook.set_content(line)
+            coalescer.push(webhook)
+        [future] = coalescer.flush()
+        await asyncio.wrap_future(future)
+    asyncio.run(main())
+    assert [request.payload["content"] for request in stub.requests] == ["one\ntwo"]
+
+def test_async_webhooks_without_an_event_loop_are_reported(stub):
+    errors = []
+    coalescer = WebhookCoalescer(window=60, on_error=lambda webhook, error: errors.append(error))
+    webhook = AsyncWebhook(stub.url())
+    webhook.set_content("one")
+    coalescer.push(webhook)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # no "coroutine was never awaited"
+        coalescer.flush()
+    assert len(errors) == 1 and isinstance(errors[0], TypeError)
+    assert not stub.requests
@@ -0,0 +1,153 @@
+import asyncio
+import gc
+import time
+import weakref
+
+import pytest
+
+from dishookr import Webhook, AsyncWebhook, WebhookDispatcher, AsyncWebhookDispatcher, OverflowPolicy
+from dishookr.exceptions import MessageDropped, QueueFull
+
+class SlowWebhook(object):
+    """ Stands in for a webhook stuck behind a long rate limit. """
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def send(self):
+        time.sleep(self.delay)
+        return "sent"
+
+class AsyncSlowWebhook(SlowWebhook):
+    async def send(self):
+        await asyncio.sleep(self.delay)
+        return "sent"
+
+def test_sends_submitted_webhooks(stub):
+    with WebhookDispatcher(workers=2) as dispatcher:
+        futures = []
+        for i in range(5):
+            webhook = Webhook(stub.url(), wait=True)
+            webhook.set_content(f"message {i}")
+            futures.append(dispatcher.submit(webhook))
+        assert [future.result(timeout=5).status_code for future in futures] == [200] * 5
+    assert sorted(request.payload["content"] for request in stub.requests) == [f"message {i}" for i in range(5)]
+
+def test_send_errors_fail_the_future():
+    with WebhookDispatcher(workers=1) as dispatcher:
+        future = dispatcher.submit(Webhook("https://discord.com/api/webhooks/1/token"))  # empty
+        with pytest.raises(Exception, match="must have content"):
+            future.result(timeout=5)
+
+def test_raise_policy_rejects_when_full():
+    dispatcher = WebhookDispatcher(workers=0, maxsize=1, overflow=OverflowPolicy.RAISE)
+    dispatcher.submit(SlowWebhook(0))
+    with pytest.raises(QueueFull):
+        dispatcher.submit(SlowWebhook(0))
+    dispatcher.shutdown(timeout=0)
+
+def test_block_policy_times_out():
+    dispatcher = WebhookDispatcher(workers=0, maxsize=1)
+    dispatcher.submit(SlowWebhook(0))
+    with pytest.raises(QueueFull):
+        dispatcher.submit(SlowWebhook(0), timeout=0.05)
+    dispatcher.shutdown(timeout=0)
+
+def test_drop_policies_fail_the_dropped_message():
+    oldest = WebhookDispatcher(workers=0, maxsize=1, overflow=OverflowPolicy.DROP_OLDEST)
+    first = oldest.submit(SlowWebhook(0))
+    kept = oldest.submit(SlowWebhook(0))
+    with pytest.raises(MessageDropped):
+        first.result(timeout=1)
+    assert not kept.done()
+
+    newest = WebhookDispatcher(workers=0, maxsize=1, overflow=OverflowPolicy.DROP_NEWEST)
+    kept = newest.submit(SlowWebhook(0))
+    with pytest.raises(MessageDropped):
+        newest.submit(SlowWebhook(0)).result(timeout=1)
+    assert newest.pending() == 1
+    for dispatcher in (oldest, newest):
+        dispatcher.shutdown(timeout=0)
+
+def test_shutdown_deadline_drops_queued_messages():
+    dispatcher = WebhookDispatcher(workers=1)
+    running = dispatcher.submit(SlowWebhook(0.2))
+    queued = [dispatcher.submit(SlowWebhook(0.2)) for _ in range(3)]
+    dispatcher.shutdown(timeout=0.05)
+    assert running.result(timeout=1) == "sent"
+    assert sum(isinstance(future.exception(timeout=1), MessageDropped) for future in queued) >= 2
+    with pytest.raises(RuntimeError):
+        dispatcher.submit(SlowWebhook(0))
+
+def test_async_dispatcher_sends_both_kinds_of_webhook(stub):
+    async def main():
+        async with AsyncWebhookDispatcher(workers=2) as dispatcher:
+            webhooks = [AsyncWebhook(stub.url()), Webhook(stub.url())]
+            for webhook in webhooks:
+                webhook.set_content("hello")
+            futures = [await dispatcher.submit(webhook) for webhook in webhooks]
+            await asyncio.gather(*futures)
+        with pytest.raises(RuntimeError):
+            await dispatcher.submit(webhooks[0])
+    asyncio.run(main())
+    assert len(stub.requests) == 2
+
+def test_async_shutdown_deadline_cancels_stuck_sends():
+    async def main():
+        dispatcher = AsyncWebhookDispatcher(workers=1)
+        stuck = await dispatcher.submit(AsyncSlowWebhook(30))
+        queued = await dispatcher.submit(AsyncSlowWebhook(30))
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        await dispatcher.shutdown(timeout=0.1)
+        assert time.monotonic() - started < 5
+        assert stuck.cancelled()
+        with pytest.raises(MessageDropped):
+            queued.result()
+    asyncio.run(main())
+
+def test_async_drop_newest_policy():
+    async def main():
+        dispatcher = AsyncWebhookDispatcher(workers=1, maxsize=1, overflow=OverflowPolicy.DROP_NEWEST)
+        await dispatcher.submit(AsyncSlowWebhook(30))
+        await asyncio.sleep(0)  # picked up by the worker
+        await dispatcher.submit(AsyncSlowWebhook(0))
+        dropped = await dispatcher.submit(AsyncSlowWebhook(0))
+        assert isinstance(dropped.exception(), MessageDropped)
+        await dispatcher.shutdown(timeout=0.05)
+    asyncio.run(main())
+
+def test_async_context_exit_is_bounded_by_drain_timeout():
+    async def main():
+        started = time.monotonic()
+        async with AsyncWebhookDispatcher(workers=1, drain_timeout=0.1) as dispatcher:
+            stuck = await dispatcher.submit(AsyncSlowWebhook(30))
+            queued = await dispatcher.submit(AsyncSlowWebhook(30))
+        assert time.monotonic() - started < 5
+        assert stuck.cancelled()
+        with pytest.raises(MessageDropped):
+            queued.result()
+    asyncio.run(main())
+
+def test_async_context_exit_drains_quick_messages():
+    async def main():
+        async with AsyncWebhookDispatcher(workers=2, drain_timeout=5) as dispatcher:
+            futures = [await dispatcher.submit(AsyncSlowWebhook(0.01)) for _ in range(4)]
+        assert [future.result() for future in futures] == ["sent"] * 4
+    asyncio.run(main())
+
+def test_dropped_dispatchers_are_collected_and_drained():
+    dispatcher = WebhookDispatcher(workers=2)
+    future = dispatcher.submit(SlowWebhook(0.05))
+    threads = list(dispatcher._threads)
+    reference = weakref.ref(dispatcher)
+    del dispatcher
+    gc.collect()
+    assert reference() is None
+    assert future.result(timeout=1) == "sent"
+    assert not any(thread.is_alive() for thread in threads)
+
+def test_shutdown_detaches_the_finalizer():
+    dispatcher = WebhookDispatcher(workers=1)
+    dispatcher.shutdown()
+    assert not dispatcher._finalizer.alive
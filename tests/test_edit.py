@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from dishookr import AsyncWebhook, AsyncSessionPool, Embed, RateLimiter, Webhook
+
+@pytest.fixture
+def sent(stub):
+    webhook = Webhook(stub.url(), wait=True, rate_limiter=RateLimiter())
+    webhook.edit_interval = 0.0
+    webhook.set_content("deploying")
+    webhook.add_embed(Embed(title="Build"))
+    webhook.send()
+    return webhook
+
+def test_send_with_wait_remembers_the_message_id(stub):
+    stub.queue(200, {"id": "123", "content": "hello"})
+    webhook = Webhook(stub.url(), wait=True, rate_limiter=RateLimiter())
+    webhook.set_content("hello")
+    webhook.send()
+    assert webhook.message_id == 123
+
+def test_edit_without_changes_sends_nothing(sent, stub):
+    count = len(stub.requests)
+    assert sent.edit().result() is None
+    assert len(stub.requests) == count
+
+def test_edit_sends_only_changed_fields(sent, stub):
+    sent.set_content("deployed")
+    sent.edit().result()
+    request = stub.requests[-1]
+    assert request.method == "PATCH"
+    assert request.path.endswith(f"/messages/{sent.message_id}")
+    assert request.payload == {"content": "deployed"}
+
+def test_removed_fields_are_cleared(sent, stub):
+    sent.embeds.clear()
+    sent.edit().result()
+    assert stub.requests[-1].payload == {"embeds": []}
+
+def test_edits_are_debounced(sent, stub):
+    sent.edit_interval = 0.2
+    sent.set_content("1")
+    sent.edit().result()
+    count = len(stub.requests)
+    futures = []
+    for step in ("2", "3", "4"):
+        sent.set_content(step)
+        futures.append(sent.edit())
+    assert futures[0] is futures[1] is futures[2]
+    futures[0].result(timeout=2)
+    assert len(stub.requests) == count + 1
+    assert stub.requests[-1].payload == {"content": "4"}
+
+def test_delete_cancels_the_pending_edit(sent, stub):
+    sent.edit_interval = 10.0
+    sent.set_content("1")
+    sent.edit().result()
+    sent.set_content("2")
+    pending = sent.edit()
+    message_id = sent.message_id
+    sent.delete()
+    assert pending.cancelled()
+    assert stub.requests[-1].method == "DELETE"
+    assert stub.requests[-1].path.endswith(f"/messages/{message_id}")
+    assert sent.message_id is None
+
+def test_edit_needs_a_message_id(stub):
+    webhook = Webhook(stub.url(), rate_limiter=RateLimiter())
+    webhook.set_content("hello")
+    webhook.send()
+    with pytest.raises(ValueError):
+        webhook.edit()
+
+def test_async_edits_share_one_request(stub):
+    async def run():
+        async with AsyncSessionPool() as pool:
+            webhook = AsyncWebhook(stub.url(), wait=True, session_pool=pool, rate_limiter=RateLimiter())
+            webhook.edit_interval = 0.1
+            webhook.set_content("0")
+            await webhook.send()
+            webhook.set_content("1")
+            await webhook.edit()
+            webhook.set_content("2")
+            results = await asyncio.gather(webhook.edit(), webhook.edit())
+            await webhook.delete()
+            return results
+    first, second = asyncio.run(run())
+    assert first is second
+    assert [request.method for request in stub.requests] == ["POST", "PATCH", "PATCH", "DELETE"]
+    assert stub.requests[2].payload == {"content": "2"}
+
+def test_execute_edit_sends_the_payload_as_is(sent, stub):
+    sent.execute_edit(b'{"content":"raw"}')
+    sent.execute_edit({"content": "original"}, "@original")
+    assert [request.payload for request in stub.requests[-2:]] == [{"content": "raw"}, {"content": "original"}]
+    assert stub.requests[-2].path.endswith(f"/messages/{sent.message_id}")
+    assert stub.requests[-1].path.endswith("/messages/@original")
@@ -0,0 +1,50 @@
+import pytest
+
+from dishookr import Webhook, Embed, EmbedAuthor, EmbedFooter
+from dishookr.objects.embed import EmbedField
+
+def test_running_total_follows_every_change():
+    embed = Embed(title="abc", description="12345")
+    assert embed.total_characters() == 8
+    embed.add_field("key", "value")
+    embed.footer = EmbedFooter("footer")
+    embed.author = EmbedAuthor("me")
+    assert embed.total_characters() == 8 + 8 + 6 + 2
+    embed.title = None
+    embed.description = "1"
+    embed.footer = None
+    embed.fields = [EmbedField("a", "b")]
+    assert embed.total_characters() == 1 + 2 + 2
+    embed.validate()  # recounts from scratch
+    assert embed.total_characters() == 1 + 2 + 2
+
+def test_limits_are_checked_as_they_change():
+    embed = Embed(description="d" * 4096)
+    embed.add_field("n" * 256, "v" * 1024)
+    embed.footer = EmbedFooter("f" * 600)
+    assert embed.total_characters() == 5976
+    with pytest.raises(ValueError, match="6000"):
+        embed.title = "t" * 25
+    assert embed.total_characters() == 5976
+    embed.title = "t" * 24
+
+def test_validate_recounts_nested_changes():
+    embed = Embed(footer=EmbedFooter("short"))
+    embed.footer.text = "much longer footer"
+    embed.validate()
+    assert embed.total_characters() == len("much longer footer")
+
+def test_webhook_checks_the_total_across_embeds():
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    webhook.add_embed(Embed(description="d" * 4000))
+    with pytest.raises(ValueError, match="across all embeds"):
+        webhook.add_embed(Embed(description="d" * 2001))
+    webhook.add_embed(Embed(description="d" * 2000))
+    assert webhook.embed_characters() == 6000
+
+def test_webhook_checks_the_embed_count():
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    for _ in range(10):
+        webhook.add_embed(Embed(title="t"))
+    with pytest.raises(ValueError, match="10 embeds"):
+        webhook.add_embed(Embed(title="t"))
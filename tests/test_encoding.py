@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from dishookr import Webhook, encoding
+from dishookr.encoding import BACKENDS, JSONBackend
+from dishookr.objects.enums import InteractionResponseType
+
+PAYLOAD = {"content": "héllo ✓", "embeds": [{"timestamp": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "fields": []}],
+           "type": InteractionResponseType.PONG, "tts": False, "flags": None}
+
+def installed():
+    backends = []
+    for name, factory in BACKENDS.items():
+        try:
+            backends.append(factory())
+        except ImportError:
+            continue
+    return backends
+
+@pytest.fixture
+def restore_backend():
+    previous = encoding.get_default_backend()
+    yield
+    encoding.set_default_backend(previous)
+
+@pytest.mark.parametrize("backend", installed(), ids=lambda backend: backend.name)
+def test_backends_encode_alike(backend):
+    assert backend.dumps(PAYLOAD) == BACKENDS["json"]().dumps(PAYLOAD)
+    assert backend.loads(backend.dumps(PAYLOAD))["embeds"][0]["timestamp"] == "2024-01-02T03:04:05+00:00"
+
+@pytest.mark.parametrize("backend", installed(), ids=lambda backend: backend.name)
+def test_invalid_json_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        backend.loads(b"{not json")
+
+def test_default_prefers_the_fastest_installed(restore_backend):
+    encoding._default_backend = None
+    assert encoding.get_default_backend().name == installed()[0].name
+
+def test_set_default_backend_by_name(restore_backend):
+    encoding.set_default_backend("json")
+    assert encoding.get_default_backend().name == "json"
+    with pytest.raises(KeyError):
+        encoding.set_default_backend("yaml")
+
+def test_registered_backends_can_be_selected(restore_backend):
+    calls = []
+    stdlib = BACKENDS["json"]()
+    encoding.register_backend("counting", lambda: JSONBackend("counting", lambda obj: calls.append(obj) or stdlib.dumps(obj), stdlib.loads))
+    try:
+        encoding.set_default_backend("counting")
+        assert encoding.dumps({"a": 1}) == b'{"a":1}'
+        assert calls == [{"a": 1}]
+    finally:
+        del BACKENDS["counting"]
+
+def test_missing_library_raises_import_error(restore_backend):
+    try:
+        import msgspec  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            encoding.set_default_backend("msgspec")
+    else:
+        pytest.skip("msgspec is installed")
+
+def test_webhooks_send_with_the_default_backend(restore_backend, stub):
+    calls = []
+    stdlib = BACKENDS["json"]()
+    encoding.set_default_backend(JSONBackend("counting", lambda obj: calls.append(obj) or stdlib.dumps(obj), stdlib.loads))
+    webhook = Webhook(stub.url())
+    webhook.set_content("encoded once")
+    webhook.send()
+    assert calls == [{"content": "encoded once", "tts": False}]
+    assert stub.requests[-1].payload == calls[0]
@@ -0,0 +1,40 @@
+from dishookr import Webhook, SessionPool
+from dishookr.http import get_default_pool, set_default_pool
+
+def test_one_session_per_host():
+    pool = SessionPool()
+    first = pool.get_session("https://discord.com/api/webhooks/1/a")
+    assert pool.get_session("https://discord.com/api/webhooks/2/b") is first
+    assert pool.get_session("https://canary.discord.com/api/webhooks/1/a") is not first
+    pool.close()
+    assert pool.get_session("https://discord.com/api/webhooks/1/a") is not first
+
+def test_keep_alive_can_be_turned_off():
+    assert SessionPool(keep_alive=False).get_session("https://discord.com").headers["Connection"] == "close"
+
+def test_sends_reuse_the_pooled_session(stub):
+    with SessionPool() as pool:
+        webhook = Webhook(stub.url(), wait=True, session_pool=pool)
+        for i in range(3):
+            webhook.set_content(f"message {i}")
+            assert webhook.send().status_code == 200
+        assert len(pool._sessions) == 1
+    assert [request.payload["content"] for request in stub.requests] == ["message 0", "message 1", "message 2"]
+
+def test_pool_timeout_is_the_default(stub, monkeypatch):
+    pool = SessionPool(timeout=1.5)
+    seen = []
+    request = pool.get_session(stub.base).request
+    monkeypatch.setattr(pool.get_session(stub.base), "request", lambda *args, **kwargs: seen.append(kwargs["timeout"]) or request(*args, **kwargs))
+    pool.request("POST", stub.url(), json={"content": "hi"})
+    pool.request("POST", stub.url(), json={"content": "hi"}, timeout=3.0)
+    assert seen == [1.5, 3.0]
+
+def test_default_pool_can_be_replaced():
+    previous = get_default_pool()
+    pool = SessionPool()
+    set_default_pool(pool)
+    try:
+        assert get_default_pool() is pool
+    finally:
+        set_default_pool(previous)
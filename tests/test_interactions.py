@@ -0,0 +1,227 @@
+import asyncio
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from dishookr import InteractionApp, Interaction, InteractionType, InteractionResponse, InteractionResponseType, InteractionCallbackMessage
+from dishookr.circuit import get_default_circuit_breaker
+
+def reply(content: str) -> InteractionResponse:
+    return InteractionResponse(InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE, InteractionCallbackMessage(content=content))
+
+def body(interaction_type: int, application_id: int = 1, **data) -> bytes:
+    return json.dumps({"type": interaction_type, "id": "9", "application_id": str(application_id), "token": "tok", "data": data}).encode()
+
+def test_ping_is_answered_with_pong():
+    app = InteractionApp(fallback=lambda interaction: reply("never"))
+    status, answer = app.handle(body(1), {})
+    assert (status, json.loads(answer)) == (200, {"type": 1})
+
+def test_routes_by_name_and_longest_prefix():
+    app = InteractionApp()
+    app.command("status")(lambda interaction: reply("status"))
+    app.component("vote:", prefix=True)(lambda interaction: reply("vote"))
+    app.component("vote:yes:", prefix=True)(lambda interaction: reply("yes"))
+    app.component("vote:no")(lambda interaction: reply("exact"))
+    app.modal("form:", prefix=True)(lambda interaction: reply("form"))
+
+    def content(payload: bytes) -> str:
+        return json.loads(app.handle(payload, {})[1])["data"]["content"]
+
+    assert content(body(2, name="status")) == "status"
+    assert content(body(3, custom_id="vote:maybe")) == "vote"
+    assert content(body(3, custom_id="vote:yes:42")) == "yes"
+    assert content(body(3, custom_id="vote:no")) == "exact"
+    assert content(body(5, custom_id="form:feedback")) == "form"
+    assert app.handle(body(3, custom_id="status"), {})[0] == 404  # commands and components are routed apart
+
+def test_unrouted_interactions_and_bad_payloads():
+    app = InteractionApp()
+    assert app.handle(body(2, name="missing"), {})[0] == 404
+    assert app.handle(b"not json", {})[0] == 400
+    assert app.handle(b'{"no": "type"}', {})[0] == 400
+    app.fallback = lambda interaction: reply("fallback")
+    assert app.handle(body(2, name="missing"), {})[0] == 200
+
+def test_responses_are_serialized():
+    app = InteractionApp()
+    app.command("dict")(lambda interaction: {"type": 4, "data": {"content": "dict"}})
+    app.command("bytes")(lambda interaction: b'{"type":4,"data":{"content":"bytes"}}')
+    app.command("object")(lambda interaction: reply("object"))
+    for name in ("dict", "bytes", "object"):
+        status, answer = app.handle(body(2, name=name), {})
+        assert (status, json.loads(answer)["data"]["content"]) == (200, name)
+
+def test_coroutine_handlers_are_awaited():
+    app = InteractionApp()
+
+    @app.command("async")
+    async def handler(interaction):
+        await asyncio.sleep(0)
+        return reply("awaited")
+
+    status, answer = asyncio.run(app.handle_async(body(2, name="async"), {}))
+    assert json.loads(answer)["data"]["content"] == "awaited"
+    assert json.loads(app.handle(body(2, name="async"), {})[1])["data"]["content"] == "awaited"
+
+def test_options_are_flattened():
+    options = [{"name": "deploy", "type": 1, "options": [{"name": "service", "type": 3, "value": "api"},
+                                                         {"name": "force", "type": 5, "value": True, "focused": True}]}]
+    interaction = Interaction(json.loads(body(4, name="ops", options=options)))
+    assert interaction.options == {"service": "api", "force": True}
+    assert interaction.focused["name"] == "force"
+    assert (interaction.name, interaction.custom_id, interaction.values) == ("ops", None, [])
+    assert interaction.webhook_url == "https://discord.com/api/v10/webhooks/1/tok"
+
+def test_asgi_adapter():
+    app = InteractionApp()
+    app.command("status")(lambda interaction: reply("ok"))
+
+    async def call(method: str, payload: bytes) -> list:
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": payload, "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        await app({"type": "http", "method": method, "path": "/", "headers": [(b"Content-Type", b"application/json")]}, receive, send)
+        return sent
+
+    start, answer = asyncio.run(call("POST", body(2, name="status")))
+    assert start["status"] == 200
+    assert json.loads(answer["body"])["data"]["content"] == "ok"
+    assert asyncio.run(call("GET", b""))[0]["status"] == 405
+
+def test_wsgi_adapter():
+    app = InteractionApp()
+    app.command("status")(lambda interaction: reply("ok"))
+    statuses = []
+    payload = body(2, name="status")
+    environ = {"REQUEST_METHOD": "POST", "CONTENT_LENGTH": str(len(payload)), "wsgi.input": io.BytesIO(payload)}
+    answer = app.wsgi(environ, lambda status, headers: statuses.append(status))
+    assert statuses == ["200 OK"]
+    assert json.loads(b"".join(answer))["data"]["content"] == "ok"
+    app.wsgi({"REQUEST_METHOD": "GET"}, lambda status, headers: statuses.append(status))
+    assert statuses[-1] == "405 Method Not Allowed"
+
+def test_asgi_lifespan():
+    app = InteractionApp()
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent = []
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(app({"type": "lifespan"}, receive, send))
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+def test_sync_handlers_run_off_the_event_loop():
+    app = InteractionApp()
+
+    @app.command("blocking")
+    def blocking(interaction):
+        time.sleep(0.2)
+        return reply(str(threading.get_ident()))
+
+    async def run():
+        started = time.monotonic()
+        answers = await asyncio.gather(*(app.handle_async(body(2, name="blocking"), {}) for _ in range(3)))
+        return time.monotonic() - started, answers
+    elapsed, answers = asyncio.run(run())
+    assert elapsed < 0.5  # not one after the other
+    assert str(threading.get_ident()) not in {json.loads(answer)["data"]["content"] for _, answer in answers}
+
+def slow(interaction):
+    time.sleep(0.2)
+    return reply("done")
+
+def test_handlers_over_budget_are_deferred(fake):
+    app = InteractionApp(session_pool=fake)
+    app.command("fast")(lambda interaction: reply("fast"))
+    app.command("budgeted", defer_after=0.01)(slow)
+    try:
+        assert json.loads(app.handle(body(2, name="fast"), {})[1])["type"] == 4
+        assert json.loads(app.handle(body(2, name="budgeted"), {})[1]) == {"type": 5}
+    finally:
+        app.close()
+
+def test_deferred_message_edits_the_original_response(fake):
+    app = InteractionApp(defer_after=0.01, session_pool=fake)
+    app.command("slow")(slow)
+    assert json.loads(app.handle(body(2, application_id=501, name="slow"), {})[1]) == {"type": 5}
+    app.close()  # waits for the delivery
+    request = fake.requests[-1]
+    assert (request.method, request.path, request.status) == ("PATCH", "/api/v10/webhooks/501/tok/messages/@original", 200)
+    assert [message["content"] for message in fake.messages.values() if message["webhook_id"] == "501"] == ["done"]
+
+def test_deferred_message_as_follow_up(fake):
+    app = InteractionApp(defer_after=0.01, follow_up=True, session_pool=fake)
+    app.component("slow")(slow)
+    assert json.loads(app.handle(body(3, application_id=502, custom_id="slow"), {})[1]) == {"type": 6}
+    app.close()
+    assert (fake.requests[-1].method, fake.requests[-1].payload["content"]) == ("POST", "done")
+
+def test_fast_handlers_answer_within_their_budget(fake):
+    app = InteractionApp(defer_after=1.0, session_pool=fake)
+    app.command("quick")(lambda interaction: reply("quick"))
+    try:
+        assert json.loads(app.handle(body(2, name="quick"), {})[1])["data"]["content"] == "quick"
+    finally:
+        app.close()
+    assert fake.requests == []
+
+def test_coroutine_handlers_are_deferred_on_the_event_loop(fake):
+    app = InteractionApp(defer_after=0.01, session_pool=fake)
+
+    @app.command("async")
+    async def handler(interaction):
+        await asyncio.sleep(0.1)
+        return reply("awaited")
+
+    async def run():
+        answer = (await app.handle_async(body(2, application_id=505, name="async"), {}))[1]
+        await asyncio.sleep(0.2)
+        return answer
+    assert json.loads(asyncio.run(run())) == {"type": 5}
+    app.close()
+    assert fake.requests[-1].payload["content"] == "awaited"
+
+def test_autocompletes_cant_be_deferred():
+    app = InteractionApp(defer_after=0.01)
+    with pytest.raises(ValueError):
+        app.route(InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE, "ops", slow, defer_after=1.0)
+    app.autocomplete("ops")(lambda interaction: {"type": 8, "data": {"choices": []}})
+    assert json.loads(app.handle(body(4, name="ops"), {})[1]) == {"type": 8, "data": {"choices": []}}  # never deferred
+
+def test_budget_belongs_to_the_route_not_the_handler(fake):
+    app = InteractionApp(session_pool=fake)
+    app.command("fast")(slow)
+    app.command("budgeted", defer_after=0.01)(slow)
+    try:
+        assert json.loads(app.handle(body(2, name="fast"), {})[1])["type"] == 4
+        assert json.loads(app.handle(body(2, name="budgeted"), {})[1]) == {"type": 5}
+    finally:
+        app.close()
+
+def test_expired_tokens_are_not_kept_by_the_shared_circuit_breaker(fake):
+    fake.delete_webhook(503)
+    app = InteractionApp(defer_after=0.01, session_pool=fake)
+    app.command("slow")(slow)
+    app.handle(body(2, application_id=503, name="slow"), {})
+    app.close()
+    assert fake.requests[-1].status == 404
+    assert not any("/webhooks/503/" in url for url in get_default_circuit_breaker().dead())
+
+def test_original_response_can_be_fetched_once_edited(fake):
+    assert fake.handle("GET", "https://discord.com/api/v10/webhooks/504/tok/messages/@original").status_code == 404
+    fake.handle("PATCH", "https://discord.com/api/v10/webhooks/504/tok/messages/@original", json={"content": "hi"})
+    fetched = fake.handle("GET", "https://discord.com/api/v10/webhooks/504/tok/messages/@original")
+    assert (fetched.status_code, fetched.json()["content"]) == (200, "hi")
@@ -0,0 +1,78 @@
+import logging
+import time
+
+from dishookr import DiscordHandler, RateLimiter, RetryPolicy
+
+def make_handler(stub, **kwargs) -> DiscordHandler:
+    kwargs.setdefault("flush_interval", 0.05)
+    return DiscordHandler(stub.url(), rate_limiter=RateLimiter(), retry_policy=RetryPolicy(base_delay=0.001, budget=None), **kwargs)
+
+def make_logger(handler: DiscordHandler) -> logging.Logger:
+    logger = logging.getLogger(f"tests.log_handler.{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+def test_records_are_packed_into_embeds(stub):
+    handler = make_handler(stub, flush_interval=0.5, username="alerts")
+    logger = make_logger(handler)
+    for i in range(25):
+        logger.warning("disk %d is almost full", i)
+    handler.close()
+    payloads = [request.payload for request in stub.requests]
+    assert [len(payload["embeds"]) for payload in payloads] == [10, 10, 5]
+    first = payloads[0]["embeds"][0]
+    assert (first["title"], first["description"], first["color"]) == ("WARNING", "disk 0 is almost full", 0xF1C40F)
+    assert payloads[0]["username"] == "alerts"
+
+def test_tracebacks_get_a_code_block(stub):
+    handler = make_handler(stub)
+    logger = make_logger(handler)
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("job failed")
+    handler.close()
+    description = stub.requests[-1].payload["embeds"][0]["description"]
+    assert description.startswith("job failed\n```py\nTraceback")
+    assert description.endswith("ZeroDivisionError: division by zero\n```")
+
+def test_long_tracebacks_keep_their_end(stub):
+    handler = make_handler(stub)
+    record = logging.LogRecord("x", logging.ERROR, __file__, 1, "failed", None, None)
+    record.exc_text = "frame\n" * 2000 + "ValueError: the end"
+    embed = handler.to_embed(handler.prepare(record))
+    handler.close()
+    assert len(embed.description) <= 4096
+    assert embed.description.endswith("ValueError: the end\n```")
+
+def test_level_filters_records(stub):
+    handler = make_handler(stub, level=logging.ERROR)
+    logger = make_logger(handler)
+    logger.info("ignored")
+    logger.error("kept")
+    handler.close()
+    assert [request.payload["embeds"][0]["description"] for request in stub.requests] == ["kept"]
+
+def test_full_queue_drops_and_reports(stub):
+    stub.delay = 0.3
+    handler = make_handler(stub, capacity=1, flush_interval=0.01)
+    logger = make_logger(handler)
+    logger.error("first")
+    time.sleep(0.1)  # the handler is now busy sending it
+    for i in range(5):
+        logger.error("burst %d", i)
+    handler.close()
+    assert handler.dropped == 0
+    assert stub.requests[-1].payload["content"] == "4 log records dropped, the queue was full."
+
+def test_logging_never_waits_on_discord(stub):
+    stub.delay = 0.2
+    handler = make_handler(stub)
+    logger = make_logger(handler)
+    started = time.monotonic()
+    for i in range(20):
+        logger.info("event %d", i)
+    assert time.monotonic() - started < 0.1
+    handler.close()
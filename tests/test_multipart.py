@@ -0,0 +1,97 @@
+from email.parser import BytesParser
+from email.policy import HTTP
+import asyncio
+import io
+import json
+
+import pytest
+
+from dishookr import Webhook, AsyncWebhook, File
+from dishookr.multipart import MultipartEncoder
+
+def form_parts(request) -> dict:
+    """ The parts of a multipart request the stub received, by field name. """
+    head = f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode()
+    message = BytesParser(policy=HTTP).parsebytes(head + request.body)
+    return {part.get_param("name", header="content-disposition"): part.get_payload(decode=True) for part in message.iter_parts()}
+
+def test_length_matches_the_streamed_body():
+    files = [File(io.BytesIO(b"a" * 100_000), "big.bin"), File(io.BytesIO(b"hello"), "notes.txt", description="Notes")]
+    encoder = MultipartEncoder({"content": "report", "attachments": [f.to_attachment(i) for i, f in enumerate(files)]}, files, chunk_size=4096)
+    body = b"".join(encoder)
+    assert len(body) == len(encoder)
+    assert encoder.content_type.startswith("multipart/form-data; boundary=")
+    assert b'name="files[0]"; filename="big.bin"' in body
+    assert b"a" * 100_000 in body
+
+def test_body_can_be_streamed_again_for_a_retry(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"line\n" * 10)
+    encoder = MultipartEncoder({"attachments": [File(path).to_attachment(0)]}, [File(path)])
+    assert b"".join(encoder) == b"".join(encoder)
+
+def test_file_objects_are_read_from_their_starting_position():
+    fp = io.BytesIO(b"headerPAYLOAD")
+    fp.seek(6)
+    file = File(fp, "payload.bin")
+    assert file.size == 7
+    assert b"".join(file.iter_chunks(2)) == b"PAYLOAD"
+    assert b"".join(file.iter_chunks(2)) == b"PAYLOAD"
+
+def test_filenames_are_quoted():
+    encoder = MultipartEncoder({}, [File(io.BytesIO(b"x"), 'a "b"\r\n.txt')])
+    assert b'filename="a %22b%22%0D%0A.txt"' in b"".join(encoder)
+
+def test_files_are_uploaded_with_the_payload(stub, tmp_path):
+    path = tmp_path / "trace.txt"
+    path.write_bytes(b"x" * 2048)
+    webhook = Webhook(stub.url())
+    webhook.set_content("attached")
+    webhook.add_file(File(path, description="Stack trace"))
+    webhook.send()
+    request = stub.requests[-1]
+    assert int(request.headers["Content-Length"]) == len(request.body)
+    parts = form_parts(request)
+    assert json.loads(parts["payload_json"])["attachments"] == [{"id": 0, "filename": "trace.txt", "description": "Stack trace"}]
+    assert parts["files[0]"] == b"x" * 2048
+
+def test_async_upload_streams_from_a_thread(stub):
+    webhook = AsyncWebhook(stub.url())
+    webhook.set_content("attached")
+    webhook.add_file(File(io.BytesIO(b"y" * 300_000), "dump.bin"))
+    asyncio.run(webhook.send())
+    assert form_parts(stub.requests[-1])["files[0]"] == b"y" * 300_000
+
+def test_upload_limits():
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    webhook.max_upload_size = 10
+    with pytest.raises(ValueError, match="Combined size"):
+        webhook.add_file(File(io.BytesIO(b"x" * 11), "big.bin"))
+    for i in range(10):
+        webhook.add_file(File(io.BytesIO(b""), f"{i}.txt"))
+    with pytest.raises(ValueError, match="10 files"):
+        webhook.add_file(File(io.BytesIO(b""), "one-too-many.txt"))
+
+def test_spoiler_prefix():
+    assert File(io.BytesIO(b"x"), "cat.png", spoiler=True).filename == "SPOILER_cat.png"
+
+def test_files_appended_to_after_being_attached_are_cut_at_their_size(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"0123456789")
+    on_disk, in_memory = File(path), File(io.BytesIO(b"0123456789"), "app.log")
+    with open(path, "ab") as log:
+        log.write(b"x" * 50)
+    in_memory.fp.seek(0, io.SEEK_END)
+    in_memory.fp.write(b"x" * 50)
+    for file in (on_disk, in_memory):
+        assert b"".join(file.iter_chunks(4)) == b"0123456789"
+    encoder = MultipartEncoder({}, [on_disk])
+    assert len(b"".join(encoder)) == len(encoder)
+
+def test_files_truncated_after_being_attached_fail(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"0123456789")
+    file = File(path)
+    path.write_bytes(b"01234")
+    with pytest.raises(ValueError, match="shorter"):
+        b"".join(file.iter_chunks())
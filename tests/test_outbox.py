@@ -0,0 +1,111 @@
+import io
+import sqlite3
+
+import pytest
+import requests
+
+from dishookr import Webhook, Outbox, File, CircuitBreaker, RateLimiter, RetryPolicy, CircuitOpen, DiscordServerError, HTTPException
+from dishookr.outbox import DEAD
+
+@pytest.fixture
+def outbox(tmp_path):
+    with Outbox(str(tmp_path / "outbox.db")) as outbox:
+        yield outbox
+
+def replay_kwargs() -> dict:
+    return {"rate_limiter": RateLimiter(), "retry_policy": RetryPolicy(max_attempts=1, budget=None)}
+
+def message(url: str, content: str = "deployed", **kwargs) -> Webhook:
+    webhook = Webhook(url, **replay_kwargs(), **kwargs)
+    webhook.set_content(content)
+    return webhook
+
+def test_send_stores_delivers_and_acks(outbox, stub):
+    assert outbox.send(message(stub.url())).status_code == 204
+    assert len(stub.requests) == 1
+    assert outbox.pending() == []
+
+def test_dedup_key_is_delivered_once(outbox, stub):
+    webhook = message(stub.url())
+    assert outbox.send(webhook, dedup_key="deploy-42") is not None
+    assert outbox.send(webhook, dedup_key="deploy-42") is None
+    key, stored = outbox.enqueue(webhook, dedup_key="deploy-42")
+    assert (key, stored.result()) == ("deploy-42", False)
+    assert len(stub.requests) == 1
+
+def test_pending_messages_survive_a_restart(tmp_path, stub):
+    path = str(tmp_path / "outbox.db")
+    with Outbox(path) as outbox:
+        outbox.enqueue(message(stub.url(), "first"))[1].result()
+        outbox.enqueue(message(stub.url(), "second"))[1].result()
+    # the process died before sending them
+
+    with Outbox(path) as outbox:
+        assert [entry.payload["content"] for entry in outbox.pending()] == ["first", "second"]
+        assert outbox.replay(replay_kwargs()) == 2
+        assert outbox.pending() == []
+    assert [request.payload["content"] for request in stub.requests] == ["first", "second"]
+
+def test_unacked_delivery_is_sent_again(outbox, stub):
+    webhook = message(stub.url())
+    outbox.enqueue(webhook)[1].result()
+    webhook.send()  # Discord accepted it, then the process died before the ack
+    assert outbox.replay(replay_kwargs()) == 1
+    assert len(stub.requests) == 2  # at-least-once
+
+def test_transient_failures_stay_pending(outbox, stub):
+    stub.queue(500, {"message": "oops"})
+    with pytest.raises(DiscordServerError):
+        outbox.send(message(stub.url()))
+    [entry] = outbox.pending()
+    assert entry.attempts == 1
+    assert outbox.replay(replay_kwargs()) == 1
+    assert outbox.pending() == []
+
+def test_rejected_messages_are_marked_dead(outbox, stub):
+    stub.queue(404, {"message": "Unknown Webhook", "code": 10015})
+    with pytest.raises(HTTPException):
+        outbox.send(message(stub.url()))
+    assert outbox.pending() == []
+    assert outbox.replay(replay_kwargs()) == 0
+    rows = sqlite3.connect(outbox.path).execute("SELECT state, last_error FROM outbox").fetchall()
+    assert rows[0][0] == DEAD and rows[0][1]
+
+def test_files_cant_be_stored(outbox):
+    webhook = message("https://discord.com/api/webhooks/1/token")
+    webhook.add_file(File(io.BytesIO(b"x"), "x.txt"))
+    with pytest.raises(ValueError):
+        outbox.enqueue(webhook)
+
+def test_messages_that_cant_be_sent_are_marked_dead(outbox, stub):
+    outbox.enqueue(message("discord.invalid/api/webhooks/1/token", "no scheme"))[1].result()
+    outbox.enqueue(message(stub.url(), "fine"))[1].result()
+    assert outbox.replay(replay_kwargs()) == 1  # the broken message doesn't stop the replay
+    assert outbox.pending() == []
+    assert outbox.replay(replay_kwargs()) == 0
+    rows = sqlite3.connect(outbox.path).execute("SELECT state, last_error FROM outbox ORDER BY id").fetchall()
+    assert rows[0][0] == DEAD and "discord.invalid" in rows[0][1]
+    assert [request.payload["content"] for request in stub.requests] == ["fine"]
+
+def test_send_records_client_side_errors(outbox):
+    with pytest.raises(requests.exceptions.MissingSchema):
+        outbox.send(message("discord.invalid/api/webhooks/1/token"))
+    assert outbox.pending() == []
+
+def test_messages_for_dead_webhooks_are_marked_dead(outbox, stub):
+    breaker = CircuitBreaker()
+    url = stub.url()
+    breaker.record_response(url, 404, 10015)
+    with pytest.raises(CircuitOpen):
+        outbox.send(message(url, circuit_breaker=breaker))
+    rows = sqlite3.connect(outbox.path).execute("SELECT state FROM outbox").fetchall()
+    assert rows == [(DEAD,)]
+    assert stub.requests == []
+
+def test_messages_for_failing_webhooks_stay_pending(outbox, stub):
+    breaker = CircuitBreaker(failure_threshold=1)
+    url = stub.url()
+    breaker.record_failure(url)
+    with pytest.raises(CircuitOpen):
+        outbox.send(message(url, circuit_breaker=breaker))
+    assert [entry.attempts for entry in outbox.pending()] == [1]
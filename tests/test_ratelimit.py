@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+
+from dishookr import Webhook, AsyncWebhook, RateLimiter, RateLimited
+from dishookr.ratelimit import RateLimitBucket, route_key
+
+def limited(remaining: int, reset_after: float, limit: int = 2) -> dict:
+    return {"X-RateLimit-Limit": str(limit), "X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset-After": str(reset_after)}
+
+def test_route_key_collapses_message_ids():
+    assert route_key("patch", "https://discord.com/api/webhooks/1/t/messages/123?wait=true") == \
+        route_key("PATCH", "https://discord.com/api/webhooks/1/t/messages/456")
+
+def test_unknown_bucket_lets_one_probe_through():
+    bucket = RateLimitBucket()
+    assert bucket.reserve(0.0) == 0.0
+    assert bucket.reserve(0.0) > 0.0
+    bucket.learn(0.1, 2, 1, 1.0)
+    assert bucket.reserve(0.1) == 0.0
+    assert bucket.reserve(0.2) == pytest.approx(0.9)
+    assert bucket.reserve(1.2) == 0.0  # the window reset
+
+def test_late_response_does_not_raise_the_count():
+    bucket = RateLimitBucket()
+    bucket.learn(0.0, 5, 4, 1.0)
+    for _ in range(3):
+        bucket.reserve(0.0)
+    bucket.learn(0.1, 5, 3, 0.9)  # answered before the other two claims reached Discord
+    assert bucket.remaining == 1
+
+def test_sends_wait_for_the_bucket_instead_of_getting_429(stub):
+    webhook = Webhook(stub.url(), rate_limiter=RateLimiter())
+    webhook.set_content("hello")
+    stub.queue(204, headers=limited(1, 0.3))
+    stub.queue(204, headers=limited(0, 0.3))
+    stub.queue(204, headers=limited(1, 0.3))
+    started = time.monotonic()
+    for _ in range(3):
+        webhook.send()
+    assert time.monotonic() - started >= 0.25
+    assert len(stub.requests) == 3
+
+def test_webhooks_on_one_url_share_the_default_limiter(stub):
+    url = stub.url()
+    first, second = Webhook(url), Webhook(url)
+    for webhook in (first, second):
+        webhook.set_content("hello")
+    stub.queue(204, headers=limited(0, 0.3))
+    started = time.monotonic()
+    first.send()
+    second.send()
+    assert time.monotonic() - started >= 0.25
+
+def test_routes_without_rate_limit_headers_are_not_serialized(stub):
+    webhook = Webhook(stub.url(), rate_limiter=RateLimiter())
+    webhook.set_content("hello")
+    started = time.monotonic()
+    for _ in range(3):
+        webhook.send()
+    assert time.monotonic() - started < 1.0  # not held for the probe timeout
+
+def test_429_is_waited_out_and_retried(stub):
+    webhook = Webhook(stub.url(), wait=True, rate_limiter=RateLimiter())
+    webhook.set_content("hello")
+    stub.queue(429, {"message": "You are being rate limited.", "retry_after": 0.2, "global": False})
+    started = time.monotonic()
+    assert webhook.send().status_code == 200
+    assert time.monotonic() - started >= 0.15
+    assert len(stub.requests) == 2
+
+def test_429s_past_max_retries_raise(stub):
+    webhook = Webhook(stub.url(), rate_limiter=RateLimiter(max_retries=0))
+    webhook.set_content("hello")
+    stub.queue(429, {"message": "You are being rate limited.", "retry_after": 0.1, "global": False})
+    with pytest.raises(RateLimited):
+        webhook.send()
+
+def test_async_sends_wait_for_the_bucket(stub):
+    webhook = AsyncWebhook(stub.url(), rate_limiter=RateLimiter())
+    webhook.set_content("hello")
+    stub.queue(204, headers=limited(0, 0.3))
+
+    async def run():
+        started = asyncio.get_running_loop().time()
+        await webhook.send()
+        await webhook.send()
+        return asyncio.get_running_loop().time() - started
+    assert asyncio.run(run()) >= 0.25
+
+def test_global_limit_delays_every_route():
+    limiter = RateLimiter()
+    route = route_key("POST", "https://discord.com/api/webhooks/1/token")
+    retry_after = limiter.update(route, 429, {"X-RateLimit-Global": "true"}, {"retry_after": 0.5, "global": True})
+    assert retry_after == 0.5
+    assert limiter.delay(route_key("POST", "https://discord.com/api/webhooks/2/token")) == pytest.approx(0.5, abs=0.05)
+
+def test_bucket_ids_are_scoped_to_their_route():
+    limiter = RateLimiter()
+    url = "https://discord.com/api/webhooks/1/token"
+    post, patch = route_key("POST", url), route_key("PATCH", f"{url}/messages/1")
+    headers = {"X-RateLimit-Bucket": "shared", **limited(0, 1.0, limit=1)}
+    limiter.update(post, 200, headers)
+    limiter.update(patch, 200, headers)
+    assert limiter.get_bucket(post) is not limiter.get_bucket(patch)  # bucket IDs only count together with the route
+    assert limiter.delay(post) > 0
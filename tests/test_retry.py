@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from dishookr import Webhook, AsyncWebhook, SessionPool, RateLimiter, RetryPolicy, RetryBudget, WebhookDispatcher
+from dishookr.exceptions import DiscordServerError, HTTPException
+
+class FlakyPool(SessionPool):
+    """ Raises the given errors before sending for real. """
+
+    def __init__(self, *errors: Exception) -> None:
+        super().__init__()
+        self.errors = list(errors)
+
+    def request(self, method, url, **kwargs):
+        if self.errors:
+            raise self.errors.pop(0)
+        return super().request(method, url, **kwargs)
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("budget", None)
+    return RetryPolicy(base_delay=0.001, max_delay=0.01, **kwargs)
+
+def webhook(stub, **kwargs) -> Webhook:
+    kwargs.setdefault("retry_policy", fast_policy())
+    webhook = Webhook(stub.url(), rate_limiter=RateLimiter(), **kwargs)
+    webhook.set_content("hello")
+    return webhook
+
+def test_server_errors_are_retried(stub):
+    stub.queue(503, {"message": "unavailable"}, times=2)
+    assert webhook(stub).send().status_code == 204
+    assert len(stub.requests) == 3
+
+def test_gives_up_after_max_attempts(stub):
+    stub.queue(500, {"message": "oops"}, times=10)
+    with pytest.raises(DiscordServerError) as info:
+        webhook(stub, retry_policy=fast_policy(max_attempts=3)).send()
+    assert info.value.attempts == 3 and len(stub.requests) == 3
+
+def test_client_errors_are_not_retried(stub):
+    stub.queue(400, {"message": "Cannot send an empty message", "code": 50006}, times=5)
+    with pytest.raises(HTTPException) as info:
+        webhook(stub).send()
+    assert info.value.status == 400 and info.value.attempts == 1
+
+def test_retry_after_header_is_honoured(stub):
+    stub.queue(503, {"message": "unavailable"}, headers={"Retry-After": "0.2"})
+    started = time.monotonic()
+    webhook(stub).send()
+    assert time.monotonic() - started >= 0.2
+
+def test_connection_errors_are_retried(stub):
+    pool = FlakyPool(requests.ConnectionError(), requests.ConnectTimeout())
+    assert webhook(stub, session_pool=pool).send().status_code == 204
+    assert len(stub.requests) == 1
+
+def test_connection_errors_can_be_left_alone(stub):
+    pool = FlakyPool(requests.ConnectionError())
+    with pytest.raises(requests.ConnectionError):
+        webhook(stub, session_pool=pool, retry_policy=fast_policy(retry_connection_errors=False)).send()
+
+def test_read_timeouts_are_not_retried(stub):
+    stub.delay = 0.3
+    with pytest.raises(requests.ReadTimeout):
+        webhook(stub, session_pool=SessionPool(timeout=(1.0, 0.05))).send()
+    time.sleep(0.3)
+    assert len(stub.requests) == 1  # Discord may have posted the message, a retry could post it twice
+
+def test_async_server_errors_are_retried(stub):
+    stub.queue(502, {"message": "bad gateway"})
+    hook = AsyncWebhook(stub.url(), rate_limiter=RateLimiter(), retry_policy=fast_policy())
+    hook.set_content("hello")
+    assert asyncio.run(hook.send()).status_code == 204
+    assert len(stub.requests) == 2
+
+def test_budget_exhaustion_stops_retries(stub):
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=2)
+    stub.queue(500, {"message": "oops"}, times=10)
+    with pytest.raises(DiscordServerError) as info:
+        webhook(stub, retry_policy=fast_policy(max_attempts=10, budget=budget)).send()
+    assert info.value.attempts == 3  # the first attempt and the two retries the budget held
+    assert not budget.withdraw()
+
+def test_budget_refills_from_traffic():
+    budget = RetryBudget(ratio=0.5, min_per_second=0.0, max_tokens=10)
+    while budget.withdraw():
+        pass
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+def test_per_status_attempts():
+    policy = fast_policy(statuses={503: 2})
+    assert policy.next_delay(1, started=time.monotonic(), status_code=503) is not None
+    assert policy.next_delay(2, started=time.monotonic(), status_code=503) is None
+    assert policy.next_delay(1, started=time.monotonic(), status_code=500) is None
+
+def test_retry_after_is_honoured():
+    policy = fast_policy()
+    assert policy.next_delay(1, started=time.monotonic(), status_code=503, retry_after=0.5) >= 0.5
+
+def test_max_elapsed_stops_retries():
+    policy = fast_policy(max_elapsed=1.0)
+    assert policy.next_delay(1, started=time.monotonic() - 2.0, status_code=503) is None
+
+def test_dispatcher_lends_its_policy(stub):
+    policy = fast_policy()
+    own, lent = webhook(stub), webhook(stub, retry_policy=None)
+    with WebhookDispatcher(workers=1, retry_policy=policy) as dispatcher:
+        dispatcher.submit(own)
+        dispatcher.submit(lent)
+    assert lent.retry_policy is policy and own.retry_policy is not policy
@@ -0,0 +1,55 @@
+import io
+
+import pytest
+
+from dishookr import Webhook, Embed, File
+from dishookr.objects.allowed_mentions import AllowedMentions
+from dishookr.objects.serializer import Field, serializer, nested, nested_list
+
+class Point(object):
+    to_dict = serializer("x", Field("y", "why", convert=str), Field("tags", omit_empty=True))
+
+    def __init__(self, x=None, y=None, tags=None) -> None:
+        self.x, self.y, self.tags = x, y, tags
+
+class Shape(object):
+    to_dict = serializer(nested("origin"), nested_list("points"))
+
+    def __init__(self, origin=None, points=()) -> None:
+        self.origin, self.points = origin, list(points)
+
+def test_generated_method_leaves_out_unset_fields():
+    assert Point().to_dict() == {}
+    assert Point(x=0, y=2, tags=[]).to_dict() == {"x": 0, "why": "2"}
+    assert Point(tags=["a"]).to_dict() == {"tags": ["a"]}
+
+def test_nested_objects_are_serialized_too():
+    shape = Shape(Point(1, 2), [Point(3), Point(4)])
+    assert shape.to_dict() == {"origin": {"x": 1, "why": "2"}, "points": [{"x": 3}, {"x": 4}]}
+    assert Shape().to_dict() == {}
+
+def test_invalid_attribute_names_are_rejected():
+    with pytest.raises(ValueError):
+        serializer("not valid")
+
+def test_unset_fields_are_left_out():
+    assert Embed(title="Alert").to_dict() == {"title": "Alert", "type": "rich"}
+
+def test_webhook_payload_has_no_nulls():
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    webhook.set_content("hello")
+    payload = webhook.to_dict()
+    assert payload["content"] == "hello"
+    assert None not in payload.values()
+
+def test_attachment_without_description_omits_the_key():
+    file = File(io.BytesIO(b"data"), "report.txt")
+    assert file.to_attachment(0) == {"id": 0, "filename": "report.txt"}
+
+def test_attachment_with_description_keeps_it():
+    file = File(io.BytesIO(b"data"), "report.txt", description="Daily report")
+    assert file.to_attachment(1) == {"id": 1, "filename": "report.txt", "description": "Daily report"}
+
+def test_allowed_mentions_keeps_empty_lists():
+    mentions = AllowedMentions(parse=[], users=[1])
+    assert mentions.to_dict()["parse"] == []
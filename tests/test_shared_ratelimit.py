@@ -0,0 +1,67 @@
+import itertools
+import multiprocessing
+import time
+
+import pytest
+
+from dishookr import SharedRateLimiter, RetryPolicy, Webhook
+from dishookr.ratelimit import route_key
+
+HEADERS = {"X-RateLimit-Bucket": "abc", "X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "5.0"}
+
+_ids = itertools.count(1)
+
+def route() -> str:
+    return route_key("POST", f"https://discord.com/api/webhooks/{next(_ids)}/token")
+
+@pytest.fixture
+def table(tmp_path) -> str:
+    return str(tmp_path / "ratelimits")
+
+def _exhaust(path: str, route: str) -> None:
+    SharedRateLimiter(path).update(route, 200, HEADERS)
+
+def test_instances_on_one_file_share_buckets(table):
+    first, second = SharedRateLimiter(table), SharedRateLimiter(table)
+    key = route()
+    first.update(key, 200, HEADERS)
+    assert second.delay(key) == pytest.approx(5.0, abs=0.1)
+    first.close()
+    second.close()
+
+def test_other_processes_see_the_buckets(table):
+    key = route()
+    process = multiprocessing.get_context("fork").Process(target=_exhaust, args=(table, key))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    limiter = SharedRateLimiter(table)
+    assert limiter.delay(key) > 4.0
+    limiter.close()
+
+def test_global_limit_is_shared(table):
+    first, second = SharedRateLimiter(table), SharedRateLimiter(table)
+    first.update(route(), 429, {"X-RateLimit-Global": "true"}, {"retry_after": 2.0, "global": True})
+    assert second.delay(route()) == pytest.approx(2.0, abs=0.1)
+    first.close()
+    second.close()
+
+def test_full_table_reuses_slots(table):
+    limiter = SharedRateLimiter(table, slots=4)
+    routes = [route() for _ in range(10)]
+    for key in routes:
+        limiter.update(key, 200, HEADERS)
+    assert limiter.delay(routes[-1]) > 4.0
+    limiter.close()
+
+def test_webhooks_with_their_own_limiter_on_one_file_wait_for_each_other(table, stub):
+    url = stub.url()
+    webhooks = [Webhook(url, rate_limiter=SharedRateLimiter(table), retry_policy=RetryPolicy(max_attempts=1, budget=None)) for _ in range(2)]
+    for webhook in webhooks:
+        webhook.set_content("hello")
+    stub.queue(204, headers={**HEADERS, "X-RateLimit-Reset-After": "0.2"})
+    webhooks[0].send()
+    started = time.monotonic()
+    webhooks[1].send()
+    assert time.monotonic() - started >= 0.15
+    assert len(stub.requests) == 2
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import time
+
+import pytest
+from nacl.signing import SigningKey
+
+from dishookr import InteractionApp
+from dishookr.signature import SignatureVerifier, get_verify_key
+
+SIGNING_KEY = SigningKey(b"\x01" * 32)
+PUBLIC_KEY = SIGNING_KEY.verify_key.encode().hex()
+PING = json.dumps({"type": 1, "id": "1", "application_id": "1", "token": "tok"}).encode()
+
+def sign(body: bytes, signed_at: float = None) -> tuple:
+    timestamp = str(int(time.time() if signed_at is None else signed_at))
+    return SIGNING_KEY.sign(timestamp.encode() + body).signature.hex(), timestamp
+
+def test_valid_signature_is_accepted_once():
+    verifier = SignatureVerifier(PUBLIC_KEY)
+    signature, timestamp = sign(PING)
+    assert verifier.verify(PING, signature, timestamp)
+    assert not verifier.verify(PING, signature, timestamp)  # replayed
+
+def test_tampered_and_malformed_requests_are_rejected():
+    verifier = SignatureVerifier(PUBLIC_KEY)
+    signature, timestamp = sign(PING)
+    assert not verifier.verify(PING + b" ", signature, timestamp)
+    assert not verifier.verify(PING, signature, str(int(timestamp) + 1))
+    assert not verifier.verify(PING, "zz" * 64, timestamp)
+    assert not verifier.verify(PING, signature[:64], timestamp)
+    assert not verifier.verify(PING, None, timestamp)
+    assert not verifier.verify(PING, signature, "yesterday")
+
+def test_stale_timestamps_are_rejected():
+    verifier = SignatureVerifier(PUBLIC_KEY, window=60)
+    assert not verifier.verify(PING, *sign(PING, time.time() - 120))
+    assert not verifier.verify(PING, *sign(PING, time.time() + 120))
+    assert verifier.verify(PING, *sign(PING, time.time() - 30))
+
+def test_replay_cache_is_bounded():
+    verifier = SignatureVerifier(PUBLIC_KEY, replay_cache_size=2)
+    signatures = [sign(PING, time.time() - n) for n in range(3)]
+    for signature, timestamp in signatures:
+        assert verifier.verify(PING, signature, timestamp)
+    assert len(verifier._seen) == 2
+    assert verifier.verify(PING, *signatures[0])  # evicted, the timestamp window still applies
+
+def test_verify_keys_are_cached_and_checked():
+    assert get_verify_key(PUBLIC_KEY) is get_verify_key(PUBLIC_KEY)
+    with pytest.raises(ValueError):
+        SignatureVerifier("not hex")
+
+def test_app_answers_unsigned_requests_with_401():
+    app = InteractionApp(public_key=PUBLIC_KEY)
+    assert app.handle(PING, {})[0] == 401
+    signature, timestamp = sign(PING)
+    headers = {"x-signature-ed25519": signature, "x-signature-timestamp": timestamp}
+    status, answer = app.handle(PING, headers)
+    assert (status, json.loads(answer)) == (200, {"type": 1})
+    assert app.handle(PING, headers)[0] == 401  # replayed
+
+def test_asgi_requests_are_verified_too():
+    app = InteractionApp(public_key=PUBLIC_KEY)
+    assert asyncio.run(app.handle_async(PING, {}))[0] == 401
+    signature, timestamp = sign(PING)
+    headers = {"x-signature-ed25519": signature, "x-signature-timestamp": timestamp}
+    assert asyncio.run(app.handle_async(PING, headers))[0] == 200
@@ -0,0 +1,24 @@
+import inspect
+
+import pytest
+
+from dishookr.objects import allowed_mentions, component, embed, emoji, interaction, interaction_callback, interaction_response, poll, user
+
+MODULES = (allowed_mentions, component, embed, emoji, interaction, interaction_callback, interaction_response, poll, user)
+MESSAGE_OBJECTS = sorted({cls for module in MODULES for _, cls in inspect.getmembers(module, inspect.isclass)
+                          if cls.__module__ == module.__name__ and hasattr(cls, "to_dict")}, key=lambda cls: cls.__name__)
+
+@pytest.mark.parametrize("cls", MESSAGE_OBJECTS, ids=lambda cls: cls.__name__)
+def test_message_objects_have_no_instance_dict(cls):
+    assert all("__slots__" in vars(klass) for klass in cls.__mro__[:-1])
+
+def test_misspelled_attributes_raise():
+    footer = embed.EmbedFooter("text")
+    with pytest.raises(AttributeError):
+        footer.txt = "typo"
+
+def test_objects_serialize_through_to_dict():
+    item = embed.Embed(title="Title", footer=embed.EmbedFooter("Footer"))
+    item.add_field("Name", "Value", inline=True)
+    assert item.to_dict() == {"title": "Title", "type": "rich", "footer": {"text": "Footer"},
+                              "fields": [{"name": "Name", "value": "Value", "inline": True}]}
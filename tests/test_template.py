@@ -0,0 +1,128 @@
+import json
+
+import pytest
+
+from dishookr import Webhook, Embed, EmbedFooter, File, MessageTemplate, ValidationError
+from dishookr.validation import validate_payload
+
+def alert_template() -> MessageTemplate:
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    embed = Embed(title="Alert: {service}", description="{details}", footer=EmbedFooter("Reported by {reporter}"))
+    embed.add_field("Region", "{region}", inline=True)
+    webhook.add_embed(embed)
+    return MessageTemplate(webhook)
+
+def test_placeholders_are_found():
+    assert alert_template().placeholders == {"service", "details", "region", "reporter"}
+
+def test_render_escapes_values():
+    payload = json.loads(alert_template().render(service='a "quoted" api', details="line\nbreak", region=3, reporter="é"))
+    embed = payload["embeds"][0]
+    assert (embed["title"], embed["description"], embed["fields"][0]["value"]) == ('Alert: a "quoted" api', "line\nbreak", "3")
+    assert embed["footer"]["text"] == "Reported by é"
+    assert validate_payload(payload) == {}
+
+def test_missing_placeholder():
+    with pytest.raises(KeyError):
+        alert_template().render(service="api")
+
+def test_rendered_strings_keep_their_limit():
+    template = alert_template()
+    template.render(service="s" * 249, details="x", region="eu", reporter="me")
+    with pytest.raises(ValueError, match="title"):
+        template.render(service="s" * 250, details="x", region="eu", reporter="me")
+
+def test_single_embeds_and_dicts():
+    assert json.loads(MessageTemplate(Embed(title="{n}")).render(n=1)) == {"embeds": [{"title": "1", "type": "rich"}]}
+    assert MessageTemplate({"content": "{greeting} world"}).render(greeting="hello") == b'{"content":"hello world"}'
+
+def test_files_cant_be_templated():
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    webhook.add_file(File(__file__))
+    with pytest.raises(ValueError):
+        MessageTemplate(webhook)
+
+def test_send_posts_the_rendered_message(stub):
+    webhook = Webhook(stub.url())
+    MessageTemplate({"content": "{service} is down"}).send(webhook, service="api")
+    assert stub.requests[-1].payload == {"content": "api is down"}
+
+POLL = {
+    "poll": {
+        "question": {"text": "Restart {service}?"},
+        "answers": [{"poll_media": {"text": "Yes, restart {service}"}}, {"poll_media": {"text": "No"}}],
+        "duration": 1,
+        "allow_multiselect": False,
+    }
+}
+
+def test_footer_text_keeps_its_own_limit():
+    template = alert_template()
+    payload = json.loads(template.render(service="api", details="x", region="eu", reporter="r" * 2000))
+    assert validate_payload(payload) == {}
+    with pytest.raises(ValueError, match="footer.text"):
+        template.render(service="api", details="x", region="eu", reporter="r" * 2048)
+
+def test_poll_texts_are_limited_by_path():
+    template = MessageTemplate(POLL)
+    payload = json.loads(template.render(service="s" * 42))
+    assert validate_payload(payload) == {}
+    with pytest.raises(ValueError, match="poll.answers.0.poll_media.text"):
+        template.render(service="s" * 43)
+    assert "poll" in validate_payload({"poll": {"question": {"text": "q"}, "answers": [{"poll_media": {"text": "a" * 56}}]}})
+
+def test_poll_question_limit():
+    template = MessageTemplate({"poll": {"question": {"text": "{question}"}, "answers": [{"poll_media": {"text": "Yes"}}], "duration": 1}})
+    template.render(question="q" * 300)
+    with pytest.raises(ValueError, match="poll.question.text"):
+        template.render(question="q" * 301)
+
+def test_embed_total_is_checked_when_rendered():
+    embeds = [{"description": "{body}"}, {"description": "{body}"}]
+    template = MessageTemplate({"embeds": embeds})
+    assert validate_payload(json.loads(template.render(body="b" * 3000))) == {}
+    with pytest.raises(ValueError, match="6000"):
+        template.render(body="b" * 3001)
+    assert "embeds" in validate_payload({"embeds": [{"description": "b" * 3001}] * 2})
+
+def test_embed_total_counts_static_text():
+    template = MessageTemplate({"embeds": [{"title": "t" * 200, "description": "d" * 4000}, {"description": "{body}"}]})
+    template.render(body="b" * 1800)
+    with pytest.raises(ValueError, match="6000"):
+        template.render(body="b" * 1801)
+
+def test_more_than_ten_embeds_are_rejected():
+    with pytest.raises(ValueError, match="10 embeds"):
+        MessageTemplate({"embeds": [{"title": "{n}"}] * 11})
+
+def test_static_text_is_validated_when_built():
+    with pytest.raises(ValueError, match="content"):
+        MessageTemplate({"content": "x" * 5000})
+    webhook = Webhook("https://discord.com/api/webhooks/1/token")
+    webhook.content = "x" * 5000  # set around the webhook's own checks
+    with pytest.raises(ValueError, match="content"):
+        MessageTemplate(webhook)
+    with pytest.raises(ValueError, match="title"):
+        MessageTemplate({"content": "{n}", "embeds": [{"title": "t" * 257}]})
+
+def test_static_text_of_strings_with_placeholders_is_validated():
+    with pytest.raises(ValueError, match="description"):
+        MessageTemplate({"embeds": [{"description": "d" * 4097 + "{body}"}]})
+    MessageTemplate({"embeds": [{"fields": [{"name": "{name}", "value": "{value}"}]}]})
+
+def test_empty_field_names_and_values_are_rejected_when_rendered():
+    template = MessageTemplate({"embeds": [{"fields": [{"name": "{name}", "value": "{value}"}]}]})
+    template.render(name="Region", value="eu")
+    with pytest.raises(ValueError, match="fields.0.name"):
+        template.render(name="", value="eu")
+    with pytest.raises(ValueError, match="fields.0.value"):
+        template.render(name="Region", value="")
+    assert MessageTemplate({"content": "{text}"}).render(text="") == b'{"content":""}'
+
+@pytest.mark.parametrize("mode", ["lazy", "off"])
+def test_webhooks_that_skip_eager_checks_are_validated_too(mode):
+    webhook = Webhook("https://discord.com/api/webhooks/1/token", validation=mode)
+    webhook.set_content("x" * 5000)
+    webhook.add_embed(Embed(title="{service}"))
+    with pytest.raises(ValidationError, match="content"):
+        MessageTemplate(webhook)
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+import requests
+
+from dishookr import Webhook, AsyncWebhook, RateLimiter
+from dishookr.testing import FakeDiscord
+
+URL = "https://discord.com/api/webhooks/1/token"
+
+class Clock(object):
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_wait_returns_the_created_message(fake):
+    result = fake.handle("POST", f"{URL}?wait=true", json={"content": "hello", "username": "bot"})
+    message = result.json()
+    assert result.status_code == 200
+    assert (message["content"], message["author"]["username"], message["webhook_id"]) == ("hello", "bot", "1")
+    assert fake.messages[int(message["id"])] == message
+    assert fake.handle("POST", URL, json={"content": "hello"}).status_code == 204
+
+def test_thread_id_sets_the_channel(fake):
+    message = fake.handle("POST", f"{URL}?wait=true&thread_id=55", json={"content": "hi"}).json()
+    assert message["channel_id"] == "55"
+
+def test_invalid_payloads_are_rejected_like_discord(fake):
+    result = fake.handle("POST", URL, json={"content": "x" * 2001})
+    assert result.status_code == 400
+    assert result.json()["code"] == 50035
+    assert "content" in result.json()["errors"]
+    assert fake.handle("POST", URL, json={}).json()["code"] == 50006
+
+def test_tokens_and_deleted_webhooks(fake):
+    fake.handle("POST", URL, json={"content": "hi"})
+    assert fake.handle("POST", "https://discord.com/api/webhooks/1/other", json={"content": "hi"}).status_code == 401
+    fake.delete_webhook(1)
+    assert fake.handle("POST", URL, json={"content": "hi"}).json()["code"] == 10015
+
+def test_messages_can_be_edited_fetched_and_deleted(fake):
+    message_id = fake.handle("POST", f"{URL}?wait=true", json={"content": "hi"}).json()["id"]
+    edited = fake.handle("PATCH", f"{URL}/messages/{message_id}", json={"content": "edited"}).json()
+    assert edited["content"] == "edited" and edited["edited_timestamp"]
+    assert fake.handle("GET", f"{URL}/messages/{message_id}").json()["content"] == "edited"
+    assert fake.handle("DELETE", f"{URL}/messages/{message_id}").status_code == 204
+    assert fake.handle("GET", f"{URL}/messages/{message_id}").json()["code"] == 10008
+
+def test_bucket_limit_answers_429_with_headers():
+    clock = Clock()
+    fake = FakeDiscord(bucket_limit=2, bucket_window=1.0, clock=clock)
+    statuses = [fake.handle("POST", URL, json={"content": "hi"}).status_code for _ in range(3)]
+    assert statuses == [204, 204, 429]
+    limited = fake.handle("POST", URL, json={"content": "hi"})
+    assert limited.headers["X-RateLimit-Remaining"] == "0"
+    assert limited.json()["retry_after"] == 1.0 and not limited.json()["global"]
+    clock.now = 1.0
+    assert fake.handle("POST", URL, json={"content": "hi"}).status_code == 204
+
+def test_global_limit():
+    fake = FakeDiscord(bucket_limit=100, global_limit=2, clock=Clock())
+    for i in range(2):
+        fake.handle("POST", f"https://discord.com/api/webhooks/{i + 1}/token", json={"content": "hi"})
+    limited = fake.handle("POST", "https://discord.com/api/webhooks/3/token", json={"content": "hi"})
+    assert (limited.status_code, limited.headers["X-RateLimit-Scope"]) == (429, "global")
+
+def test_injected_failures(fake):
+    fake.fail(503, times=2)
+    fake.fail(error=requests.ConnectionError("reset"))
+    assert [fake.handle("POST", URL, json={"content": "hi"}).status_code for _ in range(2)] == [503, 503]
+    with pytest.raises(requests.ConnectionError):
+        fake.handle("POST", URL, json={"content": "hi"})
+    assert fake.handle("POST", URL, json={"content": "hi"}).status_code == 204
+    assert fake.status_counts == {503: 2, 204: 1}
+
+def test_unknown_routes(fake):
+    assert fake.handle("POST", "https://discord.com/api/channels/1/messages", json={}).status_code == 404
+    assert fake.handle("GET", URL).status_code == 405
+
+def test_served_over_http(served, fake):
+    result = requests.post(f"{served}/api/webhooks/9/token?wait=true", json={"content": "over http"}, timeout=5)
+    assert result.status_code == 200
+    assert result.headers["X-RateLimit-Limit"] == str(fake.bucket_limit)
+    assert fake.messages[int(result.json()["id"])]["content"] == "over http"
+
+def test_webhooks_send_through_the_fake(fake):
+    webhook = Webhook(URL, wait=True, session_pool=fake, rate_limiter=RateLimiter())
+    webhook.set_content("through the fake")
+    message_id = int(webhook.send().json()["id"])
+    assert fake.messages[message_id]["content"] == "through the fake"
+    assert [(request.method, request.status) for request in fake.requests] == [("POST", 200)]
+
+def test_async_webhooks_send_through_the_async_fake(async_fake):
+    webhook = AsyncWebhook(URL, wait=True, session_pool=async_fake, rate_limiter=RateLimiter())
+    webhook.set_content("awaited")
+    message_id = int(asyncio.run(webhook.send()).json()["id"])
+    assert async_fake.messages[message_id]["content"] == "awaited"
+
+def test_reset_times_are_rounded_up():
+    clock = Clock()
+    fake = FakeDiscord(bucket_limit=1, bucket_window=1.0, clock=clock)
+    fake.handle("POST", URL, json={"content": "hi"})
+    clock.now = 0.0006
+    limited = fake.handle("POST", URL, json={"content": "hi"})
+    assert limited.json()["retry_after"] == 1.0  # 0.9994 to go, never announced as less
+    assert float(limited.headers["X-RateLimit-Reset-After"]) == 1.0
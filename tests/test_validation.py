@@ -0,0 +1,68 @@
+import pytest
+
+from dishookr import Webhook, Embed, RateLimiter, RetryPolicy, HTTPException, ValidationError, ValidationMode, set_default_validation_mode
+from dishookr.validation import get_default_validation_mode, validate_payload
+
+URL = "https://discord.com/api/webhooks/1/token"
+
+@pytest.fixture
+def make_webhook(fake):
+    def make(**kwargs) -> Webhook:
+        return Webhook(URL, session_pool=fake, rate_limiter=RateLimiter(), retry_policy=RetryPolicy(max_attempts=1, budget=None), **kwargs)
+    return make
+
+@pytest.fixture
+def default_mode():
+    previous = get_default_validation_mode()
+    yield set_default_validation_mode
+    set_default_validation_mode(previous)
+
+def test_eager_raises_on_the_first_violation(make_webhook):
+    with pytest.raises(ValueError, match="Title"):
+        Embed(title="t" * 257)
+    webhook = make_webhook()
+    with pytest.raises(ValueError):
+        webhook.set_content("c" * 2001)
+
+def test_lazy_reports_every_violation_at_send(make_webhook, fake, default_mode):
+    default_mode("lazy")
+    webhook = make_webhook(validation="lazy")
+    webhook.set_content("c" * 2001)
+    webhook.add_embed(Embed(title="t" * 257, description="ok"))
+    with pytest.raises(ValidationError) as raised:
+        webhook.send()
+    assert sorted(raised.value.messages) == ["content: Must be between 0 and 2000 in length.",
+                                             "embeds.0.title: Must be between 0 and 256 in length."]
+    assert raised.value.errors["embeds"]["0"]["title"]["_errors"][0]["code"] == "BASE_TYPE_BAD_LENGTH"
+    assert fake.requests == []
+
+def test_webhook_mode_overrides_the_default(make_webhook, fake):
+    webhook = make_webhook(validation=ValidationMode.LAZY)
+    webhook.set_content("c" * 2001)  # not checked while building
+    with pytest.raises(ValidationError):
+        webhook.send()
+
+def test_off_leaves_it_to_discord(make_webhook, fake):
+    webhook = make_webhook(validation="off")
+    webhook.set_content("c" * 2001)
+    with pytest.raises(HTTPException) as raised:
+        webhook.send()
+    assert raised.value.status == 400
+
+def test_validate_checks_in_any_mode(make_webhook, default_mode):
+    default_mode("off")
+    webhook = make_webhook()
+    webhook.add_embed(Embed(title="t" * 300))
+    with pytest.raises(ValidationError):
+        webhook.validate()
+
+def test_validate_payload_checks_embed_totals_and_polls():
+    errors = validate_payload({"embeds": [{"description": "d" * 4000}, {"description": "d" * 4000}],
+                               "poll": {"question": {"text": "q"}, "answers": [], "duration": 500}})
+    assert errors["embeds"]["_errors"][0]["code"] == "MAX_EMBED_SIZE_EXCEEDED"
+    assert set(errors["poll"]) == {"answers", "duration"}
+    assert validate_payload({"content": "fine"}) == {}
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        set_default_validation_mode("sometimes")